@@ -0,0 +1,66 @@
+"""
+Benchmark of the Planer critical-path computation on synthetic projects.
+
+Usage:
+    python benchmarks/cpm_benchmark.py [--sizes 1000 10000 100000] [--seed 0]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from modules.lst_scheduling.lst import Aktivnost, Planer  # noqa: E402
+
+
+def generate_project(n: int, chain: bool, rng: random.Random) -> Planer:
+    """
+    Build a Planer with n activities without recomputing ES/LS after every insertion.
+
+    With chain=True every activity depends on the previous one (plus a random earlier one),
+    otherwise each activity depends on up to three random earlier activities.
+    """
+    planer = Planer()
+    for i in range(n):
+        if i == 0:
+            odvisnosti = ["start"]
+        elif chain:
+            odvisnosti = list({f"a{i - 1}", f"a{rng.randrange(i)}"})
+        else:
+            odvisnosti = list({f"a{rng.randrange(i)}" for _ in range(rng.randint(1, 3))})
+
+        planer.dodaj_aktivnost(Aktivnost(f"a{i}", rng.randint(1, 20), odvisnosti, {}), izracunaj=False)
+
+    planer.posodobi_odvisnosti_finish()
+    return planer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'activities':>10} {'shape':>8} {'ES+LS [s]':>10} {'CPM [s]':>10} {'add one [s]':>12} {'critical':>9}")
+    for n in args.sizes:
+        for chain in (False, True):
+            planer = generate_project(n, chain, random.Random(args.seed))
+
+            t0 = time.perf_counter()
+            planer.izracunaj_es()
+            planer.izracunaj_ls()
+            t1 = time.perf_counter()
+            kriticna_pot = planer.izracunaj_kriticno_pot()
+            t2 = time.perf_counter()
+            planer.dodaj_aktivnost(Aktivnost("new", 1, [f"a{n // 2}"], {}))
+            t3 = time.perf_counter()
+
+            shape = "chain" if chain else "random"
+            print(f"{n:>10} {shape:>8} {t1 - t0:>10.3f} {t2 - t1:>10.3f} {t3 - t2:>12.4f} {len(kriticna_pot.path):>9}")
+
+
+if __name__ == "__main__":
+    main()
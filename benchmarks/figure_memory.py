@@ -0,0 +1,138 @@
+"""
+Memory check of the shared figure pool.
+
+Modules get their figures from common.figures and return them when they are destroyed, so
+switching between modules must not grow memory. This script repeats the figure life cycle of
+a module (create, attach a canvas, draw, release) many times, then counts the figures and
+canvases still alive and compares the traced memory after a warm-up with the memory at the end.
+With --app it instead switches between all modules of a real App, which needs a display.
+
+The script exits with status 1 if more figures are alive than the pool keeps, if any figure is
+left registered in pyplot or if memory grows by more than --limit KiB. Matplotlib's text metrics
+cache holds up to 4096 entries per process (several MiB), so it is emptied before both
+measurements. The remaining growth comes from interpreter tables that grow in occasional
+steps of a few MiB, while a leaked figure with its canvas costs hundreds of KiB per switch.
+
+Usage:
+    python benchmarks/figure_memory.py [--switches 1000] [--limit 4096] [--app]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from typing import Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import matplotlib  # noqa: E402
+
+WARMUP = 20
+
+
+def figure_cycle() -> Callable[[int], None]:
+    """Return one headless module switch: a figure drawn on an Agg canvas and released."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    from common.figures import create_figure, release_figure
+
+    def switch(i: int) -> None:
+        fig, ax = create_figure(figsize=(8, 6) if i % 2 else None)
+        canvas = FigureCanvasAgg(fig)
+        ax.plot(range(100), [x * (i % 7) for x in range(100)])
+        ax.set_title(f"Switch {i}")
+        fig.tight_layout()
+        canvas.draw()
+        release_figure(fig)
+
+    return switch
+
+
+def app_cycle() -> Callable[[int], None]:
+    """Return one module switch in a real App, cycling through all registered modules."""
+    from common.app import App
+    from modules.main_menu import MODULES
+
+    app = App(prefetch_modules=False)
+
+    def switch(i: int) -> None:
+        app.show_module(MODULES[i % len(MODULES)])
+        app.update()
+
+    return switch
+
+
+def clear_caches() -> None:
+    """Empty matplotlib's bounded text metrics cache and collect garbage."""
+    import matplotlib.text
+
+    cache = getattr(matplotlib.text, "_get_text_metrics_with_cache_impl", None)
+    if cache is not None:
+        cache.cache_clear()
+    gc.collect()
+
+
+def measure(switch: Callable[[int], None], switches: int) -> int:
+    """Run the switches and return the growth of traced memory after the warm-up in bytes."""
+    for i in range(WARMUP):
+        switch(i)
+    clear_caches()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(WARMUP, WARMUP + switches):
+        switch(i)
+    clear_caches()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before
+
+
+def count_alive(cls: type) -> int:
+    """Return the number of live objects of a class, including subclasses."""
+    gc.collect()
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, cls))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--switches", type=int, default=1000, help="number of module switches")
+    parser.add_argument("--limit", type=int, default=4096, help="allowed memory growth in KiB")
+    parser.add_argument("--app", action="store_true", help="switch modules in a real App (needs a display)")
+    args = parser.parse_args()
+
+    if not args.app:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from matplotlib.backend_bases import FigureCanvasBase
+    from matplotlib.figure import Figure
+
+    from common.figures import POOL_SIZE
+
+    switch = app_cycle() if args.app else figure_cycle()
+    growth = measure(switch, args.switches)
+    figures = count_alive(Figure)
+    canvases = count_alive(FigureCanvasBase)
+    open_figures = len(plt.get_fignums())
+
+    print(f"switches:        {args.switches}")
+    print(f"memory growth:   {growth / 1024:.1f} KiB")
+    print(f"live figures:    {figures}")
+    print(f"live canvases:   {canvases}")
+    print(f"pyplot figures:  {open_figures}")
+
+    allowed = POOL_SIZE
+    if args.app:
+        from common.app import MODULE_CACHE_SIZE
+
+        # moduli v predpomnilniku aplikacije še držijo svoje figure (LST največ dve)
+        allowed += 2 * MODULE_CACHE_SIZE
+    if figures > allowed or canvases > allowed or open_figures or growth > args.limit * 1024:
+        print("FAIL: figures are leaking", file=sys.stderr)
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Stress benchmark of the LST scheduling module on synthetic projects.
+
+For every project shape and size it times:
+    incremental  building the project with Planer.dodaj_aktivnost, as the GUI does
+    bulk         building the project with Planer.dodaj_aktivnost(izracunaj=False), without ES/LS updates
+    es_ls        Planer.izracunaj_es and Planer.izracunaj_ls
+    cpm          Planer.izracunaj_kriticno_pot
+    schedule     scheduling all activities with LSTScheduler.run, which updates ES/LS lazily
+    step         scheduling all activities with LSTScheduler(eager_updates=True), as the GUI's "Next step" does
+
+The suite only measures; the algorithms it times are tested under tests/.
+
+The eager phases (incremental and step) are skipped above --max-eager activities, since every
+insertion or delay may move the ES/LS of a large part of the project. Results are printed as
+a table and can be saved as JSON or CSV for comparison between runs.
+
+Usage:
+    python benchmarks/lst_benchmark.py [--sizes 10 100 1000 10000 100000] [--shapes layered chain fan-in]
+                                       [--seed 0] [--max-eager 10000] [-o results.json]
+"""
+
+import argparse
+import csv
+import datetime
+import json
+import platform
+import random
+import time
+from typing import Dict, List, Optional
+
+from projects import SHAPES, build_bulk, build_incremental
+
+from modules.lst_scheduling.scheduler import LSTScheduler
+
+FIELDS = (
+    "shape",
+    "activities",
+    "dependencies",
+    "incremental",
+    "bulk",
+    "es_ls",
+    "cpm",
+    "schedule",
+    "step",
+    "duration",
+    "scheduled_duration",
+    "delayed",
+)
+
+
+def run_case(shape: str, n: int, seed: int, max_eager: int) -> Dict[str, Optional[float]]:
+    """Time all phases for one project and return a result row."""
+    specs = SHAPES[shape](n, random.Random(seed))
+    result: Dict[str, Optional[float]] = {
+        "shape": shape,
+        "activities": n,
+        "dependencies": sum(len(odvisnosti) for _, _, odvisnosti, _ in specs),
+        "incremental": None,
+        "step": None,
+    }
+
+    if n <= max_eager:
+        t0 = time.perf_counter()
+        planer = build_incremental(specs)
+        t1 = time.perf_counter()
+        LSTScheduler(planer, eager_updates=True).run()
+        t2 = time.perf_counter()
+        result.update(incremental=t1 - t0, step=t2 - t1)
+
+    t0 = time.perf_counter()
+    planer = build_bulk(specs)
+    t1 = time.perf_counter()
+    planer.izracunaj_es()
+    planer.izracunaj_ls()
+    t2 = time.perf_counter()
+    kriticna_pot = planer.izracunaj_kriticno_pot()
+    t3 = time.perf_counter()
+    koraki = LSTScheduler(planer).run()
+    t4 = time.perf_counter()
+
+    result.update(
+        bulk=t1 - t0,
+        es_ls=t2 - t1,
+        cpm=t3 - t2,
+        schedule=t4 - t3,
+        duration=kriticna_pot.duration,
+        scheduled_duration=max((korak.end_time for korak in koraki), default=0),
+        delayed=sum(korak.delayed for korak in koraki),
+    )
+    return result
+
+
+def write_results(path: str, results: List[Dict], args: argparse.Namespace) -> None:
+    """Save the results as CSV if path ends with .csv, otherwise as JSON with run metadata."""
+    if path.endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(results)
+        return
+
+    meta = {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "max_eager": args.max_eager,
+    }
+    with open(path, "w") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2)
+
+
+def format_time(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.3f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000, 100000])
+    parser.add_argument("--shapes", nargs="+", choices=sorted(SHAPES), default=list(SHAPES))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-eager", type=int, default=10000)
+    parser.add_argument("-o", "--output", help="save results to a .json or .csv file")
+    args = parser.parse_args()
+
+    print(
+        f"{'shape':>8} {'activities':>10} {'incr. [s]':>10} {'bulk [s]':>9} {'ES+LS [s]':>10} "
+        f"{'CPM [s]':>8} {'LST [s]':>8} {'steps [s]':>9} {'duration':>9} {'LST dur.':>9}"
+    )
+    results = []
+    for shape in args.shapes:
+        for n in args.sizes:
+            r = run_case(shape, n, args.seed, args.max_eager)
+            results.append(r)
+            print(
+                f"{shape:>8} {n:>10} {format_time(r['incremental']):>10} {format_time(r['bulk']):>9} "
+                f"{format_time(r['es_ls']):>10} {format_time(r['cpm']):>8} {format_time(r['schedule']):>8} "
+                f"{format_time(r['step']):>9} "
+                f"{r['duration']:>9} {r['scheduled_duration']:>9}"
+            )
+
+    if args.output:
+        write_results(args.output, results, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Synthetic projects for the LST scheduling benchmarks.
+
+Every generator returns activity specs (id, duration, dependencies, resources) in an order
+in which they can be added to a Planer, so the same project can be built several times.
+"""
+
+import os
+import random
+import sys
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from modules.lst_scheduling.lst import Aktivnost, Planer  # noqa: E402
+
+ActivitySpec = Tuple[str, int, List[str], Dict[str, int]]
+
+# ime -> kolicina, vsi resursi so obnovljivi
+RESOURCES = {"Delavec": 4, "Stroj": 2, "Zerjav": 1}
+
+
+def _resources(rng: random.Random) -> Dict[str, int]:
+    """Pick up to two resources and the amount of each one an activity needs."""
+    izbrani = rng.sample(sorted(RESOURCES), k=rng.choice((0, 1, 1, 2)))
+    return {ime: rng.randint(1, RESOURCES[ime]) for ime in izbrani}
+
+
+def layered(n: int, rng: random.Random) -> List[ActivitySpec]:
+    """About sqrt(n) layers of sqrt(n) activities, each depending on up to three activities of the previous layer."""
+    width = max(1, int(n**0.5))
+    specs: List[ActivitySpec] = []
+    for i in range(n):
+        layer_start = i - i % width
+        if layer_start == 0:
+            odvisnosti = []
+        else:
+            prejsnji = range(layer_start - width, layer_start)
+            odvisnosti = sorted({f"a{rng.choice(prejsnji)}" for _ in range(rng.randint(1, 3))})
+        specs.append((f"a{i}", rng.randint(1, 20), odvisnosti, _resources(rng)))
+    return specs
+
+
+def chain_heavy(n: int, rng: random.Random, chains: int = 4) -> List[ActivitySpec]:
+    """A few long chains with an occasional link to an earlier activity of another chain."""
+    specs: List[ActivitySpec] = []
+    for i in range(n):
+        odvisnosti = [f"a{i - chains}"] if i >= chains else []
+        if i >= chains and rng.random() < 0.1:
+            odvisnosti.append(f"a{rng.randrange(i - i % chains)}")
+        specs.append((f"a{i}", rng.randint(1, 20), sorted(set(odvisnosti)), _resources(rng)))
+    return specs
+
+
+def fan_in(n: int, rng: random.Random, width: int = 50) -> List[ActivitySpec]:
+    """Groups of width parallel activities that all feed one merge activity, with merges chained together."""
+    specs: List[ActivitySpec] = []
+    zadnji_merge = None
+    skupina: List[str] = []
+    for i in range(n):
+        if len(skupina) == width or i == n - 1:
+            specs.append((f"a{i}", rng.randint(1, 5), skupina, _resources(rng)))
+            zadnji_merge, skupina = f"a{i}", []
+        else:
+            odvisnosti = [zadnji_merge] if zadnji_merge else []
+            specs.append((f"a{i}", rng.randint(1, 20), odvisnosti, _resources(rng)))
+            skupina.append(f"a{i}")
+    return specs
+
+
+SHAPES: Dict[str, Callable[[int, random.Random], List[ActivitySpec]]] = {
+    "layered": layered,
+    "chain": chain_heavy,
+    "fan-in": fan_in,
+}
+
+
+def new_planer() -> Planer:
+    """Return an empty Planer with the benchmark resources."""
+    planer = Planer()
+    for ime, kolicina in RESOURCES.items():
+        planer.dodaj_resource(ime, kolicina)
+    return planer
+
+
+def build_incremental(specs: List[ActivitySpec]) -> Planer:
+    """Build a Planer the way the GUI does, updating ES/LS after every activity."""
+    planer = new_planer()
+    for id, trajanje, odvisnosti, resursi in specs:
+        planer.dodaj_aktivnost(Aktivnost(id, trajanje, list(odvisnosti), dict(resursi)))
+    return planer
+
+
+def build_bulk(specs: List[ActivitySpec]) -> Planer:
+    """Build a Planer without computing ES/LS; call izracunaj_es and izracunaj_ls afterwards."""
+    planer = new_planer()
+    for id, trajanje, odvisnosti, resursi in specs:
+        planer.dodaj_aktivnost(Aktivnost(id, trajanje, list(odvisnosti), dict(resursi)), izracunaj=False)
+    planer.posodobi_odvisnosti_finish()
+    return planer
@@ -1,5 +1,6 @@
 # -*- mode: python ; coding: utf-8 -*-
 import os
+import sys
 
 block_cipher = None
 
@@ -14,12 +15,17 @@ for path, dirs, files in os.walk(assets_dir):
 
 print("Bundling assets:", assets_files)
 
+# Modules are imported with importlib on first use, so PyInstaller cannot find them on its own
+sys.path.insert(0, "src")
+from modules.main_menu import MODULES
+from common.export import exporters
+
 a = Analysis(
     ["src/main.py"],
     pathex=[],
     binaries=[],
     datas=assets_files,
-    hiddenimports=[],
+    hiddenimports=[m.module_path for m in MODULES] + list(exporters().values()),
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
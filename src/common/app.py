@@ -2,12 +2,22 @@ import os
 import sys
 import tkinter as tk
 import tkinter.ttk as ttk
-from modules.main_menu import MODULES_BY_CATEGORY, MainMenu, category_names
+from collections import OrderedDict
+from modules.main_menu import MODULES, MODULES_BY_CATEGORY, MainMenu, category_names
 
+from common import profiling
 from common.module import Module
+from common.module_registry import ModuleSpec, prefetch
+from common.redraw import RedrawScheduler
+
+# Delay after showing the main menu before modules start being imported in the background
+PREFETCH_DELAY_MS = 500
 
 DEFAULT_WINDOW_SIZE = (1000, 600)
 
+# Number of module instances kept alive, including the one currently shown
+MODULE_CACHE_SIZE = 4
+
 
 class App(tk.Tk):
     """
@@ -18,6 +28,11 @@ class App(tk.Tk):
 
     Attributes:
         _current_module (Module | None): Currently displayed module
+        _module_cache (OrderedDict[type[Module], Module]): Live module instances, least recently
+            shown first; the current module is always the last one
+        _help_runs (dict[type[Module], tuple]): Parsed help text of every module whose help
+            has been shown, as (text, tag) runs
+        redraw (RedrawScheduler): Runs the redraws requested by modules at most once per frame
 
     The window uses the system's theme (light/dark) by default and provides options to
     switch between themes via the Options menu.
@@ -25,15 +40,28 @@ class App(tk.Tk):
 
     _current_module: "Module | None" = None
     _help_window: "tk.Toplevel | None" = None
+    _help_text: "tk.Text | None" = None
+    _help_module: "type[Module] | None" = None
 
-    def __init__(self) -> None:
+    def __init__(self, prefetch_modules: bool = True, module_cache_size: int = MODULE_CACHE_SIZE) -> None:
         """
         Initialize the main application window.
 
         Sets up the window title, size, position, theme, and creates the menubar.
         This method is called only once when the singleton instance is created.
+
+        Args:
+            prefetch_modules (bool): Import the modules in a background thread once the
+                main menu is shown, so that opening them later does not wait for imports
+            module_cache_size (int): How many module instances to keep alive, so that switching
+                back to them is instant and keeps their state; 1 or less destroys every module
+                that is switched away from
         """
         super().__init__()
+        self._module_cache: "OrderedDict[type[Module], Module]" = OrderedDict()
+        self._module_cache_size = module_cache_size
+        self._help_runs: "dict[type[Module], tuple[tuple[str, str], ...]]" = {}
+        self.redraw = RedrawScheduler(self)
         self.title("Visualizations")
 
         self.iconphoto(True, tk.PhotoImage(file=self.get_resource_path("assets/favicon.png")))
@@ -44,9 +72,13 @@ class App(tk.Tk):
 
         self._center_window(window_width, window_height)
 
-        self._create_menubar()
+        with profiling.span("create menubar", "widgets"):
+            self._create_menubar()
         self.show_module(MainMenu)
 
+        if prefetch_modules:
+            self.after(PREFETCH_DELAY_MS, lambda: prefetch(m for m in MODULES if not m.loaded))
+
     def _get_window_center(self, window_width: int, window_height: int) -> tuple[int, int]:
         screen_width = self.winfo_screenwidth()
         screen_height = self.winfo_screenheight()
@@ -88,7 +120,7 @@ class App(tk.Tk):
             # Create submenu for category
             category_menu = tk.Menu(modules_menu, tearoff=False)
             for module in items:
-                category_menu.add_command(label=module.__label__, command=lambda m=module: self.show_module(m))  # type: ignore
+                category_menu.add_command(label=module.label, command=lambda m=module: self.show_module(m))  # type: ignore
             modules_menu.add_cascade(label=category_names[key], menu=category_menu)
 
         menubar.add_cascade(label="Menu", menu=modules_menu)
@@ -101,32 +133,67 @@ class App(tk.Tk):
 
         self.config(menu=menubar)
 
-    def show_module(self, module_class: type["Module"]) -> None:
+    def show_module(self, module_class: "type[Module] | ModuleSpec") -> None:
         """
         Switch the currently displayed module.
 
-        Destroys the current module if it exists and creates an instance of the new module.
+        The current module is hidden and kept alive in the module cache, and the new module is
+        shown from the cache or created. When the cache is full, the least recently shown module
+        is destroyed. Selecting the current module again recreates it. A ModuleSpec is imported
+        first if it has not been imported yet. With profiling enabled, records the construction
+        of the module and the time until it is first painted.
 
         Args:
-            module_class (type[Module]): The class of the module to be displayed
+            module_class (type[Module] | ModuleSpec): The class of the module to be displayed,
+                or its registry entry
         """
-        if self._current_module:
-            self._current_module.destroy()
+        profiler = profiling.get()
+        start = profiler.now() if profiler else 0.0
+
+        if isinstance(module_class, ModuleSpec):
+            module_class = module_class.load()
+
+        if self._current_module is not None:
+            if type(self._current_module) is module_class:
+                # Selecting the shown module again starts it from scratch
+                del self._module_cache[module_class]
+                with profiling.span(f"destroy {module_class.__label__}", "widgets"):
+                    self._current_module.destroy()
+            else:
+                self._current_module.suspend()
 
-        module = module_class(self)
-        module.pack(fill="both", expand=True)
+        module = self._module_cache.pop(module_class, None)
+        if module is not None:
+            module.resume()
+        else:
+            with profiling.span(f"create {module_class.__label__}", "widgets"):
+                module = module_class(self)
+                module.pack(fill="both", expand=True)
 
         self._current_module = module
+        self._module_cache[module_class] = module
+        while len(self._module_cache) > max(self._module_cache_size, 1):
+            _, evicted = self._module_cache.popitem(last=False)
+            with profiling.span(f"destroy {evicted.__label__}", "widgets"):
+                evicted.destroy()
+
+        if profiler is not None:
+            # Idle callbacks run after Tk has handled the pending geometry and redraw work,
+            # so this approximates the moment the module is first shown
+            label = module_class.__label__
+            self.after_idle(lambda: profiler.record(f"first paint {label}", "paint", start))
 
     def show_help(self) -> None:
         """
         Display a help window with instructions for the current module.
 
-        Creates a new window containin=g formatted text from the current module's
-        __instructions__ attribute. The text supports basic markdown formatting.
+        Shows formatted text from the current module's __instructions__ attribute. The text
+        supports basic markdown formatting; it is parsed once per module class and the parsed
+        runs are cached, so reopening help only inserts them into the text widget.
 
-        The window includes a scrollbar that appears only when needed. If a help
-        window is already open, it will be destroyed and replaced with a new one.
+        The window includes a scrollbar that appears only when needed. It is created on first
+        use and afterwards reused: closing it only hides it, and showing help for another
+        module swaps its content.
 
         Returns early if there is no current module or if the current module has
         no instructions.
@@ -134,16 +201,40 @@ class App(tk.Tk):
         if not self._current_module:
             return
 
-        instructions = self._current_module.__instructions__
+        module_class = type(self._current_module)
+        instructions = module_class.__instructions__
 
         if not instructions:
             return
 
-        if self._help_window:
-            self._help_window.destroy()
-
+        runs = self._help_runs.get(module_class)
+        if runs is None:
+            runs = self._help_runs[module_class] = self._parse_markdown(instructions)
+
+        if self._help_window is None or not self._help_window.winfo_exists():
+            self._create_help_window()
+        assert self._help_window is not None and self._help_text is not None
+
+        self._help_window.title("Help for " + module_class.__label__)
+        if self._help_module is not module_class:
+            text_widget = self._help_text
+            text_widget.configure(state="normal")
+            text_widget.delete("1.0", "end")
+            # Tk takes any number of (text, tags) pairs, so the whole text is inserted in one call
+            text_widget.insert("end", *(item for run in runs for item in run))
+            text_widget.configure(state="disabled")  # Make it read-only
+            text_widget.yview_moveto(0)
+            self._help_module = module_class
+
+        self._help_window.deiconify()
+        self._help_window.lift()
+
+    def _create_help_window(self) -> None:
+        """Create the (hidden) help window with its text widget and markdown tags."""
         help_window = tk.Toplevel(self)
-        help_window.title("Help for " + self._current_module.__label__)
+        help_window.withdraw()
+        # Closing only hides the window, so the next show_help can reuse it
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
 
         w, h = 600, 600
         x, y = self._get_window_center(w, h)
@@ -170,65 +261,78 @@ class App(tk.Tk):
         text_widget.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        # Insert the text
-        self._apply_markdown_styling(text_widget, instructions, font)
-        text_widget.configure(state="disabled")  # Make it read-only
+        self._configure_markdown_tags(text_widget, font)
 
         self._help_window = help_window
+        self._help_text = text_widget
+        self._help_module = None
+
+    @staticmethod
+    def _configure_markdown_tags(text_widget: tk.Text, font: tuple[str, int]) -> None:
+        """Configure the text widget tags used by the runs from _parse_markdown.
+
+        Args:
+            text_widget: The tkinter Text widget to configure
+            font: The font to use for the text
+        """
+        text_widget.tag_configure("bold", font=(font[0], font[1], "bold"))
+        text_widget.tag_configure("italic", font=(font[0], font[1], "italic"))
+        text_widget.tag_configure("heading1", font=(font[0], font[1] + 3, "bold"))
+        text_widget.tag_configure("heading2", font=(font[0], font[1] + 1, "bold"))
+        text_widget.tag_configure("hline", relief="sunken", borderwidth=0.5, font=("", 1))
 
     @staticmethod
-    def _apply_markdown_styling(text_widget: tk.Text, content: str, font: tuple[str, int]) -> None:
-        """Apply markdown-like styling to text content.
+    def _parse_markdown(content: str) -> tuple[tuple[str, str], ...]:
+        """Parse markdown-like text into runs of (text, tag) for a tkinter Text widget.
 
-        Applies basic markdown formatting to text content in a tkinter Text widget:
+        Supports basic markdown formatting:
         - Headings (lines starting with # or ##)
         - Bold text (wrapped in **)
         - Italic text (wrapped in _)
         - Horizontal line (---)
 
+        Consecutive runs with the same tag are merged; untagged runs have an empty tag.
+
         Args:
-            text_widget: The tkinter Text widget to apply styling to
             content: The markdown-formatted text content
-            font: The font to use for the text
+
+        Returns:
+            tuple[tuple[str, str], ...]: The runs in the order they are inserted
         """
+        runs: list[tuple[str, str]] = []
 
-        # Configure tags for styling
-        text_widget.tag_configure("bold", font=(font[0], font[1], "bold"))
-        text_widget.tag_configure("italic", font=(font[0], font[1], "italic"))
-        text_widget.tag_configure("heading1", font=(font[0], font[1] + 3, "bold"))
-        text_widget.tag_configure("heading2", font=(font[0], font[1] + 1, "bold"))
-        text_widget.tag_configure("hline", relief="sunken", borderwidth=0.5, font=("", 1))
+        def add(text: str, tag: str = "") -> None:
+            if runs and runs[-1][1] == tag:
+                runs[-1] = (runs[-1][0] + text, tag)
+            elif text:
+                runs.append((text, tag))
 
         for line in content.split("\n"):
             # Handle headings
             if line.startswith("## "):
-                text_widget.insert("end", line[3:] + "\n", "heading2")
+                add(line[3:] + "\n", "heading2")
             elif line.startswith("# "):
-                text_widget.insert("end", line[2:] + "\n", "heading1")
+                add(line[2:] + "\n", "heading1")
             # Handle bold text
             elif "**" in line:
                 parts = line.split("**")
                 for i, part in enumerate(parts):
-                    if i % 2 == 1:  # Odd indices are bold
-                        text_widget.insert("end", part, "bold")
-                    else:
-                        text_widget.insert("end", part)
-                text_widget.insert("end", "\n")
+                    add(part, "bold" if i % 2 == 1 else "")  # Odd indices are bold
+                add("\n")
             # Handle italic text
             elif "_" in line:
                 parts = line.split("_")
                 for i, part in enumerate(parts):
-                    if i % 2 == 1:  # Odd indices are italic
-                        text_widget.insert("end", part, "italic")
-                    else:
-                        text_widget.insert("end", part)
-                text_widget.insert("end", "\n")
+                    add(part, "italic" if i % 2 == 1 else "")  # Odd indices are italic
+                add("\n")
             elif line.strip() == "---":
-                text_widget.insert("end", "\n")
-                text_widget.insert("end", "\n", "hline")
-                text_widget.insert("end", "\n")
+                add("\n")
+                add("\n", "hline")
+                add("\n")
             else:
-                text_widget.insert("end", line + "\n")
+                add(line + "\n")
+
+        return tuple(runs)
 
     @staticmethod
     def _update_scrollbar(scrollbar: ttk.Scrollbar, first: float, last: float) -> None:
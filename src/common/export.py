@@ -0,0 +1,117 @@
+"""
+Headless export of module visualizations to image files.
+
+Every module package with an export.py module can be rendered without Tk and without
+constructing App, e.g. for course material or regression images. The export module provides
+
+    add_arguments(parser)   options of "main.py export <name>", e.g. --k 5 --point 1,2 for knn
+    render(args, fig, ax)   draws the visualization on a figure from common.figures, raising
+                            ValueError for invalid options
+
+The figures are saved with matplotlib's Agg backend (or the vector backend of the output
+format), so no display is needed. export_many renders batches of images in a process pool.
+"""
+
+import argparse
+import importlib
+import shlex
+from concurrent.futures import ProcessPoolExecutor
+from types import ModuleType
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import matplotlib
+
+from common.figures import create_figure, release_figure
+
+# Exported figures never need a GUI backend; networkx drawing goes through pyplot
+matplotlib.use("Agg")
+
+DEFAULT_DPI = 100
+
+
+def exporters() -> Dict[str, str]:
+    """Return the export module of every module, keyed by the name of its package (e.g. "knn")."""
+    from modules.main_menu import MODULES
+
+    paths = {}
+    for spec in MODULES:
+        package = spec.module_path.rpartition(".")[0]
+        paths[package.rpartition(".")[2]] = package + ".export"
+    return paths
+
+
+def load_exporter(name: str) -> ModuleType:
+    """Import the export module of a module; raises KeyError for unknown names."""
+    return importlib.import_module(exporters()[name])
+
+
+def build_parser(name: str, prog: Optional[str] = None) -> argparse.ArgumentParser:
+    """Return the argument parser of a module's export, including the common output options."""
+    exporter = load_exporter(name)
+    parser = argparse.ArgumentParser(prog=prog or f"main.py export {name}", description=exporter.__doc__)
+    parser.add_argument(
+        "-o", "--output", required=True, help="image file; the format follows the extension (png, svg, pdf, ...)"
+    )
+    parser.add_argument("--dpi", type=float, default=DEFAULT_DPI, help="resolution of raster images")
+    exporter.add_arguments(parser)
+    return parser
+
+
+def export(name: str, argv: Sequence[str]) -> str:
+    """
+    Render a module's visualization with the given export options and save it.
+
+    Returns:
+        Path of the saved image
+
+    Raises:
+        KeyError: If there is no module with that name
+        SystemExit: If the options cannot be parsed (argparse prints the usage)
+        ValueError: If the options are invalid for the module
+    """
+    exporter = load_exporter(name)
+    args = build_parser(name).parse_args(argv)
+
+    fig, ax = create_figure()
+    try:
+        exporter.render(args, fig, ax)
+        fig.savefig(args.output, dpi=args.dpi, facecolor=fig.get_facecolor())
+    finally:
+        release_figure(fig)
+    return args.output
+
+
+def _export_job(job: Sequence[str]) -> Optional[str]:
+    """Run one job of export_many in a worker process; returns an error message or None."""
+    if not job:
+        return "empty job"
+    name, *argv = job
+    try:
+        export(name, argv)
+    except KeyError:
+        return f"unknown module {name}"
+    except SystemExit:
+        return "invalid options"
+    except Exception as e:
+        return str(e) or type(e).__name__
+    return None
+
+
+def export_many(
+    jobs: Iterable[Sequence[str]], workers: Optional[int] = None, chunksize: int = 8
+) -> Iterator[Tuple[Sequence[str], Optional[str]]]:
+    """
+    Render many images in parallel, one job being a module name followed by its export options.
+
+    Yields:
+        Every job in the given order with an error message, or None if the image was saved
+    """
+    jobs = [list(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from zip(jobs, pool.map(_export_job, jobs, chunksize=chunksize))
+
+
+def read_jobs(path: str) -> List[List[str]]:
+    """Read export jobs from a file with one job per line, e.g. "knn --k 5 --point 1,2 -o knn5.png"."""
+    with open(path, encoding="utf-8") as f:
+        return [shlex.split(line) for line in f if line.strip() and not line.lstrip().startswith("#")]
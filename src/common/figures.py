@@ -0,0 +1,62 @@
+from typing import List, Optional, Tuple
+
+import matplotlib
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import FigureCanvasBase
+from matplotlib.figure import Figure, SubplotParams
+
+# Number of released figures kept for reuse
+POOL_SIZE = 4
+
+
+class FigurePool:
+    """
+    Factory of matplotlib figures for the modules, bypassing pyplot.
+
+    Figures made with pyplot are registered in its global figure manager and stay alive until
+    they are closed explicitly, so every module switch could leak a figure. Figures from the
+    pool are plain Figure objects owned by the module that acquired them; releasing a figure
+    clears it and keeps it for the next module instead of building a new one.
+    """
+
+    def __init__(self, size: int = POOL_SIZE) -> None:
+        self.size = size
+        self._free: List[Figure] = []
+
+    def acquire(self, figsize: Optional[Tuple[float, float]] = None) -> Tuple[Figure, Axes]:
+        """Return a figure with a single axes, reusing a released figure if there is one."""
+        if not self._free:
+            fig = Figure(figsize=figsize)
+            return fig, fig.add_subplot()
+
+        fig = self._free.pop()
+        fig.set_size_inches(figsize or matplotlib.rcParams["figure.figsize"])
+        fig.set_facecolor(matplotlib.rcParams["figure.facecolor"])
+        fig.set_edgecolor(matplotlib.rcParams["figure.edgecolor"])
+        # tight_layout and subplots_adjust change the subplot parameters, which clear() keeps
+        fig.subplotpars = SubplotParams()
+        return fig, fig.add_subplot()
+
+    def release(self, fig: Optional[Figure]) -> None:
+        """Clear a figure that is no longer used and keep it for reuse if the pool is not full."""
+        if fig is None:
+            return
+
+        fig.clear()
+        # Detach the figure from its canvas so it does not keep the destroyed Tk widget alive
+        FigureCanvasBase(fig)
+        if len(self._free) < self.size and all(free is not fig for free in self._free):
+            self._free.append(fig)
+
+
+figure_pool = FigurePool()
+
+
+def create_figure(figsize: Optional[Tuple[float, float]] = None) -> Tuple[Figure, Axes]:
+    """Return a figure with a single axes from the shared pool."""
+    return figure_pool.acquire(figsize)
+
+
+def release_figure(fig: Optional[Figure]) -> None:
+    """Return a figure to the shared pool; the caller must not use it afterwards."""
+    figure_pool.release(fig)
@@ -1,5 +1,5 @@
 import tkinter as tk
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Callable, Literal
 
 if TYPE_CHECKING:
     from common.app import App
@@ -26,6 +26,42 @@ class Module(tk.Frame):
     def __init__(self, app: "App") -> None:
         super().__init__(app)
         self.app = app
+        self._withdrawn_windows: list[tk.Toplevel] = []
+
+    def destroy(self) -> None:
+        """Destroy the module, dropping its redraws that have not run yet."""
+        self.app.redraw.cancel(self)
+        super().destroy()
+
+    def request_redraw(self, callback: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """
+        Call callback(*args, **kwargs) in the next frame of the App's redraw scheduler.
+
+        Repeated requests for the same callback before it runs are coalesced into one call with
+        the latest arguments, so callback should be a bound method rather than a lambda.
+        """
+        self.app.redraw.request(self, callback, *args, **kwargs)
+
+    def suspend(self) -> None:
+        """
+        Hide the module while the App keeps it alive in its module cache.
+
+        Also withdraws the module's own top-level windows, which resume shows again.
+        """
+        self.pack_forget()
+        self._withdrawn_windows = [
+            w for w in self.winfo_children() if isinstance(w, tk.Toplevel) and w.state() != "withdrawn"
+        ]
+        for window in self._withdrawn_windows:
+            window.withdraw()
+
+    def resume(self) -> None:
+        """Show a module previously hidden with suspend, in the state it was left in."""
+        self.pack(fill="both", expand=True)
+        for window in self._withdrawn_windows:
+            if window.winfo_exists():
+                window.deiconify()
+        self._withdrawn_windows = []
 
     @property
     def window_width(self) -> int:
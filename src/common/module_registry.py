@@ -0,0 +1,73 @@
+import importlib
+import threading
+from typing import TYPE_CHECKING, Iterable
+
+from common import profiling
+
+if TYPE_CHECKING:
+    from common.module import Module
+
+
+class ModuleSpec:
+    """
+    Menu entry of a module whose code is imported only when it is first needed.
+
+    Module packages pull in heavy dependencies (matplotlib, networkx, scikit-learn), so the
+    menus are built from this metadata and the module class is imported on first use.
+
+    Attributes:
+        label (str): Label of the module, used in the menu
+        category_key (str): Category key of the module, used in the menu
+        short_description (str): Short description of the module, used in the menu
+        import_path (str): Location of the module class as "package.module:ClassName"
+    """
+
+    def __init__(self, label: str, category_key: str, short_description: str, import_path: str) -> None:
+        self.label = label
+        self.category_key = category_key
+        self.short_description = short_description
+        self.import_path = import_path
+        self._module_class: "type[Module] | None" = None
+
+    @property
+    def module_path(self) -> str:
+        """Dotted path of the Python module that defines the module class."""
+        return self.import_path.partition(":")[0]
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the module class has already been imported."""
+        return self._module_class is not None
+
+    def load(self) -> "type[Module]":
+        """Import the module class, or return it if it was already imported."""
+        if self._module_class is None:
+            module_path, _, class_name = self.import_path.partition(":")
+            with profiling.span(f"import {module_path}", "import"):
+                self._module_class = getattr(importlib.import_module(module_path), class_name)
+        return self._module_class
+
+    def __repr__(self) -> str:
+        return f"ModuleSpec({self.label!r}, {self.import_path!r})"
+
+
+def prefetch(specs: Iterable[ModuleSpec]) -> threading.Thread:
+    """
+    Import the given modules in a background thread and return the thread.
+
+    Imports are protected by Python's import lock, so showing a module while it is being
+    prefetched simply waits for the import to finish.
+    """
+    specs = list(specs)
+
+    def run() -> None:
+        for spec in specs:
+            try:
+                spec.load()
+            except Exception:
+                # The error is raised again and shown when the user opens the module
+                pass
+
+    thread = threading.Thread(target=run, name="module-prefetch", daemon=True)
+    thread.start()
+    return thread
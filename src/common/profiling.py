@@ -0,0 +1,116 @@
+"""
+Opt-in timing of application startup and module switching.
+
+When enabled (main.py --profile or the OUI_PROFILE environment variable), the app records
+import times, widget construction and first paint of every module as timed spans. On exit
+a summary is printed to stderr and the spans are saved in the Chrome trace event format,
+which can be opened in chrome://tracing or https://ui.perfetto.dev.
+
+When disabled, span() returns a no-op context manager, so the instrumentation costs
+practically nothing.
+"""
+
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+ENV_VAR = "OUI_PROFILE"
+DEFAULT_TRACE_PATH = "startup_trace.json"
+
+
+class Profiler:
+    """
+    Collects timed spans relative to the moment the profiler was created.
+
+    Attributes:
+        events (list): Recorded spans as Chrome trace "complete" events (times in microseconds)
+    """
+
+    def __init__(self) -> None:
+        self.events: List[Dict[str, Any]] = []
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        """Return the current time in seconds, as used by record."""
+        return time.perf_counter()
+
+    def record(self, name: str, category: str, start: float, end: Optional[float] = None) -> None:
+        """Record a span from start to end (default: now), both obtained with now()."""
+        end = self.now() if end is None else end
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._start) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        with self._lock:
+            self.events.append(event)
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str) -> Iterator[None]:
+        """Record the time spent in the with block."""
+        start = self.now()
+        try:
+            yield
+        finally:
+            self.record(name, category, start)
+
+    def report(self, file: TextIO = sys.stderr) -> None:
+        """Print the recorded spans in the order they started."""
+        print(f"{'start [ms]':>11} {'duration [ms]':>14}  {'category':<8}  name", file=file)
+        for event in sorted(self.events, key=lambda e: e["ts"]):
+            print(
+                f"{event['ts'] / 1000:>11.1f} {event['dur'] / 1000:>14.1f}  {event['cat']:<8}  {event['name']}",
+                file=file,
+            )
+
+    def dump(self, path: str) -> None:
+        """Save the recorded spans as a Chrome trace JSON file."""
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+
+
+def trace_path_from_env(value: Optional[str]) -> Optional[str]:
+    """
+    Interpret the value of the OUI_PROFILE environment variable.
+
+    Returns:
+        None if profiling stays off (unset, empty, "0" or "false"), DEFAULT_TRACE_PATH for "1"
+        or "true", and the value itself, the trace path, otherwise
+    """
+    if value is None or value.strip().lower() in ("", "0", "false"):
+        return None
+    if value.strip().lower() in ("1", "true"):
+        return DEFAULT_TRACE_PATH
+    return value
+
+
+_profiler: Optional[Profiler] = None
+
+
+def enable() -> Profiler:
+    """Start recording and return the profiler; calling it again returns the same profiler."""
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler()
+    return _profiler
+
+
+def get() -> Optional[Profiler]:
+    """Return the active profiler, or None if profiling is disabled."""
+    return _profiler
+
+
+def span(name: str, category: str) -> "contextlib.AbstractContextManager[None]":
+    """Record the time spent in the with block if profiling is enabled."""
+    if _profiler is None:
+        return contextlib.nullcontext()
+    return _profiler.span(name, category)
@@ -0,0 +1,113 @@
+"""
+Frame-rate-limited redrawing shared by all modules.
+
+Event handlers do not redraw right away; they ask the App's RedrawScheduler for a redraw
+with Module.request_redraw. Requests for the same redraw of the same module made before it
+runs are merged into one that uses the latest arguments, and all pending redraws run together
+in one idle callback of the Tk loop, at most once per frame. Rapid clicking or key repeat
+then costs one redraw per frame instead of one per event.
+
+The scheduler counts the coalesced requests and the dropped frames (frame intervals missed
+because redrawing took longer than a frame) for tuning; with profiling enabled every frame is
+also recorded as a span and the counts are printed on exit.
+"""
+
+import sys
+import time
+import tkinter as tk
+from typing import Any, Callable, Dict, Hashable, Optional, TextIO, Tuple
+
+from common import profiling
+
+# Target frame interval in milliseconds (about 60 frames per second)
+FRAME_MS = 16
+
+
+class RedrawScheduler:
+    """
+    Coalesces redraw requests and runs them at most once per frame on the Tk loop.
+
+    A redraw is identified by its owner (usually the module) and its callback, so the callback
+    should be a bound method or a function, not a new lambda for every request.
+
+    Attributes:
+        requests (int): Number of redraws requested
+        coalesced (int): Requests merged into a redraw that was already pending
+        frames (int): Number of frames in which pending redraws were run
+        dropped (int): Frame intervals missed because the redraws of a frame took too long
+        max_frame_ms (float): Longest time spent redrawing in one frame
+    """
+
+    def __init__(self, root: tk.Misc, frame_ms: int = FRAME_MS) -> None:
+        self.root = root
+        self.frame_ms = frame_ms
+        self._pending: Dict[Tuple[Hashable, Callable[..., Any]], Tuple[tuple, dict]] = {}
+        self._after_id: Optional[str] = None
+        self._last_frame = 0.0
+        self.requests = 0
+        self.coalesced = 0
+        self.frames = 0
+        self.dropped = 0
+        self.max_frame_ms = 0.0
+
+    def request(self, owner: Hashable, callback: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """
+        Run callback(*args, **kwargs) in the next frame.
+
+        If the same owner already requested the same callback, only the arguments of the latest
+        request are kept and the callback runs once.
+        """
+        self.requests += 1
+        key = (owner, callback)
+        if key in self._pending:
+            self.coalesced += 1
+        self._pending[key] = (args, kwargs)
+
+        if self._after_id is None:
+            # wait for the rest of the frame interval if the previous frame was drawn recently
+            delay = self.frame_ms - int((time.perf_counter() - self._last_frame) * 1000)
+            if delay > 0:
+                self._after_id = self.root.after(delay, self._schedule_frame)
+            else:
+                self._schedule_frame()
+
+    def cancel(self, owner: Hashable) -> None:
+        """Forget the pending redraws of an owner, e.g. a module that is being destroyed."""
+        for key in [key for key in self._pending if key[0] == owner]:
+            del self._pending[key]
+
+    def flush(self) -> None:
+        """Run the pending redraws now instead of waiting for the next frame."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._run_frame()
+
+    def _schedule_frame(self) -> None:
+        # after_idle lets Tk handle the queued events first, so they are drawn in the same frame
+        self._after_id = self.root.after_idle(self._run_frame)
+
+    def _run_frame(self) -> None:
+        self._after_id = None
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        start = time.perf_counter()
+        with profiling.span("redraw", "paint"):
+            for (_, callback), (args, kwargs) in pending.items():
+                callback(*args, **kwargs)
+        self._last_frame = end = time.perf_counter()
+
+        frame_ms = (end - start) * 1000
+        self.frames += 1
+        self.dropped += int(frame_ms // self.frame_ms)
+        self.max_frame_ms = max(self.max_frame_ms, frame_ms)
+
+    def report(self, file: TextIO = sys.stderr) -> None:
+        """Print the redraw counts."""
+        print(
+            f"redraw: {self.requests} requests, {self.frames} frames, {self.coalesced} coalesced, "
+            f"{self.dropped} dropped, longest frame {self.max_frame_ms:.1f} ms",
+            file=file,
+        )
@@ -1,6 +1,33 @@
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 import tkinter as tk
 
+import numpy as np
+
+# Zoom factor per unit of the mouse wheel delta (one wheel notch is usually 120 units)
+ZOOM_STEP = 1.001
+MIN_ZOOM = 0.05
+MAX_ZOOM = 20.0
+
+# Items this many pixels outside the visible area are laid out as well, so that short pans
+# and the text around a visible item do not show items at a stale scale
+LAYOUT_MARGIN = 100
+
+
+class _Item:
+    """
+    World coordinates and font of a canvas item, and the view version it was laid out for.
+
+    state is the item's own state while it is hidden for being too small, otherwise None.
+    """
+
+    __slots__ = ("coords", "font", "version", "state")
+
+    def __init__(self, coords: np.ndarray, font: Optional[tuple], version: int) -> None:
+        self.coords = coords
+        self.font = font
+        self.version = version
+        self.state: Optional[str] = None
+
 
 class MovableCanvas(tk.Canvas):
     """
@@ -9,17 +36,206 @@ class MovableCanvas(tk.Canvas):
     The canvas can be:
     - Panned by clicking and dragging
     - Zoomed using the mouse wheel
+
+    Items are drawn in world coordinates, the coordinates they are created with, and shown
+    through a view transform (zoom level and offset). Zooming changes the transform and lays
+    out again only the items in the visible area, scaling their coordinates and font sizes
+    (fonts must be given as tuples); the other items are laid out when they are panned into
+    view. Wheel events that arrive faster than they are drawn are combined into one zoom.
+    Items created while zoomed are placed with the current transform.
+
+    After every zoom the canvas generates the <<Zoom>> virtual event, and renderers can read
+    zoom_level to decide how much detail to draw. Texts too small to be drawn are hidden and get
+    their own state back once they are large enough again.
+
+    Attributes:
+        zoom_level (float): Current zoom, 1 shows the items at their world size
     """
 
     def __init__(self, parent: Optional[tk.Widget] = None, **kwargs) -> None:
         tk.Canvas.__init__(self, parent, **kwargs)
+        self.zoom_level = 1.0
+        self._offset = (0.0, 0.0)
+        self._version = 0
+        self._items: Dict[int, _Item] = {}
+        self._index: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._zoom_factor = 1.0
+        self._zoom_anchor = (0.0, 0.0)
+        self._zoom_id: Optional[str] = None
+        self._layout_id: Optional[str] = None
+
         self.bind("<ButtonPress-1>", lambda ev: self.scan_mark(ev.x, ev.y))
-        self.bind("<B1-Motion>", lambda ev: self.scan_dragto(ev.x, ev.y, gain=1))
+        self.bind("<B1-Motion>", self._pan)
         self.bind("<MouseWheel>", self.zoom)
+        # X11 reports the mouse wheel as buttons 4 and 5
+        self.bind("<Button-4>", lambda ev: self._wheel(ev.x, ev.y, 120))
+        self.bind("<Button-5>", lambda ev: self._wheel(ev.x, ev.y, -120))
+        self.bind("<Configure>", lambda ev: self._schedule_layout(), add=True)
 
     def zoom(self, ev: tk.Event) -> None:
-        """Handles mouse wheel events to zoom the canvas content"""
-        x = self.canvasx(ev.x)
-        y = self.canvasx(ev.y)
-        scale = 1.001**ev.delta
-        self.scale(tk.ALL, x, y, scale, scale)
+        """Handles mouse wheel events to zoom the canvas content around the mouse pointer"""
+        self._wheel(ev.x, ev.y, ev.delta)
+
+    def reset_view(self) -> None:
+        """Return to zoom level 1 without offset, e.g. before drawing a new scene."""
+        self._set_view(1.0, (0.0, 0.0))
+
+    def canvas_to_world(self, x: float, y: float) -> Tuple[float, float]:
+        """Convert canvas coordinates (see canvasx and canvasy) to world coordinates."""
+        return (x - self._offset[0]) / self.zoom_level, (y - self._offset[1]) / self.zoom_level
+
+    def delete(self, *args) -> None:
+        if "all" in args:
+            self._items.clear()
+        else:
+            for tag_or_id in args:
+                for item in self.find_withtag(tag_or_id):
+                    self._items.pop(item, None)
+        self._index = None
+        super().delete(*args)
+
+    def create_arc(self, *args, **kw) -> int:
+        return self._create_item(super().create_arc, args, kw)
+
+    def create_bitmap(self, *args, **kw) -> int:
+        return self._create_item(super().create_bitmap, args, kw)
+
+    def create_image(self, *args, **kw) -> int:
+        return self._create_item(super().create_image, args, kw)
+
+    def create_line(self, *args, **kw) -> int:
+        return self._create_item(super().create_line, args, kw)
+
+    def create_oval(self, *args, **kw) -> int:
+        return self._create_item(super().create_oval, args, kw)
+
+    def create_polygon(self, *args, **kw) -> int:
+        return self._create_item(super().create_polygon, args, kw)
+
+    def create_rectangle(self, *args, **kw) -> int:
+        return self._create_item(super().create_rectangle, args, kw)
+
+    def create_text(self, *args, **kw) -> int:
+        return self._create_item(super().create_text, args, kw)
+
+    def create_window(self, *args, **kw) -> int:
+        return self._create_item(super().create_window, args, kw)
+
+    def _create_item(self, create: Callable[..., int], args: tuple, kw: Dict[str, Any]) -> int:
+        """Create an item with create, record it in world coordinates and place it with the current view."""
+        # like tk.Canvas, accept the coordinates as numbers or sequences, optionally followed by an option dict
+        if args and isinstance(args[-1], dict):
+            kw = {**args[-1], **kw}
+            args = args[:-1]
+        record = _Item(
+            np.concatenate([np.ravel(np.asarray(arg, dtype=float)) for arg in args]),
+            tuple(kw["font"]) if isinstance(kw.get("font"), (tuple, list)) else None,
+            self._version,
+        )
+
+        coords = record.coords.tolist()
+        if self.zoom_level != 1.0 or self._offset != (0.0, 0.0):
+            # create the item already placed with the current view
+            coords = self._transform(record.coords)
+            if record.font is not None:
+                kw = {**kw, **self._font_options(record, lambda: kw.get("state", ""))}
+
+        item = create(*coords, **kw)
+        self._items[item] = record
+        self._index = None
+        return item
+
+    def _wheel(self, x: int, y: int, delta: int) -> None:
+        self._zoom_factor *= ZOOM_STEP**delta
+        self._zoom_anchor = (self.canvasx(x), self.canvasy(y))
+        if self._zoom_id is None:
+            # the wheel events queued until Tk is idle are applied as one zoom
+            self._zoom_id = self.after_idle(self._apply_zoom)
+
+    def _apply_zoom(self) -> None:
+        self._zoom_id = None
+        factor, self._zoom_factor = self._zoom_factor, 1.0
+        zoom_level = min(max(self.zoom_level * factor, MIN_ZOOM), MAX_ZOOM)
+        if zoom_level == self.zoom_level:
+            return
+
+        # keep the point under the mouse pointer in place
+        x, y = self._zoom_anchor
+        scale = zoom_level / self.zoom_level
+        offset_x, offset_y = self._offset
+        self._set_view(zoom_level, (x - (x - offset_x) * scale, y - (y - offset_y) * scale))
+        self.event_generate("<<Zoom>>")
+
+    def _set_view(self, zoom_level: float, offset: Tuple[float, float]) -> None:
+        self.zoom_level = zoom_level
+        self._offset = offset
+        self._version += 1
+        self._layout_visible()
+
+    def _pan(self, ev: tk.Event) -> None:
+        self.scan_dragto(ev.x, ev.y, gain=1)
+        self._schedule_layout()
+
+    def _schedule_layout(self) -> None:
+        if self._layout_id is None and self._items:
+            self._layout_id = self.after_idle(self._layout_visible)
+
+    def _item_index(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the item ids and their world bounding boxes (x1, y1, x2, y2) as arrays."""
+        if self._index is None:
+            ids = np.fromiter(self._items, dtype=int, count=len(self._items))
+            boxes = np.empty((len(ids), 4))
+            for i, record in enumerate(self._items.values()):
+                points = record.coords.reshape(-1, 2)
+                boxes[i, :2] = points.min(axis=0)
+                boxes[i, 2:] = points.max(axis=0)
+            self._index = ids, boxes
+        return self._index
+
+    def _layout_visible(self) -> None:
+        """Lay out the items in and around the visible area that are not laid out for the current view."""
+        self._layout_id = None
+        ids, boxes = self._item_index()
+        if not len(ids):
+            return
+
+        x1, y1 = self.canvas_to_world(self.canvasx(-LAYOUT_MARGIN), self.canvasy(-LAYOUT_MARGIN))
+        x2, y2 = self.canvas_to_world(
+            self.canvasx(self.winfo_width() + LAYOUT_MARGIN), self.canvasy(self.winfo_height() + LAYOUT_MARGIN)
+        )
+        visible = (boxes[:, 0] <= x2) & (boxes[:, 2] >= x1) & (boxes[:, 1] <= y2) & (boxes[:, 3] >= y1)
+        for item in ids[visible].tolist():
+            record = self._items[item]
+            if record.version != self._version:
+                self._layout(item, record)
+
+    def _layout(self, item: int, record: _Item) -> None:
+        """Place an item with the current view transform."""
+        self.coords(item, *self._transform(record.coords))
+        if record.font is not None:
+            self.itemconfigure(item, **self._font_options(record, lambda: self.itemcget(item, "state")))
+        record.version = self._version
+
+    def _transform(self, coords: np.ndarray) -> list:
+        """Convert flat world coordinates to canvas coordinates."""
+        return (coords.reshape(-1, 2) * self.zoom_level + self._offset).ravel().tolist()
+
+    def _font_options(self, record: _Item, state: Callable[[], str]) -> dict:
+        """
+        Return the font scaled to the zoom level, and hide texts too small to be drawn.
+
+        A text is hidden by this method only after its own state is saved from state(), and gets
+        that state back once it is large enough again.
+        """
+        family, size, *style = record.font  # type: ignore[misc]
+        size = round(size * self.zoom_level)
+        if size == 0:
+            # Tk would draw a font of size 0 at the default size
+            if record.state is None:
+                record.state = state()
+            return {"state": "hidden"}
+
+        options: Dict[str, Any] = {"font": (family, size, *style)}
+        if record.state is not None:
+            options["state"], record.state = record.state, None
+        return options
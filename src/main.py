@@ -1,10 +1,102 @@
-from common.app import App
+import argparse
+import multiprocessing
+import os
+import sys
+
+from common import profiling
+
+
+def run_export(args: argparse.Namespace) -> int:
+    """Render one image with "main.py export" without constructing App; returns the exit status."""
+    from common import export
+
+    if args.module not in export.exporters():
+        print(f"Unknown module {args.module}, choose from: {', '.join(export.exporters())}", file=sys.stderr)
+        return 2
+    try:
+        print(export.export(args.module, args.options))
+    except (ValueError, OSError) as e:
+        print(f"main.py export {args.module}: error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def run_export_batch(args: argparse.Namespace) -> int:
+    """Render the images listed in a jobs file in parallel; returns the exit status."""
+    from common import export
+
+    try:
+        jobs = export.read_jobs(args.jobs)
+    except (ValueError, OSError) as e:
+        print(f"main.py export-batch: error: {args.jobs}: {e}", file=sys.stderr)
+        return 1
+    failed = 0
+    for job, error in export.export_many(jobs, workers=args.workers):
+        if error is not None:
+            failed += 1
+            print(f"{' '.join(job)}: {error}", file=sys.stderr)
+    print(f"Exported {len(jobs) - failed} of {len(jobs)} images")
+    return 1 if failed else 0
 
 
 def main():
-    app = App()
+    # Export workers of the built executable start it again and must run their job instead of the app
+    multiprocessing.freeze_support()
+
+    parser = argparse.ArgumentParser(description="Interactive visualizations of algorithms.")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=profiling.DEFAULT_TRACE_PATH,
+        default=profiling.trace_path_from_env(os.environ.get(profiling.ENV_VAR)),
+        metavar="TRACE",
+        help=(
+            "record import, widget construction and first paint times, print them on exit and save them "
+            f"as a Chrome trace (default: {profiling.DEFAULT_TRACE_PATH}); "
+            f"can also be enabled with the {profiling.ENV_VAR} environment variable"
+        ),
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    export_parser = subparsers.add_parser(
+        "export",
+        help="render a module's visualization to an image file without opening the app",
+        description="Render a module's visualization to an image file without opening the app, e.g. "
+        '"export knn --k 5 --point 1,2 -o out.png". Use "export MODULE -h" for the options of a module.',
+    )
+    export_parser.add_argument("module", help="package name of the module, e.g. knn or ab_pruning")
+    export_parser.add_argument("options", nargs=argparse.REMAINDER, help="export options of the module")
+
+    batch_parser = subparsers.add_parser(
+        "export-batch",
+        help="render many images in parallel",
+        description='Render the images listed in a file, one "export" command line per line '
+        '(e.g. "knn --k 5 --point 1,2 -o knn5.png"), in a pool of worker processes.',
+    )
+    batch_parser.add_argument("jobs", help="file with one export job per line; empty lines and # comments are skipped")
+    batch_parser.add_argument(
+        "-j", "--workers", type=int, default=None, help="number of worker processes (default: number of CPUs)"
+    )
+    args = parser.parse_args()
+
+    if args.command == "export":
+        sys.exit(run_export(args))
+    if args.command == "export-batch":
+        sys.exit(run_export_batch(args))
+
+    profiler = profiling.enable() if args.profile else None
+
+    with profiling.span("import common.app", "import"):
+        from common.app import App
+
+    with profiling.span("App.__init__", "widgets"):
+        app = App()
     app.mainloop()
 
+    if profiler is not None:
+        profiler.report()
+        app.redraw.report()
+        profiler.dump(args.profile)
+
 
 if __name__ == "__main__":
     main()
@@ -1,3 +1,6 @@
+from .action_log import ActionLog, INIT, MOVE_DOWN, MOVE_UP, END, OPCODE_NAMES, decode_value
+
+
 class TreeNode:
     """
     A node in the alpha-beta pruning game tree.
@@ -159,6 +162,16 @@ class TreeNode:
         for child in self.children:
             child.center_node(offset_x, offset_y)
 
+    def preorder(self):
+        """Return all nodes of the subtree in pre-order, without recursion."""
+        nodes = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(reversed(node.children))
+        return nodes
+
     def get_possible_coords(self, set_x, set_y):
         """Collect all x,y coordinates used in tree into provided sets."""
         set_x.add(self.x)
@@ -177,11 +190,12 @@ class AlphaBetaSimulator:
     Attributes:
         app: Reference to GUI application
         root_node: Root node of game tree
+        nodes: All tree nodes in pre-order, used to index nodes in the action log
         curr_node: Currently visited node
         curr_path: Path from root to current node
         over: True if algorithm has completed
         next_child: Maps nodes to index of next unvisited child
-        action_stack: Stack of actions for backtracking
+        actions: Compact log of actions for backtracking
         cutoffs: List of pruning cutoff locations
     """
 
@@ -190,6 +204,10 @@ class AlphaBetaSimulator:
         self.app = app
         self.root_node = root_node
 
+        # nodes are referenced by pre-order index in the action log
+        self.nodes = root_node.preorder()
+        self.node_index = {node: i for i, node in enumerate(self.nodes)}
+
         self.curr_node = None
         self.curr_path = []
         self.over = False
@@ -198,11 +216,28 @@ class AlphaBetaSimulator:
         self.next_child = {}
 
         # stores actions to allow backward steps
-        self.action_stack = []
+        self.actions = ActionLog()
 
         # stores current cutoffs as (parent, cutoff_idx) pairs
         self.cutoffs = []
 
+    def _move_up(self, cutoff):
+        """Return from the current node to its parent, propagating value, alpha and beta."""
+        prev_node = self.curr_node
+        self.curr_node = self.curr_path[-2]
+        self.curr_path.pop()
+
+        # save previous values
+        prev_value = self.curr_node.value
+        prev_alpha = self.curr_node.alpha
+        prev_beta = self.curr_node.beta
+
+        # update value, alpha and beta
+        self.curr_node.set_value(prev_node)
+        self.curr_node.alpha_beta_propagate_up(prev_node)
+
+        self.actions.append(MOVE_UP, self.node_index[prev_node], prev_value, prev_alpha, prev_beta, cutoff)
+
     def forward(self, draw=True):
         """
         Execute one forward step of alpha-beta algorithm.
@@ -218,24 +253,11 @@ class AlphaBetaSimulator:
             self.curr_node.alpha = float("-inf")
             self.curr_node.beta = float("inf")
 
-            self.action_stack.append(("INIT",))
+            self.actions.append(INIT)
 
         else:
             if self.curr_node.is_leaf():
-                prev_node = self.curr_node
-                self.curr_node = self.curr_path[-2]
-                self.curr_path.pop()
-
-                # save previous values
-                prev_value = self.curr_node.value
-                prev_alpha = self.curr_node.alpha
-                prev_beta = self.curr_node.beta
-
-                # update value, alpha and beta
-                self.curr_node.set_value(prev_node)
-                self.curr_node.alpha_beta_propagate_up(prev_node)
-
-                self.action_stack.append(("MOVE_UP", prev_node, prev_value, prev_alpha, prev_beta, False))
+                self._move_up(False)
 
             else:
                 # determine next child's index
@@ -261,7 +283,9 @@ class AlphaBetaSimulator:
                     # propagate alpha and beta
                     self.curr_node.alpha_beta_propagate_down(self.curr_path[-2])
 
-                    self.action_stack.append(("MOVE_DOWN", self.curr_path[-2], prev_alpha, prev_beta))
+                    self.actions.append(
+                        MOVE_DOWN, self.node_index[self.curr_path[-2]], alpha=prev_alpha, beta=prev_beta
+                    )
 
                 else:
                     if self.curr_node == self.root_node:
@@ -269,35 +293,13 @@ class AlphaBetaSimulator:
                         self.curr_node = None
                         self.over = True
 
-                        self.action_stack.append(("END", cutoff))
+                        self.actions.append(END, cutoff=cutoff)
 
                     else:
-                        prev_node = self.curr_node
-                        self.curr_node = self.curr_path[-2]
-                        self.curr_path.pop()
-
-                        # save previous values
-                        prev_value = self.curr_node.value
-                        prev_alpha = self.curr_node.alpha
-                        prev_beta = self.curr_node.beta
-
-                        # update value, alpha and beta
-                        self.curr_node.set_value(prev_node)
-                        self.curr_node.alpha_beta_propagate_up(prev_node)
-
-                        self.action_stack.append(
-                            (
-                                "MOVE_UP",
-                                prev_node,
-                                prev_value,
-                                prev_alpha,
-                                prev_beta,
-                                cutoff,
-                            )
-                        )
+                        self._move_up(cutoff)
 
         if draw:
-            is_prop_up = len(self.action_stack) > 0 and self.action_stack[-1][0] == "MOVE_UP"
+            is_prop_up = self.actions.last_op == MOVE_UP
             self.app.draw_tree(
                 self.root_node,
                 self.app.node_radius,
@@ -311,59 +313,52 @@ class AlphaBetaSimulator:
         Undo one step of alpha-beta algorithm.
         Updates tree state and optionally redraws visualization.
         """
-        if len(self.action_stack) == 0:
+        if len(self.actions) == 0:
             return
 
-        action = self.action_stack[-1][0]
+        action = self.actions.pop()
+        op = action["op"]
 
-        if action == "INIT":
+        if op == INIT:
             self.curr_node.alpha = None
             self.curr_node.beta = None
 
             self.curr_node = None
             self.curr_path.pop()
 
-            self.action_stack.pop()
-
-        elif action == "MOVE_DOWN":
+        elif op == MOVE_DOWN:
             # reconstruct node's alpha and beta
-            self.curr_node.alpha = self.action_stack[-1][2]
-            self.curr_node.beta = self.action_stack[-1][3]
+            self.curr_node.alpha = decode_value(action["alpha"])
+            self.curr_node.beta = decode_value(action["beta"])
 
             # set current node and fix child indexing
-            self.curr_node = self.action_stack[-1][1]
+            self.curr_node = self.nodes[action["node"]]
             self.next_child[self.curr_node] -= 1
             self.curr_path.pop()
 
-            self.action_stack.pop()
-
-        elif action == "MOVE_UP":
+        elif op == MOVE_UP:
             # reconstruct node's value, alpha and beta
-            self.curr_node.value = self.action_stack[-1][2]
-            self.curr_node.alpha = self.action_stack[-1][3]
-            self.curr_node.beta = self.action_stack[-1][4]
+            self.curr_node.value = decode_value(action["value"])
+            self.curr_node.alpha = decode_value(action["alpha"])
+            self.curr_node.beta = decode_value(action["beta"])
 
             # set current node
-            self.curr_node = self.action_stack[-1][1]
+            self.curr_node = self.nodes[action["node"]]
             self.curr_path.append(self.curr_node)
 
             # remove cutoff (if exists)
-            if self.action_stack[-1][5]:
+            if action["cutoff"]:
                 self.cutoffs.pop()
 
-            self.action_stack.pop()
-
-        elif action == "END":
+        elif op == END:
             self.curr_node = self.root_node
             self.curr_path.append(self.curr_node)
             self.over = False
 
             # remove cutoff
-            if self.action_stack[-1][1]:
+            if action["cutoff"]:
                 self.cutoffs.pop()
 
-            self.action_stack.pop()
-
         if draw:
             self.app.draw_tree(
                 self.root_node,
@@ -374,7 +369,7 @@ class AlphaBetaSimulator:
 
     def all_backward(self):
         """Undo all steps back to initial state."""
-        while len(self.action_stack):
+        while len(self.actions):
             self.backward(draw=False)
         self.app.draw_tree(
             self.root_node,
@@ -393,3 +388,110 @@ class AlphaBetaSimulator:
             marked_node=self.curr_node,
             cutoffs=self.cutoffs,
         )
+
+    def forward_steps(self, count, draw=True):
+        """
+        Execute up to count forward steps, stopping at the end of the algorithm,
+        and redraw once after the last one. Returns the number of executed steps.
+        """
+        steps = 0
+        while steps < count and not self.over:
+            self.forward(draw=False)
+            steps += 1
+
+        if draw and steps:
+            self.app.draw_tree(
+                self.root_node,
+                self.app.node_radius,
+                marked_node=self.curr_node,
+                cutoffs=self.cutoffs,
+                is_prop_up=self.actions.last_op == MOVE_UP,
+            )
+        return steps
+
+    def save_trace(self, file):
+        """Save the actions executed so far, so they can be replayed on the same tree."""
+        self.actions.save(file)
+
+    def replay(self, trace):
+        """
+        Rewind to the initial state and re-execute the steps recorded in trace.
+        Raises ValueError if the trace does not match this tree.
+        """
+        if isinstance(trace, ActionLog):
+            records = trace.records.copy()
+        else:
+            records = ActionLog.load(trace).records
+
+        while len(self.actions):
+            self.backward(draw=False)
+
+        for step, record in enumerate(records):
+            self.forward(draw=False)
+            if self.actions.last_op != record["op"] or self.actions.peek()["node"] != record["node"]:
+                raise ValueError(
+                    f"Trace diverges at step {step}: expected {OPCODE_NAMES[record['op']]}, "
+                    f"got {OPCODE_NAMES[self.actions.last_op]}"
+                )
+
+        self.app.draw_tree(
+            self.root_node,
+            self.app.node_radius,
+            marked_node=self.curr_node,
+            cutoffs=self.cutoffs,
+            is_prop_up=self.actions.last_op == MOVE_UP,
+        )
+
+
+def parse_tree_input(tree_structure_str, leaf_values_str):
+    """
+    Parse the tree structure and leaf values entered by the user.
+
+    The structure consists of layers separated by '|', each layer lists the number of children
+    of every node in the layer above, e.g. '2|2,2'. Leaf values are comma-separated numbers,
+    one for every node in the last layer.
+
+    Returns:
+        (tree_structure_lst, leaf_values) where tree_structure_lst is None if the structure is
+        invalid and leaf_values is None if the structure or the leaf values are invalid
+    """
+    is_valid = True
+
+    # validate tree structure input
+    tree_structure_lst = []
+    layers = tree_structure_str.split("|")
+    expected_no_nodes = 1
+
+    for layer in layers:
+        tree_structure_lst.append([])
+        layer_degrees = layer.split(",")
+        # degree counts from upper layers should match with current layer
+        if len(layer_degrees) != expected_no_nodes:
+            is_valid = False
+
+        degree_count = 0
+        # each degree must be an (positive) integer
+        for deg in layer_degrees:
+            if deg.isnumeric() and int(deg) > 0:
+                degree_count += int(deg)
+                tree_structure_lst[-1].append(int(deg))
+            else:
+                is_valid = False
+        expected_no_nodes = degree_count
+
+    if not is_valid:
+        return None, None
+
+    leaf_values = []
+    leafs = leaf_values_str.split(",")
+    # number of leafs should match degree count from last layer
+    if len(leafs) != expected_no_nodes:
+        is_valid = False
+
+    for leaf in leafs:
+        try:
+            leaf_values.append(float(leaf))
+        except ValueError:
+            is_valid = False
+
+    return tree_structure_lst, leaf_values if is_valid else None
@@ -0,0 +1,128 @@
+"""
+Compact action log for the alpha-beta simulator.
+
+Every simulator step is stored as one fixed-size record in a growable NumPy structured
+array instead of a tuple holding live node references. Nodes are referred to by their
+pre-order index in the tree, and missing values (None) are stored as NaN.
+"""
+
+from typing import IO, Optional, Union
+import os
+
+import numpy as np
+
+INIT = 0
+MOVE_DOWN = 1
+MOVE_UP = 2
+END = 3
+
+OPCODE_NAMES = ("INIT", "MOVE_DOWN", "MOVE_UP", "END")
+
+ACTION_DTYPE = np.dtype(
+    [
+        ("op", np.uint8),
+        ("cutoff", np.bool_),
+        ("node", np.int32),
+        ("value", np.float64),
+        ("alpha", np.float64),
+        ("beta", np.float64),
+    ]
+)
+
+
+def encode_value(value: Optional[float]) -> float:
+    """Convert an optional node value to a float64, using NaN for None."""
+    return np.nan if value is None else value
+
+
+def decode_value(value: float) -> Optional[float]:
+    """Convert a stored float64 back to an optional Python float."""
+    return None if np.isnan(value) else float(value)
+
+
+class ActionLog:
+    """
+    Stack of simulator actions backed by a NumPy structured array.
+
+    Each record holds:
+        op (uint8): One of INIT, MOVE_DOWN, MOVE_UP, END
+        cutoff (bool): Whether the step removed a child because of a cutoff
+        node (int32): Pre-order index of the node to return to on undo (-1 if unused)
+        value, alpha, beta (float64): Values to restore on undo (NaN for None)
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        self._data = np.empty(max(capacity, 1), dtype=ACTION_DTYPE)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def records(self) -> np.ndarray:
+        """View of the recorded actions, oldest first."""
+        return self._data[: self._size]
+
+    @property
+    def last_op(self) -> Optional[int]:
+        """Opcode of the most recent action, or None if the log is empty."""
+        if self._size == 0:
+            return None
+        return int(self._data[self._size - 1]["op"])
+
+    def append(
+        self,
+        op: int,
+        node: int = -1,
+        value: Optional[float] = None,
+        alpha: Optional[float] = None,
+        beta: Optional[float] = None,
+        cutoff: bool = False,
+    ) -> None:
+        """Push a new action, growing the underlying array when it is full."""
+        if self._size == len(self._data):
+            grown = np.empty(2 * len(self._data), dtype=ACTION_DTYPE)
+            grown[: self._size] = self._data
+            self._data = grown
+
+        self._data[self._size] = (
+            op,
+            cutoff,
+            node,
+            encode_value(value),
+            encode_value(alpha),
+            encode_value(beta),
+        )
+        self._size += 1
+
+    def peek(self) -> np.void:
+        """Return the most recent action without removing it."""
+        if self._size == 0:
+            raise IndexError("peek from empty action log")
+        return self._data[self._size - 1].copy()
+
+    def pop(self) -> np.void:
+        """Remove and return the most recent action."""
+        record = self.peek()
+        self._size -= 1
+        return record
+
+    def clear(self) -> None:
+        """Remove all actions."""
+        self._size = 0
+
+    def save(self, file: Union[str, os.PathLike, IO[bytes]]) -> None:
+        """Save the log in NumPy .npy format."""
+        np.save(file, self.records, allow_pickle=False)
+
+    @classmethod
+    def load(cls, file: Union[str, os.PathLike, IO[bytes]]) -> "ActionLog":
+        """Load a log previously written by save."""
+        records = np.load(file, allow_pickle=False)
+        if records.dtype != ACTION_DTYPE:
+            raise ValueError(f"Unexpected action log dtype: {records.dtype}")
+
+        log = cls(capacity=len(records))
+        log._data[: len(records)] = records
+        log._size = len(records)
+        return log
@@ -0,0 +1,349 @@
+"""
+Drawing of the alpha-beta game tree.
+
+TreeDrawer draws the tree with the item-creating methods of a tkinter Canvas (create_line,
+create_polygon, create_text and delete). The module draws on its MovableCanvas; for export
+without Tk, AxesCanvas provides the same methods on a matplotlib Axes, so both produce the
+same picture from the same drawing code.
+"""
+
+import functools
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from matplotlib import font_manager  # type: ignore
+from matplotlib.axes import Axes  # type: ignore
+from matplotlib.collections import LineCollection, PolyCollection  # type: ignore
+from matplotlib.figure import Figure  # type: ignore
+
+from .ab_pruning import TreeNode
+
+# Tk color names used by TreeDrawer that matplotlib does not know
+TK_COLORS: Dict[str, str] = {
+    "olivedrab1": "#c0ff3e",
+    "light sky blue": "#87cefa",
+    "IndianRed1": "#ff6a6a",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _font_family(name: str) -> str:
+    """Return the font family if matplotlib has it, otherwise the default one, as Tk does."""
+    return name if name in {font.name for font in font_manager.fontManager.ttflist} else "sans-serif"
+
+
+class AxesCanvas:
+    """
+    The subset of the tkinter Canvas interface used by TreeDrawer, drawn on a matplotlib Axes.
+
+    Canvas coordinates are used as data coordinates with the y axis pointing down, as in Tk.
+    Items are collected and added to the axes by finish(): lines and polygons as one collection
+    each, in the order they were created, and texts on top of them.
+    """
+
+    def __init__(self, ax: Axes) -> None:
+        self.ax = ax
+        self._lines: List[Tuple[Tuple[float, float], Tuple[float, float]]] = []
+        self._line_styles: List[Tuple[str, float, Optional[Tuple[float, Tuple[int, ...]]]]] = []
+        self._polygons: List[np.ndarray] = []
+        self._polygon_colors: List[str] = []
+        self._texts: List[Tuple[float, float, str, Tuple, str]] = []
+
+    def delete(self, tag: str) -> None:
+        """Remove all items; only the "all" tag is supported."""
+        self._lines.clear()
+        self._line_styles.clear()
+        self._polygons.clear()
+        self._polygon_colors.clear()
+        self._texts.clear()
+
+    def create_line(
+        self, x1: float, y1: float, x2: float, y2: float, width: float = 1, fill: str = "black", dash=None
+    ) -> None:
+        self._lines.append(((x1, y1), (x2, y2)))
+        self._line_styles.append((TK_COLORS.get(fill, fill), width, (0, tuple(dash)) if dash else None))
+
+    def create_polygon(self, vertices: Sequence[float], fill: str = "black") -> None:
+        self._polygons.append(np.reshape(vertices, (-1, 2)))
+        self._polygon_colors.append(TK_COLORS.get(fill, fill))
+
+    def create_text(self, x: float, y: float, text: str = "", font: Tuple = ("Arial", 10), fill: str = "black") -> None:
+        self._texts.append((x, y, text, font, TK_COLORS.get(fill, fill)))
+
+    def finish(self, margin: float = 40) -> Tuple[float, float]:
+        """
+        Add the collected items to the axes and fit the view to them.
+
+        Returns:
+            Width and height of the drawing in canvas units (Tk pixels)
+        """
+        ax = self.ax
+        ax.clear()
+        ax.axis("off")
+
+        colors, widths, dashes = zip(*self._line_styles) if self._line_styles else ((), (), ())
+        ax.add_collection(
+            LineCollection(
+                self._lines,
+                colors=list(colors),
+                linewidths=list(widths),
+                linestyles=[dash or "solid" for dash in dashes],
+                zorder=1,
+            )
+        )
+        ax.add_collection(PolyCollection(self._polygons, facecolors=self._polygon_colors, edgecolors="none", zorder=2))
+        for x, y, text, font, color in self._texts:
+            ax.text(
+                x,
+                y,
+                text,
+                color=color,
+                fontfamily=_font_family(font[0]),
+                fontsize=font[1],
+                fontweight=font[2] if len(font) > 2 else "normal",
+                ha="center",
+                va="center",
+                zorder=3,
+            )
+
+        points = [p for line in self._lines for p in line] + [p for poly in self._polygons for p in poly]
+        points += [(x, y) for x, y, *_ in self._texts]
+        xs, ys = zip(*points) if points else ((0,), (0,))
+        x_min, x_max = min(xs) - margin, max(xs) + margin
+        y_min, y_max = min(ys) - margin, max(ys) + margin
+
+        ax.set_xlim(x_min, x_max)
+        ax.set_ylim(y_max, y_min)
+        ax.set_aspect("equal")
+        return x_max - x_min, y_max - y_min
+
+
+class TreeDrawer:
+    """
+    Draws a game tree on self.canvas, which provides the tkinter Canvas item methods.
+
+    Attributes:
+        node_radius: Radius of the node triangles
+    """
+
+    node_radius: int = 30
+    canvas: Any
+
+    def draw_tree(
+        self,
+        app_node: "TreeNode",
+        radius: int,
+        parent_x: Optional[float] = None,
+        parent_y: Optional[float] = None,
+        marked_node: Optional["TreeNode"] = None,
+        cutoffs: Optional[List[Tuple["TreeNode", int]]] = None,
+        cutoff: bool = False,
+        is_prop_up: Optional[bool] = None,
+    ) -> None:
+        """
+        Draws the complete tree visualization on the canvas.
+
+        Args:
+            app_node: Root node of the tree
+            radius: Radius for drawing nodes
+            parent_x: X coordinate of parent node (None for root)
+            parent_y: Y coordinate of parent node (None for root)
+            marked_node: Currently highlighted node in simulation
+            cutoffs: List of nodes where pruning occurred
+            cutoff: Whether current branch is pruned
+            is_prop_up: Whether values are being propagated up the tree
+        """
+        # clear canvas
+        if parent_x is None and parent_y is None:
+            self.canvas.delete("all")
+
+        self.draw_separators(app_node)
+        self.draw_nodes(
+            app_node,
+            radius,
+            parent_x,
+            parent_y,
+            marked_node,
+            cutoffs,
+            cutoff,
+            is_prop_up,
+        )
+
+    def draw_nodes(
+        self,
+        node: "TreeNode",
+        radius: int,
+        parent_x: Optional[float] = None,
+        parent_y: Optional[float] = None,
+        marked_node: Optional["TreeNode"] = None,
+        cutoffs: Optional[List[Tuple["TreeNode", int]]] = None,
+        cutoff: bool = False,
+        is_prop_up: Optional[bool] = None,
+    ) -> None:
+        """
+        Recursively draws nodes and connections in the tree.
+
+        Args:
+            node: Current node to draw
+            radius: Radius for drawing nodes
+            parent_x: X coordinate of parent node
+            parent_y: Y coordinate of parent node
+            marked_node: Currently highlighted node
+            cutoffs: List of pruning points
+            cutoff: Whether current branch is pruned
+            is_prop_up: Whether values are being propagated up
+        """
+        # connect node with parent
+        if parent_x is not None and parent_y is not None:
+            self.canvas.create_line(parent_x, parent_y, node.x, node.y, width=1, fill="black")
+
+        # draw cutoff line
+        if cutoff and parent_x is not None and parent_y is not None:
+            self.draw_perpendicular_line(parent_x, parent_y, node.x, node.y)
+
+        for i, child in enumerate(node.children):
+            # determine if there is a cutoff
+            cutoff = False
+            for cutoff_pair in cutoffs or []:
+                if cutoff_pair[0] == node and cutoff_pair[1] <= i:
+                    cutoff = True
+
+            self.draw_nodes(child, radius, node.x, node.y, marked_node, cutoffs, cutoff, is_prop_up)
+
+        # draw node as triangle
+        color = "olivedrab1" if node == marked_node else ("light sky blue" if node.is_max else "IndianRed1")
+        v_max = [
+            node.x,
+            node.y - 0.866 * radius,
+            node.x - radius,
+            node.y + radius,
+            node.x + radius,
+            node.y + radius,
+        ]
+        v_min = [
+            node.x - radius,
+            node.y - radius,
+            node.x + radius,
+            node.y - radius,
+            node.x,
+            node.y + 0.866 * radius,
+        ]
+        vertices = v_max if node.is_max else v_min
+
+        self.canvas.create_polygon(vertices, fill=color)
+
+        # draw node value
+        text_color = "red" if node == marked_node else "black"
+        text_yoffset = (0.2 if node.is_max else -0.2) * radius
+        self.canvas.create_text(
+            node.x,
+            node.y + text_yoffset,
+            text=node.value_string(),
+            font=("Arial", 10, "bold"),
+            fill=text_color,
+        )
+
+        # draw alpha beta values
+        display_eq = is_prop_up and node == marked_node
+        self.canvas.create_text(
+            node.x,
+            node.y - 1.5 * self.node_radius,
+            text=node.alpha_beta_string(display_eq),
+            font=("Arial", 10, "bold"),
+            fill=text_color,
+        )
+
+    def draw_perpendicular_line(self, x1: float, y1: float, x2: float, y2: float, length: float = 10) -> None:
+        """
+        Draws a perpendicular line to indicate pruning.
+
+        Args:
+            x1, y1: Start coordinates of the original line
+            x2, y2: End coordinates of the original line
+            length: Length of the perpendicular line
+        """
+        # direction of the original line
+        dx = x2 - x1
+        dy = y2 - y1
+
+        # perpendicular direction
+        perp_dx = -dy
+        perp_dy = dx
+
+        # normalize perpendicular direction
+        perp_length = (perp_dx**2 + perp_dy**2) ** 0.5
+        perp_dx /= perp_length
+        perp_dy /= perp_length
+
+        # calculate endpoints of the perpendicular line
+        x_center = x1 + (x2 - x1) / 2
+        y_center = y1 + (y2 - y1) / 2
+
+        perp_x1 = x_center + perp_dx * length
+        perp_y1 = y_center + perp_dy * length
+        perp_x2 = x_center - perp_dx * length
+        perp_y2 = y_center - perp_dy * length
+
+        # draw perpendicular line
+        self.canvas.create_line(perp_x1, perp_y1, perp_x2, perp_y2, width=4, fill="red")
+
+    def draw_separators(self, app_node: "TreeNode") -> None:
+        """
+        Draws horizontal separators between tree layers and labels them.
+
+        Args:
+            app_node: Root node of the tree
+        """
+        padding: int = 75
+        text_padding: int = 60
+
+        set_x: Set[float] = set()
+        set_y: Set[float] = set()
+        app_node.get_possible_coords(set_x, set_y)
+
+        min_x, max_x = min(set_x) - padding, max(set_x) + padding
+        list_y = sorted(list(set_y))
+
+        # draw separator between each layer
+        for i in range(1, len(list_y)):
+            y1, y2 = list_y[i - 1], list_y[i]
+            y_line = (y1 + y2) / 2
+            self.canvas.create_line(
+                min_x - padding,
+                y_line,
+                max_x + padding,
+                y_line,
+                dash=(4, 2),
+                fill="black",
+            )
+
+        # draw layer type
+        for i, layer_y in enumerate(list_y):
+            text = "MAX" if i % 2 == 0 else "MIN"
+            self.canvas.create_text(
+                max_x + text_padding,
+                layer_y,
+                text=text,
+                font=("Arial", 12, "bold"),
+                fill="black",
+            )
+
+
+class TreeFigure(TreeDrawer):
+    """
+    Draws the tree on a matplotlib figure instead of the module's canvas.
+
+    It can be passed to AlphaBetaSimulator in place of the module. After every drawing the
+    figure is resized so that one canvas unit (a Tk pixel) is one point, which keeps the
+    node, line and font sizes in the same proportions as in the module.
+    """
+
+    def __init__(self, fig: Figure, ax: Axes) -> None:
+        self.fig = fig
+        self.canvas = AxesCanvas(ax)
+
+    def draw_tree(self, app_node: "TreeNode", radius: int, *args, **kwargs) -> None:
+        super().draw_tree(app_node, radius, *args, **kwargs)
+        width, height = self.canvas.finish()
+        self.fig.set_size_inches(width / 72, height / 72)
+        self.fig.subplots_adjust(left=0, right=1, bottom=0, top=1)
@@ -0,0 +1,49 @@
+"""Alpha-beta pruning on a game tree, after a given number of algorithm steps."""
+
+import argparse
+
+from matplotlib.axes import Axes  # type: ignore
+from matplotlib.figure import Figure  # type: ignore
+
+from .ab_pruning import AlphaBetaSimulator, TreeNode, parse_tree_input
+from .action_log import MOVE_UP
+from .drawing import TreeFigure
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--structure", default="2|2,2|2,2,2,2", help="children per node, layers separated by | (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--leaves", default="11,-20,12,-10,-12,-5,-6,2", help="comma-separated leaf values (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--steps", type=int, default=None, help="number of algorithm steps to run (default: run to the end)"
+    )
+
+
+def render(args: argparse.Namespace, fig: Figure, ax: Axes) -> None:
+    tree_structure_lst, leaf_values = parse_tree_input(args.structure, args.leaves)
+    if tree_structure_lst is None:
+        raise ValueError(f"invalid tree structure {args.structure!r}")
+    if leaf_values is None:
+        raise ValueError(f"invalid leaf values {args.leaves!r} for tree structure {args.structure!r}")
+
+    root = TreeNode.generate_tree(tree_structure_lst, leaf_values)
+    # same margins as in the module
+    root.set_position(80, 150, 80, 150)
+
+    tree = TreeFigure(fig, ax)
+    simulator = AlphaBetaSimulator(tree, root)
+    steps = 0
+    while not simulator.over and (args.steps is None or steps < args.steps):
+        simulator.forward(draw=False)
+        steps += 1
+
+    tree.draw_tree(
+        root,
+        tree.node_radius,
+        marked_node=simulator.curr_node,
+        cutoffs=simulator.cutoffs,
+        is_prop_up=simulator.actions.last_op == MOVE_UP,
+    )
@@ -11,18 +11,25 @@ on game trees. It allows users to:
 The module uses tkinter for the GUI components and custom canvas rendering.
 """
 
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+import time
+from typing import TYPE_CHECKING, List, Optional
 import tkinter as tk
 from tkinter import ttk
 import tkinter.font as tkFont
 from common.module import Module
+from common.redraw import FRAME_MS
 
-from .ab_pruning import TreeNode, AlphaBetaSimulator
+from .ab_pruning import TreeNode, AlphaBetaSimulator, parse_tree_input
+from .drawing import TreeDrawer
 from common.widgets import MovableCanvas
 
 if TYPE_CHECKING:
     from common.app import App
 
+# Auto-play speeds offered in the speed box, in steps per second
+PLAY_SPEEDS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+DEFAULT_PLAY_SPEED = 2
+
 
 instruction_text = """## 1. Tree Structure
 
@@ -44,6 +51,12 @@ Enter the structure using layers separated by '|' symbols:
 
 ← → Step backward/forward through the algorithm
 ⟪ ⟫ Jump to start/end of simulation
+▶ Play the simulation automatically at the speed (steps per second) set next to it
+
+After clicking on the tree, the keyboard can be used as well:
+- Left/Right arrow: Step backward/forward (hold for fast stepping)
+- Home/End: Jump to start/end of simulation
+- Space: Start/stop playing
 
 ## Navigation
 
@@ -59,7 +72,7 @@ Enter the structure using layers separated by '|' symbols:
 - Numbers: Node values and α-β bounds"""
 
 
-class AB_Pruning(Module):
+class AB_Pruning(TreeDrawer, Module):
     """
     Main module class for the Alpha-Beta Pruning visualization.
 
@@ -76,14 +89,25 @@ class AB_Pruning(Module):
     __category_key__ = "search"
     __short_description__ = "Visualize the alpha-beta pruning algorithm on a game tree."
 
-    node_radius: int = 30
     tree_structure_lst: Optional[List[List[int]]] = None
     leaf_values_lst: Optional[List[float]] = None
+    simulator: Optional[AlphaBetaSimulator] = None
 
     def __init__(self, app: "App") -> None:
         super().__init__(app)
+        self._play_id: Optional[str] = None
+        self._play_time = 0.0
+        self._play_credit = 0.0
         self.create_widgets()
 
+    def suspend(self) -> None:
+        self.stop_autoplay()
+        super().suspend()
+
+    def destroy(self) -> None:
+        self.stop_autoplay()
+        super().destroy()
+
     def create_widgets(self):
         """
         Creates and arranges all GUI components including:
@@ -156,6 +180,14 @@ class AB_Pruning(Module):
         self.canvas = MovableCanvas(self, bg="white")
         self.canvas.pack(fill=tk.BOTH, expand=True)
 
+        # keyboard stepping, the canvas takes focus when clicked
+        self.canvas.bind("<ButtonPress-1>", lambda ev: self.canvas.focus_set(), add=True)
+        self.canvas.bind("<Right>", lambda ev: self.run_simulator("forward"))
+        self.canvas.bind("<Left>", lambda ev: self.run_simulator("backward"))
+        self.canvas.bind("<End>", lambda ev: self.run_simulator("all_forward"))
+        self.canvas.bind("<Home>", lambda ev: self.run_simulator("all_backward"))
+        self.canvas.bind("<space>", lambda ev: self.toggle_autoplay())
+
         # simulation controls frame
         sim_frame = ttk.Frame(self.widget_frame)
         sim_frame.grid(
@@ -168,22 +200,42 @@ class AB_Pruning(Module):
             sticky="sew",
         )
 
-        self.all_backward_button = ttk.Button(sim_frame, text="⟪")
+        self.all_backward_button = ttk.Button(sim_frame, text="⟪", command=lambda: self.run_simulator("all_backward"))
         self.all_backward_button.grid(row=1, column=0, padx=(0, 5), sticky=tk.EW)
 
-        self.all_forward_button = ttk.Button(sim_frame, text="⟫")
-        self.all_forward_button.grid(row=1, column=3, sticky=tk.EW)
+        self.all_forward_button = ttk.Button(sim_frame, text="⟫", command=lambda: self.run_simulator("all_forward"))
+        self.all_forward_button.grid(row=1, column=3, padx=(0, 5), sticky=tk.EW)
 
-        self.backward_button = ttk.Button(sim_frame, text="←")
+        self.backward_button = ttk.Button(sim_frame, text="←", command=lambda: self.run_simulator("backward"))
         self.backward_button.grid(row=1, column=1, padx=(0, 5), sticky=tk.EW)
 
-        self.forward_button = ttk.Button(sim_frame, text="→")
+        self.forward_button = ttk.Button(sim_frame, text="→", command=lambda: self.run_simulator("forward"))
         self.forward_button.grid(row=1, column=2, padx=(0, 5), sticky=tk.EW)
 
+        # auto-play with its speed in steps per second
+        self.play_button = ttk.Button(sim_frame, text="▶", command=self.toggle_autoplay)
+        self.play_button.grid(row=1, column=4, padx=(0, 5), sticky=tk.EW)
+
+        self.play_speed = tk.StringVar(value=str(DEFAULT_PLAY_SPEED))
+        ttk.Label(sim_frame, text="Steps/s:", font=tkFont.Font(size=10)).grid(row=0, column=5, sticky=tk.W)
+        self.play_speed_input = ttk.Spinbox(
+            sim_frame, values=PLAY_SPEEDS, textvariable=self.play_speed, width=6, font=tkFont.Font(size=10)
+        )
+        self.play_speed_input.grid(row=1, column=5, sticky=tk.EW)
+
         # Configure grid weights for resizing
         self.widget_frame.columnconfigure(1, weight=1)
         self.widget_frame.columnconfigure(3, weight=1)
-        sim_frame.columnconfigure((0, 1, 2, 3), weight=1)
+        sim_frame.columnconfigure((0, 1, 2, 3, 4), weight=1)
+
+    def draw_tree(self, app_node: TreeNode, radius: int, *args, **kwargs) -> None:
+        """
+        Draws the tree in the next frame of the App's redraw scheduler.
+
+        The simulator calls this after every step, so fast stepping draws only the latest state
+        of the tree once per frame. The arguments are the same as in TreeDrawer.draw_tree.
+        """
+        self.request_redraw(super().draw_tree, app_node, radius, *args, **kwargs)
 
     def validate_input(self) -> None:
         """
@@ -196,63 +248,16 @@ class AB_Pruning(Module):
 
         Updates the visualization if valid, shows error indicators if invalid.
         """
-        tree_structure_str: str = self.tree_structure.get()
-        leaf_values_str: str = self.leaf_values.get()
-
-        is_valid: bool = True
-
-        # validate tree structure input
-        tree_structure_lst: List[List[int]] = []
-        layers = tree_structure_str.split("|")
-        expected_no_nodes: int = 1
-
-        for _, layer in enumerate(layers):
-            tree_structure_lst.append([])
-            layer_degrees = layer.split(",")
-            # degree counts from upper layers should match with current layer
-            if len(layer_degrees) != expected_no_nodes:
-                is_valid = False
-
-            degree_count = 0
-            # each degree must be an (positive) integer
-            for deg in layer_degrees:
-                if deg.isnumeric() and int(deg) > 0:
-                    degree_count += int(deg)
-                    tree_structure_lst[-1].append(int(deg))
-                else:
-                    is_valid = False
-            expected_no_nodes = degree_count
-
-        tree_str_valid = is_valid
-
-        leaf_values = []
-        leafs = leaf_values_str.split(",")
-        # number of leafs should match degree count from last layer
-        if len(leafs) != expected_no_nodes:
-            is_valid = False
-
-        def is_number(s):
-            """Helper function to check if a string represents a valid number"""
-            try:
-                float(s)
-                return True
-            except ValueError:
-                return False
-
-        for _, leaf in enumerate(leafs):
-            if not is_number(leaf):
-                is_valid = False
-            else:
-                leaf_values.append(float(leaf))
-
-        if is_valid:
+        tree_structure_lst, leaf_values = parse_tree_input(self.tree_structure.get(), self.leaf_values.get())
+
+        if tree_structure_lst is not None and leaf_values is not None:
             print("input is valid!")
             self.tree_structure_lst = tree_structure_lst
             self.leaf_values_lst = leaf_values
             self.prepare_simulator()
         else:
             print("input is not valid!")
-            self.invalid_input(tree_str_valid)
+            self.invalid_input(tree_structure_lst is not None)
 
     def invalid_input(self, tree_str_valid: bool) -> None:
         """
@@ -278,6 +283,7 @@ class AB_Pruning(Module):
         if not self.tree_structure_lst or not self.leaf_values_lst:
             return
 
+        self.stop_autoplay()
         app_node = TreeNode.generate_tree(self.tree_structure_lst, self.leaf_values_lst)
 
         # fixed margin
@@ -287,216 +293,82 @@ class AB_Pruning(Module):
         app_node.set_position(margin_x, margin_y, margin_x, margin_y)
         app_node.center_node(app_node.x - self.canvas.winfo_width() / 2, 0)
 
+        self.canvas.reset_view()
         self.canvas.xview_moveto(0)
         self.canvas.yview_moveto(0)
 
         # draw initial tree
         self.draw_tree(app_node, self.node_radius)
 
-        alpha_beta_simulator = AlphaBetaSimulator(self, app_node)
-
-        # set buttons for controlling simulation
-        self.backward_button.config(command=alpha_beta_simulator.backward)
-        self.forward_button.config(command=alpha_beta_simulator.forward)
-
-        self.all_backward_button.config(command=alpha_beta_simulator.all_backward)
-        self.all_forward_button.config(command=alpha_beta_simulator.all_forward)
-
-    def draw_tree(
-        self,
-        app_node: "TreeNode",
-        radius: int,
-        parent_x: Optional[float] = None,
-        parent_y: Optional[float] = None,
-        marked_node: Optional["TreeNode"] = None,
-        cutoffs: Optional[List[Tuple["TreeNode", int]]] = None,
-        cutoff: bool = False,
-        is_prop_up: Optional[bool] = None,
-    ) -> None:
-        """
-        Draws the complete tree visualization on the canvas.
-
-        Args:
-            app_node: Root node of the tree
-            radius: Radius for drawing nodes
-            parent_x: X coordinate of parent node (None for root)
-            parent_y: Y coordinate of parent node (None for root)
-            marked_node: Currently highlighted node in simulation
-            cutoffs: List of nodes where pruning occurred
-            cutoff: Whether current branch is pruned
-            is_prop_up: Whether values are being propagated up the tree
-        """
-        # clear canvas
-        if parent_x is None and parent_y is None:
-            self.canvas.delete("all")
-
-        self.draw_separators(app_node)
-        self.draw_nodes(
-            app_node,
-            radius,
-            parent_x,
-            parent_y,
-            marked_node,
-            cutoffs,
-            cutoff,
-            is_prop_up,
-        )
+        # the simulation controls and keys step this simulator
+        self.simulator = AlphaBetaSimulator(self, app_node)
+        self.canvas.focus_set()
 
-    def draw_nodes(
-        self,
-        node: "TreeNode",
-        radius: int,
-        parent_x: Optional[float] = None,
-        parent_y: Optional[float] = None,
-        marked_node: Optional["TreeNode"] = None,
-        cutoffs: Optional[List[Tuple["TreeNode", int]]] = None,
-        cutoff: bool = False,
-        is_prop_up: Optional[bool] = None,
-    ) -> None:
+    def run_simulator(self, method: str) -> None:
         """
-        Recursively draws nodes and connections in the tree.
+        Stops auto-play and executes a simulation control.
 
         Args:
-            node: Current node to draw
-            radius: Radius for drawing nodes
-            parent_x: X coordinate of parent node
-            parent_y: Y coordinate of parent node
-            marked_node: Currently highlighted node
-            cutoffs: List of pruning points
-            cutoff: Whether current branch is pruned
-            is_prop_up: Whether values are being propagated up
+            method (str): Name of the AlphaBetaSimulator method to call: forward, backward,
+                all_forward or all_backward
         """
-        # connect node with parent
-        if parent_x is not None and parent_y is not None:
-            self.canvas.create_line(parent_x, parent_y, node.x, node.y, width=1, fill="black")
-
-        # draw cutoff line
-        if cutoff and parent_x is not None and parent_y is not None:
-            self.draw_perpendicular_line(parent_x, parent_y, node.x, node.y)
-
-        for i, child in enumerate(node.children):
-            # determine if there is a cutoff
-            cutoff = False
-            for cutoff_pair in cutoffs or []:
-                if cutoff_pair[0] == node and cutoff_pair[1] <= i:
-                    cutoff = True
-
-            self.draw_nodes(child, radius, node.x, node.y, marked_node, cutoffs, cutoff, is_prop_up)
-
-        # draw node as triangle
-        color = "olivedrab1" if node == marked_node else ("light sky blue" if node.is_max else "IndianRed1")
-        v_max = [
-            node.x,
-            node.y - 0.866 * radius,
-            node.x - radius,
-            node.y + radius,
-            node.x + radius,
-            node.y + radius,
-        ]
-        v_min = [
-            node.x - radius,
-            node.y - radius,
-            node.x + radius,
-            node.y - radius,
-            node.x,
-            node.y + 0.866 * radius,
-        ]
-        vertices = v_max if node.is_max else v_min
-
-        self.canvas.create_polygon(vertices, fill=color)
-
-        # draw node value
-        text_color = "red" if node == marked_node else "black"
-        text_yoffset = (0.2 if node.is_max else -0.2) * radius
-        self.canvas.create_text(
-            node.x,
-            node.y + text_yoffset,
-            text=node.value_string(),
-            font=("Arial", 10, "bold"),
-            fill=text_color,
-        )
-
-        # draw alpha beta values
-        display_eq = is_prop_up and node == marked_node
-        self.canvas.create_text(
-            node.x,
-            node.y - 1.5 * self.node_radius,
-            text=node.alpha_beta_string(display_eq),
-            font=("Arial", 10, "bold"),
-            fill=text_color,
-        )
+        self.stop_autoplay()
+        if self.simulator is not None:
+            getattr(self.simulator, method)()
+
+    def toggle_autoplay(self) -> None:
+        """Starts auto-play, from the beginning if the simulation is over, or stops it."""
+        if self._play_id is not None:
+            self.stop_autoplay()
+            return
+        if self.simulator is None:
+            return
 
-    def draw_perpendicular_line(self, x1: float, y1: float, x2: float, y2: float, length: float = 10) -> None:
+        if self.simulator.over:
+            self.simulator.all_backward()
+        self._play_time = time.perf_counter()
+        # the first step is made right away
+        self._play_credit = 1.0
+        self.play_button.config(text="⏸")
+        self._autoplay_step()
+
+    def stop_autoplay(self) -> None:
+        """Stops auto-play if it is running."""
+        if self._play_id is not None:
+            self.after_cancel(self._play_id)
+            self._play_id = None
+        self.play_button.config(text="▶")
+
+    def play_rate(self) -> float:
+        """Returns the auto-play speed in steps per second from the speed box."""
+        try:
+            rate = float(self.play_speed.get())
+        except ValueError:
+            return DEFAULT_PLAY_SPEED
+        return rate if rate > 0 else DEFAULT_PLAY_SPEED
+
+    def _autoplay_step(self) -> None:
         """
-        Draws a perpendicular line to indicate pruning.
+        Executes the steps due since the previous timer and schedules the next one.
 
-        Args:
-            x1, y1: Start coordinates of the original line
-            x2, y2: End coordinates of the original line
-            length: Length of the perpendicular line
+        Timers never fire more often than once per frame, so at speeds above the frame rate
+        several steps are executed per timer and the tree is drawn once. The number of steps
+        follows the time that actually passed, so playback keeps its speed when timers are late;
+        after a long pause (e.g. while the window is dragged) it continues without catching up.
         """
-        # direction of the original line
-        dx = x2 - x1
-        dy = y2 - y1
+        self._play_id = None
+        assert self.simulator is not None
 
-        # perpendicular direction
-        perp_dx = -dy
-        perp_dy = dx
+        rate = self.play_rate()
+        now = time.perf_counter()
+        self._play_credit = min(self._play_credit + (now - self._play_time) * rate, max(rate, 1.0))
+        self._play_time = now
 
-        # normalize perpendicular direction
-        perp_length = (perp_dx**2 + perp_dy**2) ** 0.5
-        perp_dx /= perp_length
-        perp_dy /= perp_length
+        steps = int(self._play_credit)
+        self._play_credit -= steps
+        self.simulator.forward_steps(steps)
 
-        # calculate endpoints of the perpendicular line
-        x_center = x1 + (x2 - x1) / 2
-        y_center = y1 + (y2 - y1) / 2
-
-        perp_x1 = x_center + perp_dx * length
-        perp_y1 = y_center + perp_dy * length
-        perp_x2 = x_center - perp_dx * length
-        perp_y2 = y_center - perp_dy * length
-
-        # draw perpendicular line
-        self.canvas.create_line(perp_x1, perp_y1, perp_x2, perp_y2, width=4, fill="red")
-
-    def draw_separators(self, app_node: "TreeNode") -> None:
-        """
-        Draws horizontal separators between tree layers and labels them.
-
-        Args:
-            app_node: Root node of the tree
-        """
-        padding: int = 75
-        text_padding: int = 60
-
-        set_x: Set[float] = set()
-        set_y: Set[float] = set()
-        app_node.get_possible_coords(set_x, set_y)
-
-        min_x, max_x = min(set_x) - padding, max(set_x) + padding
-        list_y = sorted(list(set_y))
-
-        # draw separator between each layer
-        for i in range(1, len(list_y)):
-            y1, y2 = list_y[i - 1], list_y[i]
-            y_line = (y1 + y2) / 2
-            self.canvas.create_line(
-                min_x - padding,
-                y_line,
-                max_x + padding,
-                y_line,
-                dash=(4, 2),
-                fill="black",
-            )
-
-        # draw layer type
-        for i, layer_y in enumerate(list_y):
-            text = "MAX" if i % 2 == 0 else "MIN"
-            self.canvas.create_text(
-                max_x + text_padding,
-                layer_y,
-                text=text,
-                font=("Arial", 12, "bold"),
-                fill="black",
-            )
+        if self.simulator.over:
+            self.stop_autoplay()
+        else:
+            self._play_id = self.after(max(round(1000 / rate), FRAME_MS), self._autoplay_step)
@@ -1,13 +1,44 @@
-from typing import Dict, List, Set, Tuple, FrozenSet
+from typing import Any, Dict, List, Optional, Set, Tuple, FrozenSet
+import functools
 import itertools
+import logging
 import networkx as nx
 import random
 
+from matplotlib.axes import Axes  # type: ignore
+from matplotlib.collections import PathCollection  # type: ignore
+from matplotlib.figure import Figure  # type: ignore
+from matplotlib.text import Text  # type: ignore
+
 BLUE = "#0020A1"
 GREEN = "#00FF00"
 YELLOW = "#FFFF00"
 RED = "#FF1C6F"
 
+# Area of the drawn node circles in points squared (node_size of nx.draw)
+NODE_SIZE = 700
+
+# Node layouts that can be selected; layered draws the DAG's topological generations as rows
+LAYOUTS: Tuple[str, ...] = ("circular", "layered", "spring")
+DEFAULT_LAYOUT = "circular"
+DEFAULT_LAYOUT_SEED = 0
+# The layered layout puts edges that skip generations on top of other edges, so they are drawn as arcs
+EDGE_STYLES: Dict[str, str] = {"layered": "arc3,rad=0.2"}
+# Number of (graph, layout) positions kept by get_layout
+LAYOUT_CACHE_SIZE = 32
+
+# Nodes and edges of a graph in insertion order, see graph_fingerprint
+GraphFingerprint = Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...]]
+
+# Intermediate steps of find_d_separating_sets are logged at DEBUG level
+logger = logging.getLogger(__name__)
+
+default_adjacency_matrix: str = """A B
+A C
+B D
+B E
+C E"""
+
 
 class GraphNode:
     def __init__(self, name: str) -> None:
@@ -91,7 +122,7 @@ def find_d_separating_sets(nx_graph: nx.DiGraph, node1: str, node2: str) -> Set[
     S_P_sets: List[Set[FrozenSet[str]]] = []
     for path in undirected_paths:
         S_P: Set[FrozenSet[str]] = set()
-        print("Path: ", path)
+        logger.debug("Pot: %s", path)
         for node in path:
             if node in {node1, node2}:
                 continue
@@ -106,19 +137,19 @@ def find_d_separating_sets(nx_graph: nx.DiGraph, node1: str, node2: str) -> Set[
             elif node_type == "convergent":
                 S_X = get_subsets_excluding_node_and_descendants(all_nodes, node, descendants)
             else:
-                print("burek")
+                logger.debug("Vozišče %s na poti nima tipa", node)
                 continue
 
-            print("Vozišče: ", node, ", Tip: ", node_type, ", Množice: ", S_X)
+            logger.debug("Vozišče: %s, Tip: %s, Množice: %s", node, node_type, S_X)
 
             S_P.update(frozenset(subset) for subset in S_X)
 
-        print("Množice, ki d-ločujejo izbrani vozlišči, glede na pot: ", S_P)
+        logger.debug("Množice, ki d-ločujejo izbrani vozlišči, glede na pot: %s", S_P)
         S_P_sets.append(S_P)
 
     E = set.intersection(*S_P_sets) if S_P_sets else set()
     E = {tuple(sorted(s)) for s in E}
-    print("KONČNA REŠITEV: ", E, "\n")
+    logger.debug("KONČNA REŠITEV: %s", E)
     return E
 
 
@@ -150,3 +181,256 @@ def get_random_adjacency_matrix() -> str:
 
     # Convert to adjacency matrix string format
     return "\n".join(f"{parent} {child}" for parent, child in edges)
+
+
+def validate_adjacency_input(text: str) -> bool:
+    """Validate the adjacency matrix input text.
+
+    Args:
+        text: The input text to validate
+
+    Returns:
+        bool: True if input is valid, False otherwise
+    """
+    valid_chars: Set[str] = set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz1234567890 ")
+    for line in text.strip().split("\n"):
+        if not set(line).issubset(valid_chars):
+            return False
+
+        parts: List[str] = line.split()
+        if len(parts) != 2:
+            return False
+
+        from_node, to_node = parts
+        if not from_node or not to_node:
+            return False
+
+    return True
+
+
+def parse_adjacency_input(input_text: str) -> Dict[str, List[str]]:
+    """Parse the adjacency matrix input text into a dictionary representation.
+
+    Args:
+        input_text: The input text containing the adjacency matrix
+
+    Returns:
+        dict: Dictionary mapping source nodes to lists of target nodes
+    """
+    adjacency_matrix: Dict[str, List[str]] = {}
+    for line in input_text.strip().split("\n"):
+        from_node, to_node = line.split()
+        if from_node in adjacency_matrix:
+            adjacency_matrix[from_node].append(to_node)
+        else:
+            adjacency_matrix[from_node] = [to_node]
+    return adjacency_matrix
+
+
+def build_graph(adj_matrix: Dict[str, List[str]]) -> DSeparationGraph:
+    """Build a graph from a dictionary mapping source nodes to lists of target nodes."""
+    graph: DSeparationGraph = DSeparationGraph()
+
+    unique_nodes: Set[str] = set()
+    for from_node, to_nodes in adj_matrix.items():
+        if from_node not in unique_nodes:
+            graph.add_node(from_node)
+            unique_nodes.add(from_node)
+        for to_node in to_nodes:
+            if to_node not in unique_nodes:
+                graph.add_node(to_node)
+                unique_nodes.add(to_node)
+            graph.add_edge(from_node, to_node)
+
+    return graph
+
+
+def graph_fingerprint(graph: nx.DiGraph) -> GraphFingerprint:
+    """Return the nodes and edges of a graph as a hashable key.
+
+    The order of the nodes is kept, because the circular layout depends on it.
+    """
+    return tuple(graph.nodes), tuple(graph.edges)
+
+
+@functools.lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def _layout(fingerprint: GraphFingerprint, layout: str, seed: Optional[int]) -> Dict[str, Tuple[float, float]]:
+    nodes, edges = fingerprint
+    graph: nx.DiGraph = nx.DiGraph()
+    graph.add_nodes_from(nodes)
+    graph.add_edges_from(edges)
+
+    if layout == "circular":
+        return nx.circular_layout(graph)
+    if layout == "spring":
+        return nx.spring_layout(graph, seed=seed)
+    if layout == "layered":
+        for layer, generation in enumerate(nx.topological_generations(graph)):
+            for node in generation:
+                graph.nodes[node]["layer"] = layer
+        pos = nx.multipartite_layout(graph, subset_key="layer", align="horizontal")
+        # the first generation (nodes without parents) at the top
+        return {node: p * (1, -1) for node, p in pos.items()}
+    raise ValueError(f"Unknown layout {layout!r}, choose from: {', '.join(LAYOUTS)}")
+
+
+def get_layout(
+    graph: nx.DiGraph, layout: str = DEFAULT_LAYOUT, seed: int = DEFAULT_LAYOUT_SEED
+) -> Dict[str, Tuple[float, float]]:
+    """Compute the position of every node with one of the LAYOUTS.
+
+    Positions are cached per graph fingerprint, so laying out the same graph again is free;
+    the returned dictionary is shared and must not be modified. Safe to call from another
+    thread, the graph is not used after its fingerprint is taken.
+
+    Args:
+        graph: A directed acyclic graph
+        layout: Name of the layout
+        seed: Seed of the spring layout, ignored by the other layouts
+
+    Returns:
+        Dict[str, Tuple[float, float]]: Position of every node
+    """
+    return _layout(graph_fingerprint(graph), layout, seed if layout == "spring" else None)
+
+
+def label_color(node_color: str) -> str:
+    """Return the color of a node's label, which contrasts with the node's color."""
+    if node_color == BLUE:
+        return GREEN
+    if node_color == GREEN:
+        return BLUE
+    return RED
+
+
+class GraphDrawing:
+    """The artists of a drawn graph.
+
+    The nodes, edges and labels are created once per graph. Selection and highlighting only
+    recolor them with update, so a change costs a recolor instead of drawing the graph again.
+    """
+
+    def __init__(
+        self,
+        fig: Figure,
+        ax: Axes,
+        G: DSeparationGraph,
+        pos: Dict[str, Tuple[float, float]],
+        connectionstyle: str = "arc3",
+    ) -> None:
+        """Draw the graph on the axes.
+
+        Args:
+            fig: Figure of the axes, its layout is tightened
+            ax: Axes to draw on; it is cleared first
+            G: The graph to draw, update uses its node colors
+            pos: Position of every node
+            connectionstyle: Matplotlib connection style of the edges, see EDGE_STYLES
+        """
+        self.G = G
+        ax.clear()
+        # as nx.draw does: white figure, and the axes (with their background) hidden
+        fig.set_facecolor("w")
+        ax.set_axis_off()
+
+        self.nodes: PathCollection = nx.draw_networkx_nodes(
+            G.graph, pos, node_color=G.get_node_colors(), node_size=NODE_SIZE, ax=ax
+        )
+        nx.draw_networkx_edges(
+            G.graph, pos, edge_color="black", node_size=NODE_SIZE, connectionstyle=connectionstyle, ax=ax
+        )
+        if connectionstyle != "arc3" and pos:
+            # arcs bulge to one side and would push the nodes off the center of the view
+            for axis, get_lim, set_lim in ((0, ax.get_xlim, ax.set_xlim), (1, ax.get_ylim, ax.set_ylim)):
+                values = [p[axis] for p in pos.values()]
+                center = (min(values) + max(values)) / 2
+                half = max(abs(limit - center) for limit in get_lim())
+                set_lim(center - half, center + half)
+
+        # Labels are drawn manually, so that their colors can be set per node
+        self.labels: Dict[str, Text] = {
+            node: ax.text(
+                x,
+                y,
+                node,
+                color=label_color(G.nodes[node].color),
+                fontsize=10,
+                ha="center",
+                va="center",
+                fontweight="bold",
+            )
+            for node, (x, y) in pos.items()
+        }
+
+        fig.tight_layout()
+
+        props: Dict[str, Any] = dict(boxstyle="square", facecolor=YELLOW, alpha=0.5)
+        self.sets_text: Text = ax.text(
+            0.05,
+            0.95,
+            "",
+            transform=ax.transAxes,
+            fontsize=10,
+            color=RED,
+            fontweight="bold",
+            verticalalignment="top",
+            bbox=props,
+            visible=False,
+        )
+
+    def update(
+        self, d_separating_sets: Optional[List[Tuple[str, ...]]] = None, separated_nodes: Optional[List[str]] = None
+    ) -> None:
+        """Apply the current node colors and show or hide the d-separation information.
+
+        Args:
+            d_separating_sets: List of d-separating sets to display
+            separated_nodes: The pair of nodes being d-separated
+        """
+        self.nodes.set_facecolor(self.G.get_node_colors())
+        for node, label in self.labels.items():
+            label.set_color(label_color(self.G.nodes[node].color))
+
+        if d_separating_sets is None or separated_nodes is None:
+            self.sets_text.set_visible(False)
+            return
+
+        d_separating_sets.sort(key=len)
+        textstr: str = "D-Separating Sets of " + separated_nodes[0] + " and " + separated_nodes[1] + ":\n"
+        if len(d_separating_sets) == 0:
+            textstr += "No D-Separating Sets\n"
+        for _, s in enumerate(d_separating_sets):
+            if s == tuple():
+                textstr += "∅\n"
+            textstr += "{" + ", ".join(s) + "}\n"
+
+        self.sets_text.set_text(textstr)
+        self.sets_text.set_visible(True)
+
+
+def draw_graph(
+    fig: Figure,
+    ax: Axes,
+    G: DSeparationGraph,
+    pos: Dict[str, Tuple[float, float]],
+    d_separating_sets: Optional[List[Tuple[str, ...]]] = None,
+    separated_nodes: Optional[List[str]] = None,
+    connectionstyle: str = "arc3",
+) -> GraphDrawing:
+    """Draw the graph with current node colors and optional d-separation information.
+
+    Args:
+        fig: Figure of the axes, its layout is tightened
+        ax: Axes to draw on; it is cleared first
+        G: The graph to draw
+        pos: Position of every node
+        d_separating_sets: List of d-separating sets to display
+        separated_nodes: The pair of nodes being d-separated
+        connectionstyle: Matplotlib connection style of the edges, see EDGE_STYLES
+
+    Returns:
+        GraphDrawing: The drawing, which can be updated when the colors change
+    """
+    drawing = GraphDrawing(fig, ax, G, pos, connectionstyle)
+    drawing.update(d_separating_sets, separated_nodes)
+    return drawing
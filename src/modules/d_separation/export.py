@@ -0,0 +1,75 @@
+"""A directed acyclic graph with the sets that d-separate two of its nodes."""
+
+import argparse
+import random
+
+import networkx as nx  # type: ignore
+from matplotlib.axes import Axes  # type: ignore
+from matplotlib.figure import Figure  # type: ignore
+
+from .d_separation import (
+    DEFAULT_LAYOUT,
+    DEFAULT_LAYOUT_SEED,
+    EDGE_STYLES,
+    LAYOUTS,
+    YELLOW,
+    build_graph,
+    default_adjacency_matrix,
+    draw_graph,
+    find_d_separating_sets,
+    get_layout,
+    get_random_adjacency_matrix,
+    parse_adjacency_input,
+    validate_adjacency_input,
+)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--edges", help='file with one edge "A B" per line (default: the module\'s example graph)')
+    source.add_argument("--random", action="store_true", help="generate a random graph")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the random graph")
+    parser.add_argument("--layout", choices=LAYOUTS, default=DEFAULT_LAYOUT, help="placement of the nodes")
+    parser.add_argument(
+        "--layout-seed", type=int, default=DEFAULT_LAYOUT_SEED, help="seed of the spring layout (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--nodes", default=None, help="two nodes as A,B; their d-separating sets are listed and the smallest is colored"
+    )
+
+
+def render(args: argparse.Namespace, fig: Figure, ax: Axes) -> None:
+    if args.random:
+        if args.seed is not None:
+            random.seed(args.seed)
+        text = get_random_adjacency_matrix()
+    elif args.edges:
+        with open(args.edges, encoding="utf-8") as f:
+            text = f.read()
+    else:
+        text = default_adjacency_matrix
+
+    if not validate_adjacency_input(text):
+        raise ValueError("invalid adjacency matrix")
+    G = build_graph(parse_adjacency_input(text))
+    if not nx.is_directed_acyclic_graph(G.graph):
+        raise ValueError("the graph must be directed and acyclic")
+
+    fig.set_size_inches(8, 8)
+    fig.patch.set_facecolor("black")
+    ax.set_facecolor("black")
+    pos = get_layout(G.graph, args.layout, args.layout_seed)
+    connectionstyle = EDGE_STYLES.get(args.layout, "arc3")
+
+    if args.nodes is None:
+        draw_graph(fig, ax, G, pos, connectionstyle=connectionstyle)
+        return
+
+    separated_nodes = [node.strip() for node in args.nodes.split(",")]
+    if len(separated_nodes) != 2 or not all(node in G.nodes for node in separated_nodes):
+        raise ValueError(f"--nodes must be two nodes of the graph, got {args.nodes!r}")
+    # like the first frame of the module's highlighting: the smallest set is colored
+    sets = sorted(find_d_separating_sets(G.graph, *separated_nodes), key=len)
+    for node in sets[0] if sets else ():
+        G.nodes[node].color = YELLOW
+    draw_graph(fig, ax, G, pos, sets, separated_nodes, connectionstyle)
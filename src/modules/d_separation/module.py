@@ -1,3 +1,5 @@
+import threading
+from concurrent.futures import Future
 from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Any
 import numpy as np
 import tkinter as tk
@@ -5,8 +7,10 @@ import tkinter.ttk as ttk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg  # type: ignore
 import networkx as nx  # type: ignore
 import tkinter.messagebox as msgbox
-import matplotlib.pyplot as plt  # type: ignore
+from matplotlib.axes import Axes  # type: ignore
+from matplotlib.figure import Figure  # type: ignore
 
+from common.figures import create_figure, release_figure
 from common.module import Module
 from .d_separation import (
     DSeparationGraph,
@@ -14,18 +18,27 @@ from .d_separation import (
     GREEN,
     YELLOW,
     BLUE,
-    RED,
+    NODE_SIZE,
+    LAYOUTS,
+    DEFAULT_LAYOUT,
+    DEFAULT_LAYOUT_SEED,
+    EDGE_STYLES,
+    GraphDrawing,
+    build_graph,
+    default_adjacency_matrix,
+    get_layout,
     get_random_adjacency_matrix,
+    parse_adjacency_input,
+    validate_adjacency_input,
 )
 
 if TYPE_CHECKING:
     from common.app import App
 
-default_adjacency_matrix: str = """A B
-A C
-B D
-B E
-C E"""
+# Graphs with more nodes are laid out in a background thread
+BACKGROUND_LAYOUT_NODES = 50
+# How often to check whether a background layout is done, in milliseconds
+LAYOUT_POLL_MS = 20
 
 instructions: str = """# Instructions
 1. Graph Creation
@@ -33,6 +46,8 @@ instructions: str = """# Instructions
    - Each line represents a directed edge from node A to node B
    - Click "Generate Graph" to create the graph
    - Click "Randomize" to generate a random graph
+   - Choose how the nodes are placed: circular, layered (parents above their children)
+     or spring (the seed next to it gives a different arrangement)
 
 2. Node Selection
    - Click on nodes to select them (they will turn green)
@@ -74,8 +89,13 @@ class D_Separation(Module):
         self.active_nodes: List[str] = []
         self.data: np.ndarray = np.array([]).reshape(0, 2)
         self.pos: Dict[str, Tuple[float, float]] = {}
-        self.fig: plt.Figure
-        self.ax: plt.Axes
+        self.node_names: List[str] = []
+        self.node_positions: np.ndarray = np.empty((0, 2))
+        self.drawing: Optional[GraphDrawing] = None
+        self.shown_sets: Tuple[Optional[List[Tuple[str, ...]]], Optional[List[str]]] = (None, None)
+        self._layout_after_id: Optional[str] = None
+        self.fig: Figure
+        self.ax: Axes
         self.canvas: FigureCanvasTkAgg
         self.canvas_widget: tk.Widget
         self.adj_matrix_input: tk.Text
@@ -86,7 +106,8 @@ class D_Separation(Module):
     def destroy(self) -> None:
         """Clean up resources when the module is destroyed."""
         self.cancel_highlight()
-        plt.close()
+        self.cancel_layout()
+        release_figure(self.fig)
         self.canvas_widget.destroy()
         super().destroy()
 
@@ -130,7 +151,22 @@ class D_Separation(Module):
         )
         btn_d_separation.grid(row=0, column=2, padx=5, pady=5, sticky="nsew")
 
-        self.fig, self.ax = plt.subplots(figsize=(8, 8))
+        # Layout selection, changing it lays out the current graph again
+        self.layout_var: tk.StringVar = tk.StringVar(value=DEFAULT_LAYOUT)
+        layout_input: ttk.Combobox = ttk.Combobox(
+            btn_frame, textvariable=self.layout_var, values=LAYOUTS, state="readonly", width=10
+        )
+        layout_input.grid(row=0, column=3, padx=5, pady=5, sticky="nsew")
+        layout_input.bind("<<ComboboxSelected>>", lambda event: self.relayout())
+
+        self.seed_var: tk.StringVar = tk.StringVar(value=str(DEFAULT_LAYOUT_SEED))
+        seed_input: ttk.Spinbox = ttk.Spinbox(
+            btn_frame, textvariable=self.seed_var, from_=0, to=9999, width=5, command=self.relayout
+        )
+        seed_input.grid(row=0, column=4, padx=5, pady=5, sticky="nsew")
+        seed_input.bind("<Return>", lambda event: self.relayout())
+
+        self.fig, self.ax = create_figure(figsize=(8, 8))
         self.fig.patch.set_facecolor("black")
         self.ax.set_facecolor("black")
         self.canvas = FigureCanvasTkAgg(self.fig, master=self)
@@ -149,8 +185,6 @@ class D_Separation(Module):
         # Stop highlighting
         self.cancel_highlight()
 
-        _G: DSeparationGraph = DSeparationGraph()
-
         match randomize:
             case True:
                 adj_matrix_str: str = get_random_adjacency_matrix()
@@ -164,27 +198,95 @@ class D_Separation(Module):
                     return
                 adj_matrix = self.parse_adjacency_input(input_text)
 
-        unique_nodes: Set[str] = set()
-        for from_node, to_nodes in adj_matrix.items():
-            if from_node not in unique_nodes:
-                _G.add_node(from_node)
-                unique_nodes.add(from_node)
-            for to_node in to_nodes:
-                if to_node not in unique_nodes:
-                    _G.add_node(to_node)
-                    unique_nodes.add(to_node)
-                _G.add_edge(from_node, to_node)
+        _G: DSeparationGraph = build_graph(adj_matrix)
 
         if not nx.is_directed_acyclic_graph(_G.graph):
             msgbox.showerror("Invalid Input", "The graph must be directed and acyclic.")
             return
 
-        self.pos = nx.circular_layout(_G.graph)
-        self.G = _G
-        self.active_nodes = []
+        self.layout_graph(_G)
+
+    def layout_seed(self) -> int:
+        """Return the seed of the spring layout entered by the user."""
+        try:
+            return int(self.seed_var.get())
+        except ValueError:
+            return DEFAULT_LAYOUT_SEED
+
+    def relayout(self) -> None:
+        """Lay out the current graph again with the selected layout."""
+        if self.drawing is not None:
+            self.layout_graph(self.G)
+
+    def layout_graph(self, G: DSeparationGraph) -> None:
+        """Compute the node positions of a graph with the selected layout and show it.
+
+        Positions are cached per graph, so laying out the same graph again is instant. Graphs
+        with more than BACKGROUND_LAYOUT_NODES nodes are laid out in a background thread; until
+        the layout is ready, the previous graph stays shown and interactive.
+
+        Args:
+            G: The graph to show
+        """
+        self.cancel_layout()
+        layout, seed = self.layout_var.get(), self.layout_seed()
+
+        if G.graph.number_of_nodes() <= BACKGROUND_LAYOUT_NODES:
+            self.show_graph(G, get_layout(G.graph, layout, seed), layout)
+            return
+
+        future: Future = Future()
+
+        def run() -> None:
+            try:
+                future.set_result(get_layout(G.graph, layout, seed))
+            except Exception as e:
+                future.set_exception(e)
+
+        # a daemon thread, like the module prefetch, does not keep the app from exiting
+        threading.Thread(target=run, name="d-separation-layout", daemon=True).start()
+        self.canvas_widget.configure(cursor="watch")
+        self._wait_for_layout(future, G, layout)
+
+    def _wait_for_layout(self, future: Future, G: DSeparationGraph, layout: str) -> None:
+        """Show the graph once its background layout is done, checking every LAYOUT_POLL_MS."""
+        if not future.done():
+            self._layout_after_id = self.after(LAYOUT_POLL_MS, lambda: self._wait_for_layout(future, G, layout))
+            return
 
-        # Initial graph drawing
-        self.draw_graph()
+        self._layout_after_id = None
+        self.canvas_widget.configure(cursor="")
+        self.show_graph(G, future.result(), layout)
+
+    def cancel_layout(self) -> None:
+        """Stop waiting for a background layout; it is still cached when it finishes."""
+        if self._layout_after_id is not None:
+            self.after_cancel(self._layout_after_id)
+            self._layout_after_id = None
+            self.canvas_widget.configure(cursor="")
+
+    def show_graph(self, G: DSeparationGraph, pos: Dict[str, Tuple[float, float]], layout: str) -> None:
+        """Draw a graph at the given node positions.
+
+        Args:
+            G: The graph to show; if it is the current graph, its selection and highlighting are kept
+            pos: Position of every node
+            layout: The layout the positions were computed with
+        """
+        if self.drawing is None or G is not self.G:
+            self.cancel_highlight()
+            self.G = G
+            self.active_nodes = []
+            self.shown_sets = (None, None)
+
+        self.pos = pos
+        # node positions as one array for hit-testing
+        self.node_names = list(self.pos)
+        self.node_positions = np.array([self.pos[node] for node in self.node_names]).reshape(-1, 2)
+
+        # The artists are created once per graph and layout, later changes only recolor them
+        self.drawing = GraphDrawing(self.fig, self.ax, self.G, self.pos, EDGE_STYLES.get(layout, "arc3"))
+        self.request_redraw(self.draw_graph, *self.shown_sets)
 
     def validate_input(self, text: str) -> bool:
         """Validate the adjacency matrix input text.
@@ -195,20 +297,7 @@ class D_Separation(Module):
         Returns:
             bool: True if input is valid, False otherwise
         """
-        valid_chars: Set[str] = set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz1234567890 ")
-        for line in text.strip().split("\n"):
-            if not set(line).issubset(valid_chars):
-                return False
-
-            parts: List[str] = line.split()
-            if len(parts) != 2:
-                return False
-
-            from_node, to_node = parts
-            if not from_node or not to_node:
-                return False
-
-        return True
+        return validate_adjacency_input(text)
 
     def parse_adjacency_input(self, input_text: str) -> Dict[str, List[str]]:
         """Parse the adjacency matrix input text into a dictionary representation.
@@ -219,29 +308,26 @@ class D_Separation(Module):
         Returns:
             dict: Dictionary mapping source nodes to lists of target nodes
         """
-        adjacency_matrix: Dict[str, List[str]] = {}
-        for line in input_text.strip().split("\n"):
-            from_node, to_node = line.split()
-            if from_node in adjacency_matrix:
-                adjacency_matrix[from_node].append(to_node)
-            else:
-                adjacency_matrix[from_node] = [to_node]
-        return adjacency_matrix
-
-    def point_inside_circle(
-        self, point: Tuple[float, float], circle_center: Tuple[float, float], radius: float
-    ) -> bool:
-        """Check if a point lies inside a circle.
+        return parse_adjacency_input(input_text)
+
+    def node_at(self, x: float, y: float) -> Optional[str]:
+        """Find the node drawn at a point of the canvas.
 
         Args:
-            point: Tuple of (x,y) coordinates of the point
-            circle_center: Tuple of (x,y) coordinates of circle center
-            radius: Radius of the circle
+            x: Horizontal display coordinate of the point in pixels, as in matplotlib events
+            y: Vertical display coordinate of the point in pixels
 
         Returns:
-            bool: True if point is inside circle, False otherwise
+            Optional[str]: The nearest node if the point lies inside its circle, otherwise None
         """
-        return np.sqrt((point[0] - circle_center[0]) ** 2 + (point[1] - circle_center[1]) ** 2) < radius
+        if not self.node_names:
+            return None
+
+        # NODE_SIZE is the area of the node circle in points squared
+        radius: float = np.sqrt(NODE_SIZE) / 2 * self.fig.dpi / 72
+        distances: np.ndarray = np.hypot(*(self.ax.transData.transform(self.node_positions) - (x, y)).T)
+        nearest: int = int(np.argmin(distances))
+        return self.node_names[nearest] if distances[nearest] <= radius else None
 
     def on_click(self, event: Any) -> None:
         """Handle mouse click events on the graph.
@@ -249,28 +335,26 @@ class D_Separation(Module):
         Args:
             event: The mouse click event containing click coordinates
         """
-        # Click coordinates
-        x, y = event.xdata, event.ydata
-        if x is None or y is None:  # Click was outside the axes
+        if event.xdata is None or event.ydata is None:  # Click was outside the axes
+            return
+
+        node = self.node_at(event.x, event.y)
+        if node is None:
             return
 
-        # Check each node to see if it was clicked
-        for node, position in self.pos.items():
-            if self.point_inside_circle((x, y), position, 0.1):
-                current_node = self.G.nodes[node]
-                current_node.toggle_color()
+        current_node = self.G.nodes[node]
+        current_node.toggle_color()
 
-                if current_node.color == GREEN:
-                    self.active_nodes.append(node)
-                else:
-                    self.active_nodes.remove(node)
+        if current_node.color == GREEN:
+            self.active_nodes.append(node)
+        else:
+            self.active_nodes.remove(node)
 
-                if len(self.active_nodes) > 2:
-                    oldest_active_node = self.active_nodes.pop(0)
-                    self.G.nodes[oldest_active_node].toggle_color()
+        if len(self.active_nodes) > 2:
+            oldest_active_node = self.active_nodes.pop(0)
+            self.G.nodes[oldest_active_node].toggle_color()
 
-                self.draw_graph()
-                break
+        self.request_redraw(self.draw_graph)
 
     def d_separation(self) -> None:
         """Find and display d-separating sets for the selected nodes."""
@@ -311,7 +395,7 @@ class D_Separation(Module):
             self.active_nodes.clear()
 
         if not sets:
-            self.draw_graph(d_separating_sets=list(), separated_nodes=separated_nodes)
+            self.request_redraw(self.draw_graph, d_separating_sets=list(), separated_nodes=separated_nodes)
             return
 
         current_set = sets[current_index]
@@ -320,7 +404,7 @@ class D_Separation(Module):
                 self.G.nodes[node_name].color = YELLOW
 
         # Redraw the graph with updated colors
-        self.draw_graph(sets, separated_nodes)
+        self.request_redraw(self.draw_graph, sets, separated_nodes)
 
         # Schedule the next set to be highlighted
         next_index = (current_index + 1) % len(sets)
@@ -331,68 +415,15 @@ class D_Separation(Module):
     ) -> None:
         """Draw the graph with current node colors and optional d-separation information.
 
+        Called through request_redraw, so changes made in quick succession are drawn once.
+        Only recolors the artists created by init_graph.
+
         Args:
             d_separating_sets: List of d-separating sets to display
             separated_nodes: The pair of nodes being d-separated
         """
-        self.ax.clear()
-
-        node_colors: List[str] = self.G.get_node_colors()
-
-        # Draw the graph using the node colors
-        nx.draw(
-            self.G.graph,
-            self.pos,
-            with_labels=False,
-            node_color=node_colors,
-            edge_color="black",
-            node_size=700,
-            ax=self.ax,
-        )
-
-        # Manually draw labels with specific font colors
-        for node, (x, y) in self.pos.items():
-            if self.G.nodes[node].color == BLUE:
-                font_color = GREEN
-            elif self.G.nodes[node].color == GREEN:
-                font_color = BLUE
-            else:
-                font_color = RED
-
-            self.ax.text(
-                x,
-                y,
-                node,
-                color=font_color,
-                fontsize=10,
-                ha="center",
-                va="center",
-                fontweight="bold",
-            )
-
-        self.fig.tight_layout()
-
-        if d_separating_sets is not None:
-            d_separating_sets.sort(key=len)
-            textstr: str = "D-Separating Sets of " + separated_nodes[0] + " and " + separated_nodes[1] + ":\n"
-            if len(d_separating_sets) == 0:
-                textstr += "No D-Separating Sets\n"
-            for _, s in enumerate(d_separating_sets):
-                if s == tuple():
-                    textstr += "∅\n"
-                textstr += "{" + ", ".join(s) + "}\n"
-
-            props: Dict[str, Any] = dict(boxstyle="square", facecolor=YELLOW, alpha=0.5)
-            self.ax.text(
-                0.05,
-                0.95,
-                textstr,
-                transform=self.ax.transAxes,
-                fontsize=10,
-                color=RED,
-                fontweight="bold",
-                verticalalignment="top",
-                bbox=props,
-            )
-
-        self.canvas.draw_idle()
+        if self.drawing is None:
+            return
+        self.shown_sets = (d_separating_sets, separated_nodes)
+        self.drawing.update(d_separating_sets, separated_nodes)
+        self.canvas.draw()
@@ -0,0 +1,43 @@
+"""The iris dataset in two dimensions, optionally with a test point classified by its k nearest neighbors."""
+
+import argparse
+from typing import List
+
+import numpy as np
+from matplotlib.axes import Axes  # type: ignore
+from matplotlib.figure import Figure  # type: ignore
+
+from .knn import DATA_PATH, LABELS_PATH, classify, generate_data, load_data, plot_knn
+
+
+def _point(value: str) -> List[float]:
+    coords = [float(coord) for coord in value.split(",")]
+    if len(coords) != 2:
+        raise argparse.ArgumentTypeError("expected two coordinates x,y")
+    return coords
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--point", type=_point, default=None, help="test point as x,y")
+    parser.add_argument("--k", type=int, default=0, help="number of neighbors; 0 only draws the test point")
+    parser.add_argument("--weighted", action="store_true", help="weight the votes by inverse distance")
+
+
+def render(args: argparse.Namespace, fig: Figure, ax: Axes) -> None:
+    from common.app import App
+
+    try:
+        data, labels = load_data(App.get_resource_path(DATA_PATH), App.get_resource_path(LABELS_PATH))
+    except FileNotFoundError:
+        data, labels = generate_data()
+
+    if args.k < 0 or args.k > data.shape[0]:
+        raise ValueError(f"k must be between 0 and the number of points ({data.shape[0]})")
+    if args.k and args.point is None:
+        raise ValueError("--k needs a test point (--point)")
+
+    fig.set_size_inches(12, 8)
+    ax.set_aspect("equal")
+    test_point = None if args.point is None else np.array(args.point)
+    classified_class = classify(test_point, data, labels, args.k, args.weighted) if args.k else None
+    plot_knn(ax, data, labels, test_point, args.k, classified_class)
@@ -0,0 +1,136 @@
+from typing import Optional, Tuple
+
+import numpy as np
+import matplotlib.patches as patches  # type: ignore
+from matplotlib import colormaps  # type: ignore
+from matplotlib.axes import Axes  # type: ignore
+
+DATA_PATH = "assets/knn/iris_2d.txt"
+LABELS_PATH = "assets/knn/iris_labels.txt"
+
+
+def generate_data() -> Tuple[np.ndarray, np.ndarray]:
+    """Project the iris dataset to two dimensions with PCA.
+
+    Returns:
+        The 2D data points and their class labels
+    """
+    from sklearn.datasets import load_iris  # type: ignore
+    from sklearn.decomposition import PCA  # type: ignore
+
+    iris = load_iris()
+    X, y = iris.data, iris.target
+
+    n_components = 2
+    pca = PCA(n_components=n_components)
+    X_2d = pca.fit_transform(X)
+
+    data = np.array([]).reshape(0, n_components)
+    data = np.vstack([data, X_2d])
+    return data, y
+
+
+def load_data(data_path: str, labels_path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Load the 2D data points and their class labels saved by the module."""
+    data = np.loadtxt(data_path).astype(float)
+    labels = np.loadtxt(labels_path).astype(int)
+    return data, labels
+
+
+def classify(test_point: np.ndarray, data: np.ndarray, labels: np.ndarray, k: int, weighted: bool = False) -> int:
+    """Classify a test point using k-nearest neighbors.
+
+    Args:
+        test_point: The point to classify
+        data: Training data points
+        labels: Training data labels
+        k: Number of neighbors to consider
+        weighted: Weight the votes of the neighbors by inverse distance instead of majority voting
+
+    Returns:
+        The predicted class label for the test point
+    """
+    distances = np.linalg.norm(data - test_point, axis=1)
+    sorted_indices = np.argsort(distances)
+    k_nearest_labels = labels[sorted_indices[:k]]
+
+    if not weighted:
+        unique_classes, counts = np.unique(k_nearest_labels, return_counts=True)
+        majority_class = unique_classes[np.argmax(counts)]
+
+    else:
+        # Weighted Voting
+        weights = 1 / distances[sorted_indices[:k]]
+        weighted_counts = np.bincount(k_nearest_labels, weights=weights)
+        majority_class = np.argmax(weighted_counts)
+
+    return int(majority_class)
+
+
+def plot_knn(
+    ax: Axes,
+    data: np.ndarray,
+    labels: np.ndarray,
+    test_point: Optional[np.ndarray] = None,
+    k: int = 0,
+    classified_class: Optional[int] = None,
+) -> None:
+    """Draw the data points and optionally the test point with its k nearest neighbors.
+
+    Args:
+        ax: Axes to draw on; it is cleared first
+        data: Training data points
+        labels: Training data labels
+        test_point: Coordinates of the test point, or None to draw only the data
+        k: Number of neighbors to enclose in a circle around the test point
+        classified_class: Predicted class of the test point, used for its color
+    """
+    ax.clear()
+    labels = labels.astype(int)
+    colors = colormaps["rainbow"](np.linspace(0, 1, len(np.unique(labels))))
+
+    for class_label, color in zip(np.unique(labels), colors):
+        class_data = data[labels == class_label]
+        ax.scatter(
+            class_data[:, 0],
+            class_data[:, 1],
+            c=[color],
+            label=f"Class {class_label}",
+            alpha=0.7,
+            edgecolors="w",
+            s=100,
+        )
+
+    if test_point is not None:
+        if classified_class is not None:
+            classified_color = colors[classified_class]
+            ax.scatter(
+                test_point[0],
+                test_point[1],
+                c=[classified_color],
+                marker="o",
+                s=200,
+                alpha=0.7,
+            )
+        else:
+            ax.scatter(test_point[0], test_point[1], c="blue", marker="o", s=200, alpha=0.7)
+
+        if k > 0:
+            distances = np.linalg.norm(data - test_point, axis=1)
+            sorted_indices = np.argsort(distances)
+            k_nearest_indices = sorted_indices[:k]
+
+            radius = distances[k_nearest_indices[-1]]
+
+            circle = patches.Circle(
+                (test_point[0], test_point[1]),
+                radius,
+                fill=False,
+                color="blue",
+                linestyle="--",
+                linewidth=2,
+            )
+            ax.add_patch(circle)
+
+    ax.set_xlim([np.min(data[:, 0]), np.max(data[:, 0])])
+    ax.set_ylim([np.min(data[:, 1]), np.max(data[:, 1])])
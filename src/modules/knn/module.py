@@ -1,15 +1,13 @@
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 import tkinter.ttk as ttk
 import tkinter as tk
 import tkinter.messagebox as msgbox
-import matplotlib.pyplot as plt  # type: ignore
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg  # type: ignore
 import numpy as np
-from sklearn.datasets import load_iris  # type: ignore
-from sklearn.decomposition import PCA  # type: ignore
-import matplotlib.patches as patches  # type: ignore
 
+from common.figures import create_figure, release_figure
 from common.module import Module
+from .knn import DATA_PATH, LABELS_PATH, classify, generate_data, load_data, plot_knn
 
 if TYPE_CHECKING:
     from common.app import App
@@ -83,36 +81,29 @@ class KNN(Module):
 
     def _generate_data(self) -> None:
         """Generate the data for the module."""
-        iris = load_iris()
-        X, y = iris.data, iris.target
+        data, y = generate_data()
 
-        n_components = 2
-        pca = PCA(n_components=n_components)
-        X_2d = pca.fit_transform(X)
-
-        data = np.array([]).reshape(0, n_components)
-        data = np.vstack([data, X_2d])
-
-        np.savetxt(self.app.get_resource_path("assets/knn/iris_2d.txt"), data)
-        np.savetxt(self.app.get_resource_path("assets/knn/iris_labels.txt"), y)
+        np.savetxt(self.app.get_resource_path(DATA_PATH), data)
+        np.savetxt(self.app.get_resource_path(LABELS_PATH), y)
 
         self.data = data
         self.labels = y
 
     def _load_data(self) -> None:
         """Load the data for the module."""
-        self.data = np.loadtxt(self.app.get_resource_path("assets/knn/iris_2d.txt")).astype(float)
-        self.labels = np.loadtxt(self.app.get_resource_path("assets/knn/iris_labels.txt")).astype(int)
+        self.data, self.labels = load_data(
+            self.app.get_resource_path(DATA_PATH), self.app.get_resource_path(LABELS_PATH)
+        )
 
     def destroy(self) -> None:
         """Clean up resources when the module is destroyed."""
-        plt.close()
+        release_figure(self.fig)
         self.canvas_widget.destroy()
         super().destroy()
 
     def create_widgets(self) -> None:
         """Create and layout all the GUI widgets for the module."""
-        self.fig, self.ax = plt.subplots(figsize=(12, 8))
+        self.fig, self.ax = create_figure(figsize=(12, 8))
         self.ax.set_xlim([0, 10])
         self.ax.set_ylim([0, 10])
         self.ax.set_aspect("equal")
@@ -176,13 +167,7 @@ class KNN(Module):
         self.point_entry.delete(0, tk.END)
         self.k_entry.delete(0, tk.END)
 
-        self.ax.clear()
-        self.ax.set_xlim([0, 10])
-        self.ax.set_ylim([0, 10])
-
-        self.visualize(showTestPoint=False)
-
-        self.canvas.draw()
+        self.request_redraw(self.draw_plot)
 
     def on_click(self, event: Any) -> None:
         """Handle mouse click events to place test points.
@@ -193,19 +178,12 @@ class KNN(Module):
         x, y = event.xdata, event.ydata
 
         if x is not None and y is not None:
-            # Clear previous point by redrawing the plot
-            self.ax.clear()
-            self.visualize()
-
-            # Plot new point
-            point_plot = self.ax.scatter(x, y, c="blue", marker="o", s=100, alpha=0.7)
-            self.canvas.draw()
+            # Clear previous point by redrawing the plot; rapid clicks are drawn once per frame
+            self.request_redraw(self.draw_plot, clicked_point=(x, y))
 
             self.point_entry.delete(0, tk.END)
             self.point_entry.insert(0, f"{x:.2f}, {y:.2f}")
 
-            self.prev_point_plot = point_plot
-
     def on_show_knn(self) -> None:
         """Process the KNN classification for the current test point and k value."""
         try:
@@ -231,12 +209,10 @@ class KNN(Module):
 
         test_point_class = self.classify_test_point(np.array(point_coords), self.data, self.labels, k)
 
-        self.visualize(True, np.array(point_coords), k, test_point_class)
-
-        self.canvas.draw()
+        self.request_redraw(self.draw_plot, True, np.array(point_coords), k, test_point_class)
 
     def classify_test_point(self, test_point: np.ndarray, data: np.ndarray, labels: np.ndarray, k: int) -> int:
-        """Classify a test point using k-nearest neighbors.
+        """Classify a test point using k-nearest neighbors with the selected voting.
 
         Args:
             test_point: The point to classify
@@ -247,26 +223,12 @@ class KNN(Module):
         Returns:
             The predicted class label for the test point
         """
-        distances = np.linalg.norm(data - test_point, axis=1)
-        sorted_indices = np.argsort(distances)
-        k_nearest_labels = labels[sorted_indices[:k]]
-
-        if self.classifier_choice.get() == "Majority":
-            unique_classes, counts = np.unique(k_nearest_labels, return_counts=True)
-            majority_class = unique_classes[np.argmax(counts)]
-
-        else:
-            # Weighted Voting
-            weights = 1 / distances[sorted_indices[:k]]
-            weighted_counts = np.bincount(k_nearest_labels, weights=weights)
-            majority_class = np.argmax(weighted_counts)
-
-        return int(majority_class)
+        return classify(test_point, data, labels, k, weighted=self.classifier_choice.get() == "Weighted")
 
     def visualize(
         self,
         showTestPoint: bool = False,
-        test_point: np.ndarray = np.array([]),
+        test_point: Optional[np.ndarray] = None,
         k: int = 0,
         classified_class: Optional[int] = None,
     ) -> None:
@@ -274,57 +236,34 @@ class KNN(Module):
 
         Args:
             showTestPoint: Whether to show the test point
-            test_point: Coordinates of the test point
+            test_point: Coordinates of the test point, or None for an empty point
+            k: Number of neighbors to show
+            classified_class: Predicted class of the test point
+        """
+        if test_point is None:
+            test_point = np.array([])
+        plot_knn(self.ax, self.data, self.labels, test_point if showTestPoint else None, k, classified_class)
+
+    def draw_plot(
+        self,
+        showTestPoint: bool = False,
+        test_point: Optional[np.ndarray] = None,
+        k: int = 0,
+        classified_class: Optional[int] = None,
+        clicked_point: Optional[Tuple[float, float]] = None,
+    ) -> None:
+        """Visualize the data and render the canvas; all redraws go through request_redraw.
+
+        Args:
+            showTestPoint: Whether to show the test point
+            test_point: Coordinates of the test point, or None for an empty point
             k: Number of neighbors to show
             classified_class: Predicted class of the test point
+            clicked_point: Coordinates of a point placed by clicking on the plot
         """
-        self.ax.clear()
-        labels = self.labels.astype(int)
-        colors = plt.cm.rainbow(np.linspace(0, 1, len(np.unique(labels))))
-
-        for class_label, color in zip(np.unique(labels), colors):
-            class_data = self.data[labels == class_label]
-            self.ax.scatter(
-                class_data[:, 0],
-                class_data[:, 1],
-                c=[color],
-                label=f"Class {class_label}",
-                alpha=0.7,
-                edgecolors="w",
-                s=100,
-            )
-
-        if showTestPoint:
-            if classified_class is not None:
-                classified_color = colors[classified_class]
-                self.ax.scatter(
-                    test_point[0],
-                    test_point[1],
-                    c=[classified_color],
-                    marker="o",
-                    s=200,
-                    alpha=0.7,
-                )
-            else:
-                self.ax.scatter(test_point[0], test_point[1], c="blue", marker="o", s=200, alpha=0.7)
-
-            if k > 0:
-                distances = np.linalg.norm(self.data - test_point, axis=1)
-                sorted_indices = np.argsort(distances)
-                k_nearest_indices = sorted_indices[:k]
-
-                radius = distances[k_nearest_indices[-1]]
-
-                circle = patches.Circle(
-                    (test_point[0], test_point[1]),
-                    radius,
-                    fill=False,
-                    color="blue",
-                    linestyle="--",
-                    linewidth=2,
-                )
-                self.ax.add_patch(circle)
-
-        self.ax.set_xlim([np.min(self.data[:, 0]), np.max(self.data[:, 0])])
-        self.ax.set_ylim([np.min(self.data[:, 1]), np.max(self.data[:, 1])])
-        # ax.legend()
+        if test_point is None:
+            test_point = np.array([])
+        self.visualize(showTestPoint, test_point, k, classified_class)
+        if clicked_point is not None:
+            self.prev_point_plot = self.ax.scatter(*clicked_point, c="blue", marker="o", s=100, alpha=0.7)
+        self.canvas.draw()
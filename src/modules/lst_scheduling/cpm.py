@@ -0,0 +1,232 @@
+"""
+Critical path method (CPM) for the activities of a Planer.
+
+ES/LS are computed iteratively in a topological order obtained with Kahn's algorithm,
+so long dependency chains do not hit the recursion limit and cycles are reported
+explicitly instead of recursing forever. After a local change, propagate_es and
+propagate_ls update only the activities whose values actually change.
+"""
+
+from collections import deque
+import heapq
+from typing import TYPE_CHECKING, Dict, Iterable, List
+
+if TYPE_CHECKING:
+    from .lst import Aktivnost, Planer
+
+
+class CycleError(ValueError):
+    """Raised when the activity dependencies contain a cycle."""
+
+    def __init__(self, aktivnosti_v_ciklu: List[str]) -> None:
+        self.aktivnosti_v_ciklu = aktivnosti_v_ciklu
+        super().__init__("Odvisnosti aktivnosti vsebujejo cikel: {}".format(", ".join(map(str, aktivnosti_v_ciklu))))
+
+
+def topological_order(planer: "Planer") -> List["Aktivnost"]:
+    """
+    Return the planer's activities so that every activity comes after all of its dependencies.
+
+    Raises:
+        CycleError: If some activities can never be ordered because they depend on each other
+    """
+    in_degree = {a.id: len(a.odvisnosti) for a in planer.aktivnosti}
+    ready = deque(a.id for a in planer.aktivnosti if in_degree[a.id] == 0)
+
+    order = []
+    while ready:
+        aktivnost_id = ready.popleft()
+        order.append(planer.aktivnosti_po_id[aktivnost_id])
+        for naslednik in planer.nasledniki[aktivnost_id]:
+            in_degree[naslednik] -= 1
+            if in_degree[naslednik] == 0:
+                ready.append(naslednik)
+
+    if len(order) != len(planer.aktivnosti):
+        raise CycleError(_find_cycle(planer, {a_id for a_id, d in in_degree.items() if d > 0}))
+
+    return order
+
+
+def _find_cycle(planer: "Planer", unordered: set) -> List[str]:
+    """Return one cycle among the activities Kahn's algorithm could not order."""
+    # vsaka neurejena aktivnost ima vsaj eno neurejeno odvisnost, zato hoja nazaj po njih zagotovo zaključi cikel
+    path: List[str] = []
+    visited_at: Dict[str, int] = {}
+    trenutna = next(iter(unordered))
+    while trenutna not in visited_at:
+        visited_at[trenutna] = len(path)
+        path.append(trenutna)
+        trenutna = next(dep for dep in planer.aktivnosti_po_id[trenutna].odvisnosti if dep in unordered)
+
+    return list(reversed(path[visited_at[trenutna] :]))
+
+
+def _check_cycles(planer: "Planer", budget: int) -> int:
+    """
+    Count one recomputation against budget and return what is left of it.
+
+    Without a cycle an activity is rarely recomputed more than once, so when the recomputations
+    exceed the number of activities, the whole graph is checked for a cycle and the budget renewed.
+    The check costs O(V + E) per V recomputations and guarantees that a cycle ends the propagation.
+
+    Raises:
+        CycleError: If the dependencies contain a cycle
+    """
+    if budget > 0:
+        return budget - 1
+    topological_order(planer)
+    return len(planer.aktivnosti_po_id)
+
+
+def propagate_es(planer: "Planer", seeds: Iterable[str], skip_finished: bool = False) -> None:
+    """
+    Recompute ES of the seeds (activities whose dependencies changed) and of their descendants,
+    as far as it keeps changing.
+
+    Activities are processed by their previous ES, which orders every activity after its
+    dependencies except for zero-duration ties, so most are recomputed only once. With
+    skip_finished, finished activities keep their ES and only finished seeds pass the change on.
+
+    Raises:
+        CycleError: If the dependencies contain a cycle, which would keep increasing ES forever
+    """
+    po_id = planer.aktivnosti_po_id
+    seeds = set(seeds)
+    heap = [(po_id[a_id].es, a_id) for a_id in seeds]
+    heapq.heapify(heap)
+    queued = set(seeds)
+    budget = len(po_id)
+
+    while heap:
+        budget = _check_cycles(planer, budget)
+        _, a_id = heapq.heappop(heap)
+        queued.discard(a_id)
+        aktivnost = po_id[a_id]
+
+        if skip_finished and aktivnost.finished:
+            changed = a_id in seeds
+        else:
+            es = max((po_id[dep].es + po_id[dep].trajanje for dep in aktivnost.odvisnosti), default=0)
+            changed = es != aktivnost.es
+            aktivnost.es = es
+        seeds.discard(a_id)
+
+        if changed:
+            for naslednik in planer.nasledniki[a_id]:
+                if naslednik not in queued:
+                    queued.add(naslednik)
+                    heapq.heappush(heap, (po_id[naslednik].es, naslednik))
+
+
+def propagate_ls(planer: "Planer", seeds: Iterable[str], skip_finished: bool = False) -> None:
+    """
+    Recompute LS of the seeds (activities whose successors changed) and of their ancestors,
+    as far as it keeps changing.
+
+    ES must already be up to date. Activities are processed by decreasing ES, so successors
+    come first except for zero-duration ties. With skip_finished, finished activities keep
+    their LS and only finished seeds pass the change on.
+
+    Raises:
+        CycleError: If the dependencies contain a cycle, which would keep decreasing LS forever
+    """
+    po_id = planer.aktivnosti_po_id
+    total_project_duration = po_id["finish"].es
+    seeds = set(seeds)
+    heap = [(-po_id[a_id].es, a_id) for a_id in seeds]
+    heapq.heapify(heap)
+    queued = set(seeds)
+    budget = len(po_id)
+
+    while heap:
+        budget = _check_cycles(planer, budget)
+        _, a_id = heapq.heappop(heap)
+        queued.discard(a_id)
+        aktivnost = po_id[a_id]
+
+        if skip_finished and aktivnost.finished:
+            changed = a_id in seeds
+        else:
+            lf = min((po_id[nas].ls for nas in planer.nasledniki[a_id]), default=total_project_duration)
+            changed = lf - aktivnost.trajanje != aktivnost.ls
+            aktivnost.ls = lf - aktivnost.trajanje
+        seeds.discard(a_id)
+
+        if changed:
+            for dep in aktivnost.odvisnosti:
+                if dep not in queued:
+                    queued.add(dep)
+                    heapq.heappush(heap, (-po_id[dep].es, dep))
+
+
+def forward_pass(planer: "Planer", order: List["Aktivnost"], skip_finished: bool = False) -> None:
+    """
+    Set ES of every activity in order to the latest EF of its dependencies.
+
+    Activities outside order are assumed to be up to date. With skip_finished, finished activities keep their ES.
+    """
+    po_id = planer.aktivnosti_po_id
+    for aktivnost in order:
+        if skip_finished and aktivnost.finished:
+            continue
+        aktivnost.es = max((po_id[dep].es + po_id[dep].trajanje for dep in aktivnost.odvisnosti), default=0)
+
+
+def backward_pass(planer: "Planer", order: List["Aktivnost"], skip_finished: bool = False) -> None:
+    """
+    Set LS of every activity in order to the earliest LS of its successors minus its duration.
+
+    ES must already be set. Activities outside order are assumed to be up to date. With skip_finished,
+    finished activities keep their LS.
+    """
+    po_id = planer.aktivnosti_po_id
+    total_project_duration = po_id["finish"].es
+    for aktivnost in reversed(order):
+        if skip_finished and aktivnost.finished:
+            continue
+        lf = min((po_id[nas].ls for nas in planer.nasledniki[aktivnost.id]), default=total_project_duration)
+        aktivnost.ls = lf - aktivnost.trajanje
+
+
+class CriticalPath:
+    """
+    Result of a full CPM computation.
+
+    Attributes:
+        es, ef, ls, lf (dict): Earliest/latest start and finish times by activity ID
+        slack (dict): LS - ES by activity ID
+        path (list): IDs of the activities on the critical path, in order (without start and finish)
+        duration: Total project duration
+    """
+
+    def __init__(self, planer: "Planer", order: List["Aktivnost"]) -> None:
+        self.es: Dict[str, float] = {a.id: a.es for a in order}
+        self.ef: Dict[str, float] = {a.id: a.es + a.trajanje for a in order}
+        self.ls: Dict[str, float] = {a.id: a.ls for a in order}
+        self.lf: Dict[str, float] = {a.id: a.ls + a.trajanje for a in order}
+        self.slack: Dict[str, float] = {a.id: a.ls - a.es for a in order}
+        self.duration = max(self.ef.values())
+
+        # sledimo naslednikom brez rezerve, ki se začnejo takoj, ko se trenutna aktivnost konča
+        self.path: List[str] = []
+        trenutna = "start"
+        while trenutna != "finish":
+            trenutna = next(
+                (
+                    nas
+                    for nas in planer.nasledniki[trenutna]
+                    if self.slack[nas] == 0 and self.es[nas] == self.ef[trenutna]
+                ),
+                "finish",
+            )
+            if trenutna != "finish":
+                self.path.append(trenutna)
+
+
+def compute_critical_path(planer: "Planer") -> CriticalPath:
+    """Compute ES, EF, LS, LF, slack and the critical path with one forward and one backward pass."""
+    order = topological_order(planer)
+    forward_pass(planer, order)
+    backward_pass(planer, order)
+    return CriticalPath(planer, order)
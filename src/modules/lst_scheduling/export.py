@@ -0,0 +1,47 @@
+"""
+A project from a JSON or CSV file, as the network of activities with their ES and LS or as
+the Gantt chart of its LST schedule.
+"""
+
+import argparse
+
+from matplotlib.axes import Axes  # type: ignore
+from matplotlib.figure import Figure  # type: ignore
+
+from .gantt import GanttChart, component_colors, renewable_resources
+from .project_io import load_project
+from .scheduler import LSTScheduler
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("project", help="project file (.json or .csv), see the module README for the format")
+    parser.add_argument(
+        "--view",
+        choices=("network", "gantt"),
+        default="network",
+        help="activity network with ES and LS, or Gantt chart of the schedule (default: %(default)s)",
+    )
+
+
+def render(args: argparse.Namespace, fig: Figure, ax: Axes) -> None:
+    planer = load_project(args.project)
+
+    if args.view == "network":
+        planer.prikazi_urnik(ax)
+        return
+
+    # kot "Run all steps" v modulu: razporedimo vse aktivnosti in jih izrišemo naenkrat
+    colors = component_colors(planer)
+    gantt = GanttChart(ax)
+    ax.set_xlim(0, 100)
+    gantt.set_rows(renewable_resources(planer))
+    for scheduled in LSTScheduler(planer):
+        gantt.add_activity(
+            scheduled.aktivnost.id,
+            scheduled.start_time,
+            scheduled.end_time,
+            scheduled.resources,
+            colors[scheduled.aktivnost.id],
+        )
+    gantt.flush()
+    fig.set_size_inches(8, 6.5)
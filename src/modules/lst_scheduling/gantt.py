@@ -0,0 +1,124 @@
+"""
+Gantt chart of the LST schedule.
+
+Bars of one color on a resource row are kept in one PolyCollection. New bars are queued
+with add_bar or add_activity and appended to the collections by flush, which also updates
+the axis limits once, so scheduling many activities at once costs a single redraw and each
+flush only builds the paths of the new bars.
+"""
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
+
+from matplotlib.axes import Axes
+from matplotlib.collections import PolyCollection
+from matplotlib.path import Path
+
+if TYPE_CHECKING:
+    from .lst import Planer
+
+# Row of activities that use no drawn resource; every such activity gets its own lane below it
+NO_RESOURCE_ROW = "Brez"
+
+color_palette = [
+    "skyblue",
+    "lightgreen",
+    "lightcoral",
+    "khaki",
+    "lightpink",
+    "plum",
+]
+
+
+def renewable_resources(planer: "Planer") -> List[str]:
+    """Return the resources that get a row in the chart, i.e. those that are not consumable."""
+    return [name for name, resource in planer.all_resources.items() if not resource["consumable"]]
+
+
+def component_colors(planer: "Planer") -> Dict[str, str]:
+    """Return the bar color of every activity; activities that depend on each other share a color."""
+    return {
+        a_id: color_palette[component % len(color_palette)] for a_id, component in planer.povezane_komponente().items()
+    }
+
+
+class GanttChart:
+    """
+    Bars of the scheduled activities on a matplotlib axes.
+
+    Attributes:
+        ax: Axes the chart is drawn on
+        bar_height: Height of a bar in data coordinates
+        max_labels: Bars beyond this number are drawn without a label, since the labels
+            would overlap and every label is a separate artist
+        rows: Y position of every resource row, set by set_rows
+    """
+
+    def __init__(self, ax: Axes, bar_height: float = 8, max_labels: int = 500) -> None:
+        self.ax = ax
+        self.bar_height = bar_height
+        self.max_labels = max_labels
+        self.rows: Dict[str, float] = {}
+
+        self._collections: Dict[Tuple[str, str], PolyCollection] = {}
+        self._pending: List[Tuple[str, float, float, float, str, str]] = []
+        self._labels = 0
+
+    def set_rows(self, resources: List[str], spacing: float = 20) -> None:
+        """Give every resource its own row, from the bottom up, and label the rows on the y axis."""
+        self.rows = {name: i * spacing for i, name in enumerate(resources)}
+        positions = list(self.rows.values())
+        self.ax.set_yticks(positions)
+        self.ax.set_yticklabels(resources)
+        self.ax.set_ylim(min(positions) - spacing, max(positions) + spacing)
+
+    def add_activity(self, activity_id: str, start: float, end: float, resources: Iterable[str], color: str) -> None:
+        """
+        Queue a bar of an activity on the row of every resource it uses.
+
+        Resources without a row (consumables) are skipped. Activities that use no resource with
+        a row are drawn in their own lane, one below the other, under the NO_RESOURCE_ROW row.
+        """
+        label = f"{activity_id}\n[{start}, {end}]"
+        drawn = [resource for resource in resources if resource in self.rows]
+        if not drawn:
+            self.add_bar(NO_RESOURCE_ROW, self.rows[NO_RESOURCE_ROW], start, end, label, color)
+            self.rows[NO_RESOURCE_ROW] -= 10
+            return
+
+        for resource in drawn:
+            self.add_bar(resource, self.rows[resource], start, end, label, color)
+
+    def add_bar(self, resource: str, y: float, start: float, end: float, label: str, color: str) -> None:
+        """Queue a bar on the row of a resource, centred at y; it is drawn by the next flush."""
+        self._pending.append((resource, y, start, end, label, color))
+
+    def flush(self) -> None:
+        """Add all queued bars to the chart and extend the axis limits to include them."""
+        if not self._pending:
+            return
+
+        x_max = self.ax.get_xlim()[1]
+        y_min, y_max = self.ax.get_ylim()
+        half = self.bar_height / 2
+        for resource, y, start, end, label, color in self._pending:
+            collection = self._collections.get((resource, color))
+            if collection is None:
+                collection = PolyCollection([], facecolors=color, edgecolors="black", linewidths=2)
+                self._collections[resource, color] = self.ax.add_collection(collection)
+
+            # pot dodamo na seznam poti zbirke, ne da bi ponovno gradili poti že narisanih pravokotnikov
+            verts = [(start, y - half), (end, y - half), (end, y + half), (start, y + half), (start, y - half)]
+            collection.get_paths().append(Path(verts, closed=True))
+            collection.stale = True
+
+            if self._labels < self.max_labels:
+                self.ax.text((start + end) / 2, y, label, ha="center", va="center", color="black")
+                self._labels += 1
+
+            x_max = max(x_max, end + 10)
+            y_min = min(y_min, y - self.bar_height)
+            y_max = max(y_max, y + self.bar_height)
+
+        self._pending.clear()
+        self.ax.set_xlim(0, x_max)
+        self.ax.set_ylim(y_min, y_max)
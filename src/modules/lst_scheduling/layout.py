@@ -0,0 +1,89 @@
+"""
+Layered (Sugiyama-style) layout of the activity network of a Planer.
+
+Activities are placed in layers by the longest dependency path from start, so every
+dependency points from a lower to a higher layer. The order within each layer is then
+improved with a few barycenter sweeps, which places every activity near the average
+position of its neighbours and removes most edge crossings. Each sweep is linear in the
+number of activities and dependencies, apart from sorting the layers.
+"""
+
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Tuple
+
+from .cpm import topological_order
+
+if TYPE_CHECKING:
+    from .lst import Planer
+
+
+class LayeredLayout:
+    """
+    Result of layered_layout.
+
+    Attributes:
+        layers (list): Activity IDs of every layer, starting with the layer of start;
+            Planer.prikazi_urnik draws the layers as columns from left to right
+        positions (dict): Activity ID -> (layer, offset), where offset is the position in
+            the layer (the vertical position in prikazi_urnik) relative to its centre, so
+            layers of different sizes are centred
+    """
+
+    def __init__(self, layers: List[List[str]]) -> None:
+        self.layers = layers
+        self.positions: Dict[str, Tuple[int, float]] = {}
+        for layer_index, layer in enumerate(layers):
+            center = (len(layer) - 1) / 2
+            for i, aktivnost_id in enumerate(layer):
+                self.positions[aktivnost_id] = (layer_index, i - center)
+
+    def offsets(self) -> Dict[str, float]:
+        """Return the offset of every activity within its layer."""
+        return {aktivnost_id: offset for aktivnost_id, (_, offset) in self.positions.items()}
+
+
+def assign_layers(planer: "Planer") -> List[List[str]]:
+    """Put every activity one layer after its latest dependency, keeping the topological order within a layer."""
+    layer_of: Dict[str, int] = {}
+    layers: List[List[str]] = []
+    for aktivnost in topological_order(planer):
+        layer = max((layer_of[dep] + 1 for dep in aktivnost.odvisnosti), default=0)
+        layer_of[aktivnost.id] = layer
+        if layer == len(layers):
+            layers.append([])
+        layers[layer].append(aktivnost.id)
+    return layers
+
+
+def _sort_by_barycenter(layer: List[str], neighbours: Callable[[str], Iterable[str]], offset: Dict[str, float]) -> None:
+    """Sort a layer by the average offset of the neighbours of each activity and update offset."""
+    keys = {}
+    for aktivnost_id in layer:
+        sosedi = [offset[sosed] for sosed in neighbours(aktivnost_id)]
+        # aktivnost brez sosedov ostane na svojem mestu
+        keys[aktivnost_id] = sum(sosedi) / len(sosedi) if sosedi else offset[aktivnost_id]
+    layer.sort(key=keys.__getitem__)
+
+    center = (len(layer) - 1) / 2
+    for i, aktivnost_id in enumerate(layer):
+        offset[aktivnost_id] = i - center
+
+
+def layered_layout(planer: "Planer", sweeps: int = 4) -> LayeredLayout:
+    """
+    Compute a layered layout of the planer's activities.
+
+    Each sweep reorders the layers from left to right by the positions of the dependencies,
+    then from right to left by the positions of the successors.
+    """
+    layers = assign_layers(planer)
+    po_id = planer.aktivnosti_po_id
+    offset = LayeredLayout(layers).offsets()
+
+    for _ in range(sweeps):
+        for layer in layers[1:]:
+            _sort_by_barycenter(layer, lambda a_id: po_id[a_id].odvisnosti, offset)
+
+        for layer in reversed(layers[:-1]):
+            _sort_by_barycenter(layer, lambda a_id: planer.nasledniki[a_id], offset)
+
+    return LayeredLayout(layers)
@@ -1,7 +1,21 @@
-from matplotlib.patches import Rectangle, FancyArrowPatch
+from matplotlib.collections import LineCollection, PolyCollection
 from tkinter import messagebox as msgbox
 import numpy as np
 
+from .cpm import (
+    CycleError,
+    backward_pass,
+    compute_critical_path,
+    forward_pass,
+    propagate_es,
+    propagate_ls,
+    topological_order,
+)
+from .layout import layered_layout
+
+# nad toliko aktivnostmi se oznake ne izrišejo, ker bi bile neberljive in bi izris upočasnile
+MAX_OZNAK = 200
+
 
 class Aktivnost:
     def __init__(self, id, trajanje, odvisnosti=[], resursi={}, finished=False):
@@ -21,12 +35,17 @@ class Planer:
             Aktivnost("finish", 0, []),
         ]
 
+        # indeksa za iskanje v O(1): id -> aktivnost in id -> seznam id-jev naslednikov
+        self.aktivnosti_po_id = {a.id: a for a in self.aktivnosti}
+        self.nasledniki = {a.id: [] for a in self.aktivnosti}
+
         self.all_resources = {"Brez": {"kolicina": 1, "consumable": False}}
 
-    # Dodajanje aktivnosti
-    def dodaj_aktivnost(self, aktivnost):
+    # Dodajanje aktivnosti; z izracunaj=False se odvisnosti finisha ter ES in LS ne posodobijo,
+    # zato je treba po zadnji dodani aktivnosti poklicati posodobi_odvisnosti_finish, izracunaj_es in izracunaj_ls
+    def dodaj_aktivnost(self, aktivnost, izracunaj=True):
         # Preveri, ali aktivnost z istim ID-jem že obstaja
-        if any(a.id == aktivnost.id for a in self.aktivnosti):
+        if aktivnost.id in self.aktivnosti_po_id:
             msgbox.showerror("Error", "Aktivnost z ID-jem {} že obstaja".format(aktivnost.id))
             return
 
@@ -34,7 +53,7 @@ class Planer:
             aktivnost.odvisnosti = np.array(["start"])
 
         # Preveri, ali vse navedene odvisnosti obstajajo
-        neobstojece_odvisnosti = [odv for odv in aktivnost.odvisnosti if not any(a.id == odv for a in self.aktivnosti)]
+        neobstojece_odvisnosti = [odv for odv in aktivnost.odvisnosti if odv not in self.aktivnosti_po_id]
         if neobstojece_odvisnosti:
             msgbox.showerror(
                 "Error",
@@ -44,8 +63,50 @@ class Planer:
             )
             return
 
-        # Dodaj novo aktivnost v seznam
-        self.aktivnosti.append(aktivnost)
+        # Nova aktivnost nima naslednikov razen finisha, zato bi jo le odvisnost od finisha zaprla v cikel;
+        # zavrnemo jo vnaprej, saj sprotni izračun ES in LS predpostavlja, da ciklov ni
+        if "finish" in aktivnost.odvisnosti:
+            raise CycleError([aktivnost.id, "finish"])
+
+        # Dodaj novo aktivnost v seznam, pred finish, ki ostane na koncu
+        finish = self.aktivnosti_po_id["finish"]
+        self.aktivnosti.insert(len(self.aktivnosti) - 1, aktivnost)
+        self.aktivnosti_po_id[aktivnost.id] = aktivnost
+        self.nasledniki[aktivnost.id] = []
+        for odv in aktivnost.odvisnosti:
+            self.nasledniki[odv].append(aktivnost.id)
+
+        if not izracunaj:
+            return
+
+        # nova aktivnost nima naslednikov, zato je odvisnost finisha namesto svojih odvisnosti,
+        # ki so bile do zdaj brez drugih naslednikov
+        for odv in aktivnost.odvisnosti:
+            if self.nasledniki[odv] == ["finish", aktivnost.id]:
+                finish.odvisnosti.remove(odv)
+                self.nasledniki[odv].remove("finish")
+        finish.odvisnosti.append(aktivnost.id)
+        self.nasledniki[aktivnost.id].append("finish")
+
+        # spremenile so se odvisnosti nove aktivnosti in finisha ter nasledniki nove aktivnosti in njenih odvisnosti
+        self.posodobi_cpm([aktivnost.id, "finish"], [aktivnost.id, *aktivnost.odvisnosti])
+
+    # Dodajanje veliko že preverjenih aktivnosti naenkrat, v poljubnem vrstnem redu; indeksi in
+    # odvisnosti finisha se zgradijo ter ES in LS izračunajo le enkrat
+    def dodaj_aktivnosti(self, aktivnosti):
+        finish = self.aktivnosti.pop()
+        for aktivnost in aktivnosti:
+            if not len(aktivnost.odvisnosti):
+                aktivnost.odvisnosti = ["start"]
+            self.aktivnosti.append(aktivnost)
+            self.aktivnosti_po_id[aktivnost.id] = aktivnost
+            self.nasledniki[aktivnost.id] = []
+        self.aktivnosti.append(finish)
+
+        for aktivnost in aktivnosti:
+            for odv in aktivnost.odvisnosti:
+                self.nasledniki[odv].append(aktivnost.id)
+
         self.posodobi_odvisnosti_finish()
         self.izracunaj_es()
         self.izracunaj_ls()
@@ -57,268 +118,137 @@ class Planer:
             "consumable": consumable,
         }
 
+    # Nastavi nove odvisnosti aktivnosti in posodobi indeks naslednikov
+    def nastavi_odvisnosti(self, aktivnost, odvisnosti):
+        for odv in aktivnost.odvisnosti:
+            self.nasledniki[odv].remove(aktivnost.id)
+        aktivnost.odvisnosti = odvisnosti
+        for odv in odvisnosti:
+            self.nasledniki[odv].append(aktivnost.id)
+
     # Posobobi odvisnosti finisha in postavi finish na konec seznama
     def posodobi_odvisnosti_finish(self):
-        seznam_vseh_odvisnih = ["finish"]
-
-        for a in self.aktivnosti:
-            if a.id == "finish":
-                a.odvisnosti = []
-                break
-
-        for a in self.aktivnosti:
-            seznam_vseh_odvisnih.extend(a.odvisnosti)
-            seznam_vseh_odvisnih = list(set(seznam_vseh_odvisnih))
-
-        seznam_neodvisnih = [a.id for a in self.aktivnosti if a.id not in seznam_vseh_odvisnih]
-        for a in self.aktivnosti:
-            if a.id == "finish":
-                a.odvisnosti = seznam_neodvisnih
-                # finish na konec seznama
-                self.aktivnosti.remove(a)
-                self.aktivnosti.append(a)
-                break
-
-    # Izračun ES za vse aktivnosti v self.aktivnosti
-    def izracunaj_es(self):
-        es_values = {"start": 0}
-
-        def calculate_es(aktivnost_id):
-            if aktivnost_id in es_values:
-                return es_values[aktivnost_id]
-
-            aktivnost = next((a for a in self.aktivnosti if a.id == aktivnost_id), None)
-            if aktivnost is None:
-                return 0
-            if "start" in aktivnost.odvisnosti:
-                es_values[aktivnost_id] = 0
-            else:
-                max_es = max(
-                    calculate_es(dep) + next(a for a in self.aktivnosti if a.id == dep).trajanje
-                    for dep in aktivnost.odvisnosti
-                )
-                es_values[aktivnost_id] = max_es
+        finish = self.aktivnosti_po_id["finish"]
+        self.nastavi_odvisnosti(finish, [])
 
-            return es_values[aktivnost_id]
+        # od finisha so odvisne vse aktivnosti, ki nimajo naslednikov
+        seznam_neodvisnih = [a.id for a in self.aktivnosti if a.id != "finish" and not self.nasledniki[a.id]]
+        self.nastavi_odvisnosti(finish, seznam_neodvisnih)
 
-        for aktivnost in self.aktivnosti:
-            aktivnost.es = calculate_es(aktivnost.id)
+        # finish na konec seznama
+        if self.aktivnosti[-1] is not finish:
+            self.aktivnosti.remove(finish)
+            self.aktivnosti.append(finish)
 
-        for a in self.aktivnosti:
-            a.es = es_values[a.id]
+    # Izračun ES za vse aktivnosti v self.aktivnosti
+    def izracunaj_es(self):
+        forward_pass(self, topological_order(self))
 
-    # Izračun LS za vse aktivnosti v self.aktivnosti
+    # Izračun LS za vse aktivnosti v self.aktivnosti, ES morajo biti že izračunani
     def izracunaj_ls(self):
-        # Assuming that ES times are already calculated and a total project duration is set
-        total_project_duration = max(
-            a.es for a in self.aktivnosti
-        )  # Assuming 'finish' activity represents the project end
-        ls_values = {"finish": total_project_duration}  # Initialize LS for 'finish' activity
-
-        # Function to recursively calculate LS
-        def calculate_ls(aktivnost_id):
-            if aktivnost_id in ls_values:
-                return ls_values[aktivnost_id]
-
-            aktivnost = next((a for a in self.aktivnosti if a.id == aktivnost_id), None)
-            if aktivnost is None:
-                return total_project_duration
-
-            dependent_activities = [a for a in self.aktivnosti if aktivnost_id in a.odvisnosti]
-            if not dependent_activities:
-                ls_values[aktivnost_id] = total_project_duration - aktivnost.trajanje
-            else:
-                min_ls = min(calculate_ls(dep.id) - aktivnost.trajanje for dep in dependent_activities)
-                ls_values[aktivnost_id] = min_ls
-
-            return ls_values[aktivnost_id]
-
-        # Calculate LS for all activities in reverse order
-        for aktivnost in reversed(self.aktivnosti):
-            aktivnost.ls = calculate_ls(aktivnost.id)
-
-        for a in self.aktivnosti:
-            a.ls = ls_values[a.id]  # Return the calculated LS values
+        backward_pass(self, topological_order(self))
+
+    # Izračun ES, EF, LS, LF, časovne rezerve in kritične poti v enem prehodu naprej in nazaj
+    def izracunaj_kriticno_pot(self):
+        return compute_critical_path(self)
+
+    # Ponoven izračun ES in LS le za aktivnosti, na katere vpliva sprememba
+    def posodobi_cpm(self, spremenjeni_es, spremenjeni_ls, ohrani_koncane=False):
+        # ES se lahko spremeni le aktivnostim iz spremenjeni_es in njihovim naslednikom,
+        # LS pa le aktivnostim iz spremenjeni_ls in njihovim prednikom oz. prednikom finisha,
+        # če se spremeni trajanje projekta; z ohrani_koncane se izračun ustavi pri končanih aktivnostih
+        finish = self.aktivnosti_po_id["finish"]
+        trajanje_projekta = finish.es
+
+        propagate_es(self, spremenjeni_es, skip_finished=ohrani_koncane)
+        if finish.es != trajanje_projekta:
+            spremenjeni_ls = [*spremenjeni_ls, "finish"]
+
+        propagate_ls(self, spremenjeni_ls, skip_finished=ohrani_koncane)
+
+    # Prestavi začetek aktivnosti med simulacijo in posodobi ES in LS njenih naslednikov in prednikov
+    def prestavi_aktivnost(self, aktivnost_id, zacetek):
+        aktivnost = self.aktivnosti_po_id[aktivnost_id]
+        aktivnost.es = aktivnost.ls = zacetek
+        self.posodobi_cpm([aktivnost_id], [aktivnost_id], ohrani_koncane=True)
+
+    # Razdeli aktivnosti (brez starta in finisha) v povezane komponente grafa odvisnosti z union-find,
+    # vrne id -> zaporedna številka komponente v vrstnem redu prve aktivnosti komponente
+    def povezane_komponente(self):
+        stars = {a.id: a.id for a in self.aktivnosti if a.id not in ("start", "finish")}
+
+        def koren(a_id):
+            while stars[a_id] != a_id:
+                stars[a_id] = stars[stars[a_id]]
+                a_id = stars[a_id]
+            return a_id
+
+        for a_id in stars:
+            for odv in self.aktivnosti_po_id[a_id].odvisnosti:
+                if odv in stars:
+                    stars[koren(odv)] = koren(a_id)
+
+        komponente = {}
+        stevilke = {}
+        for a_id in stars:
+            komponente[a_id] = stevilke.setdefault(koren(a_id), len(stevilke))
+        return komponente
 
     def izracunaj_es_naknadno(self):
         # Assuming that ES times are already calculated, recalculate ES for all activities that are unfinished, but do not change the ES of finished activities
-
-        def update_es(aktivnost_id):
-            aktivnost = next((a for a in self.aktivnosti if a.id == aktivnost_id), None)
-            if aktivnost is None:
-                return 0
-
-            if aktivnost.finished:
-                return aktivnost.es
-
-            if "start" in aktivnost.odvisnosti:
-                aktivnost.es = 0
-            else:
-                max_es = max(
-                    update_es(dep) + next(a for a in self.aktivnosti if a.id == dep).trajanje
-                    for dep in aktivnost.odvisnosti
-                )
-                aktivnost.es = max_es
-
-            return aktivnost.es
-
-        for aktivnost in self.aktivnosti:
-            if not aktivnost.finished:
-                update_es(aktivnost.id)
+        forward_pass(self, topological_order(self), skip_finished=True)
 
     def izracunaj_ls_naknadno(self):
         # Assuming that LS times are already calculated, recalculate LS for all activities that are unfinished, but do not change the LS of finished activities
+        backward_pass(self, topological_order(self), skip_finished=True)
 
-        def update_ls(aktivnost):
-            if aktivnost.finished:
-                return aktivnost.ls
-
-            dependent_activities = [a for a in self.aktivnosti if aktivnost.id in a.odvisnosti]
-            if not dependent_activities:
-                aktivnost.ls = max(a.ls for a in self.aktivnosti) - aktivnost.trajanje
-            else:
-                min_ls = min(update_ls(dep) - aktivnost.trajanje for dep in dependent_activities)
-                aktivnost.ls = min_ls
-
-            return aktivnost.ls
-
-        self.aktivnosti[-1].ls = self.aktivnosti[-1].es
-
-        for aktivnost in reversed(self.aktivnosti):
-            if not aktivnost.finished and aktivnost.id != "finish":
-                update_ls(aktivnost)
-
-    # Prestej koliko aktivnosti ni odvisnih od nobene aktivnosti, zgolj za boljšo vizualizacijo
-    def prestej_odvisnosti_od_starta(self):
-        start_dependets = [a.id for a in self.aktivnosti if "start" in a.odvisnosti]
-        dependent_count = len(start_dependets)
-        y_positions = [15 * i for i in range(-dependent_count // 2 + 1, dependent_count // 2 + 1)]
-        return start_dependets, dependent_count, y_positions
-
-    def prikazi_urnik(self, ax, canvas):
+    def prikazi_urnik(self, ax, canvas=None):
         ax.cla()
         rect_width, rect_height = 20, 10
 
-        start_x, start_y = 0, 0  # Starting point for the 'Start' rectangle
-
-        # Dictionary to store position of each activity
-        positions = {}
-        used_positions = set()
-        # Preštejmo koliko aktivnosti je odvisnih od začetne aktivnosti
-        start_dependents, dependent_count, start_dependets_y_positions = self.prestej_odvisnosti_od_starta()
-
-        # Calculate positions of other activities
-        for i, aktivnost in enumerate(self.aktivnosti):
-            if aktivnost.id == "start":
-                x = start_x
-                y = start_y
-
-            elif aktivnost.id == "finish":
-                x = max(positions.values(), key=lambda x: x[0])[0] + rect_width * 1.5  # finish je vedno najbolj desno
-                y = start_y
-
-            else:
-                # če je aktivnost odvisna od starta je njena y koordinata odvisna od tega koliko aktivnosti je odvisnih od starta
-                # tu je pogoj da če je aktivnost odvisna od starta je odvisna LE od starta
-                if "start" in aktivnost.odvisnosti:
-                    y_index = start_dependents.index(aktivnost.id)
-                    y = start_dependets_y_positions[y_index]
-                    x = start_x + rect_width * 1.5
-                else:
-                    x = max(positions[odvisnost][0] + rect_width * 1.5 for odvisnost in aktivnost.odvisnosti)
-                    y = None
-
-                    # try to align with one of the dependencies
-                    for odvisnost in aktivnost.odvisnosti:
-                        potential_y = positions[odvisnost][1]
-                        if (x, potential_y) not in used_positions:
-                            y = potential_y
-                            break
-
-                    if y is None:
-                        y_offset = 0
-                        while True:
-                            potential_y_up = y_offset
-                            potential_y_down = -y_offset
-                            if (x, potential_y_up) not in used_positions:
-                                y = potential_y_up
-                                break
-                            elif (x, potential_y_down) not in used_positions:
-                                y = potential_y_down
-                                break
-                            y_offset += rect_height * 1.5
-
-            positions[aktivnost.id] = (x, y)
-            used_positions.add((x, y))
-
-            # Draw the activity rectangle
-            rect = Rectangle((x, y), rect_width, rect_height, facecolor="skyblue")
-            ax.add_patch(rect)
-            ax.text(
-                x + rect_width / 2,
-                y + rect_height / 2,
-                f"{aktivnost.id}\n[{aktivnost.es}, {aktivnost.ls}]\nt: {aktivnost.trajanje}",
-                horizontalalignment="center",
-                verticalalignment="center",
-            )
+        # plasti od leve proti desni, aktivnosti v plasti pa urejene tako, da se puščice čim manj križajo
+        layout = layered_layout(self)
+        indeks = {a.id: i for i, a in enumerate(self.aktivnosti)}
+        xy = np.array([layout.positions[a.id] for a in self.aktivnosti], dtype=float) * (
+            rect_width * 1.5,
+            rect_height * 1.5,
+        )
 
-        # Draw arrows for dependencies
-        for aktivnost in self.aktivnosti:
-            if aktivnost.odvisnosti:
-                for odvisnost in aktivnost.odvisnosti:
-                    start_pos = positions[odvisnost]
-                    end_pos = positions[aktivnost.id]
-                    arrow = FancyArrowPatch(
-                        (start_pos[0] + rect_width, start_pos[1] + rect_height / 2),
-                        (end_pos[0], end_pos[1] + rect_height / 2),
-                        arrowstyle="simple",
-                        color="red",
-                    )
-                    ax.add_patch(arrow)
+        # vse aktivnosti kot en PolyCollection
+        kot = np.array([(0, 0), (rect_width, 0), (rect_width, rect_height), (0, rect_height)])
+        ax.add_collection(PolyCollection(xy[:, None, :] + kot, facecolors="skyblue", edgecolors="none"))
+
+        if len(self.aktivnosti) <= MAX_OZNAK:
+            for (x, y), aktivnost in zip(xy, self.aktivnosti):
+                ax.text(
+                    x + rect_width / 2,
+                    y + rect_height / 2,
+                    f"{aktivnost.id}\n[{aktivnost.es}, {aktivnost.ls}]\nt: {aktivnost.trajanje}",
+                    horizontalalignment="center",
+                    verticalalignment="center",
+                )
 
-        # Adjust the chart
-        ax.set_xlim(0, max(positions.values(), key=lambda x: x[0])[0] + rect_width * 2)
-        ax.set_ylim(
-            min(positions.values(), key=lambda x: x[1])[1] - rect_height * 2,
-            max(positions.values(), key=lambda x: x[1])[1] + rect_height * 2,
+        # vse odvisnosti kot en LineCollection, konice puščic kot en PolyCollection
+        povezave = np.array(
+            [(indeks[odvisnost], indeks[a.id]) for a in self.aktivnosti for odvisnost in a.odvisnosti], dtype=int
+        ).reshape(-1, 2)
+        zacetki = xy[povezave[:, 0]] + (rect_width, rect_height / 2)
+        konci = xy[povezave[:, 1]] + (0, rect_height / 2)
+        ax.add_collection(LineCollection(np.stack([zacetki, konci], axis=1), colors="red", linewidths=1))
+
+        smer = konci - zacetki
+        smer /= np.maximum(np.linalg.norm(smer, axis=1, keepdims=True), 1e-9)
+        normala = smer[:, ::-1] * (-1, 1)
+        dolzina, sirina = rect_height * 0.4, rect_height * 0.2
+        konice = np.stack(
+            [konci, konci - smer * dolzina + normala * sirina, konci - smer * dolzina - normala * sirina], axis=1
         )
+        ax.add_collection(PolyCollection(konice, facecolors="red", edgecolors="none"))
+
+        # Adjust the chart
+        ax.set_xlim(xy[:, 0].min() - rect_width / 2, xy[:, 0].max() + rect_width * 1.5)
+        ax.set_ylim(xy[:, 1].min() - rect_height * 2, xy[:, 1].max() + rect_height * 3)
         ax.axis("off")  # Turn off the axis
         ax.set_title("Vizualizacija urnika z minimalno časovno rezervo")
-        canvas.draw()
-
-
-def find_next_available_time(resource_availability, required_resources, duration, es):
-    earliest_start_time = es
-
-    while True:
-        all_resources_available = True
-
-        # Check availability for each resource
-        for res in required_resources:
-            intervals = resource_availability[res]
-            # Sort intervals by start time
-            intervals.sort(key=lambda x: x[0])
-
-            resource_free = True
-
-            # Check if the resource is free in the current time slot
-            for start, end in intervals:
-                if start <= earliest_start_time < end:
-                    print("Resource {} is busy in the time slot [{}, {}]".format(res, start, end))
-                    # The resource is busy in this slot, move to the end of this busy period
-                    earliest_start_time = end
-                    resource_free = False
-                    break
-                elif earliest_start_time < start and earliest_start_time + duration > start:
-                    # The current slot is free, but the activity will overlap with the next busy period
-                    earliest_start_time = end
-                    resource_free = False
-                    break
-
-            if not resource_free:
-                all_resources_available = False
-                break
-
-        # If all resources are available, return this time slot
-        if all_resources_available:
-            return earliest_start_time
+        if canvas is not None:  # brez platna (izvoz v datoteko) se figura izriše ob shranjevanju
+            canvas.draw()
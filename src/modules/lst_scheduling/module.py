@@ -1,12 +1,16 @@
 from typing import TYPE_CHECKING
 import tkinter as tk
 import tkinter.messagebox as msgbox
-import matplotlib.pyplot as plt  # type: ignore
+from tkinter import filedialog
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg  # type: ignore
-from matplotlib.patches import Rectangle
 
+from common.figures import create_figure, release_figure
 from common.module import Module
-from .lst import Aktivnost, Planer, find_next_available_time
+from .cpm import CycleError
+from .gantt import GanttChart, component_colors, renewable_resources
+from .lst import Aktivnost, Planer
+from .project_io import ProjectFormatError, load_project, save_project
+from .scheduler import LSTScheduler
 
 if TYPE_CHECKING:
     from common.app import App
@@ -14,22 +18,18 @@ if TYPE_CHECKING:
 
 instructions = """
 1. Add resources that you will use in the simulation. (e.g. Cup)
+        -> quantity: how many units of the resource exist (e.g. 2)
+        -> consumable: used up units are never returned (e.g. Coffee beans)
 2. Add activities, where each activity has:
         -> unique ID (e.g. Dinner)
         -> duration (e.g. 30)
         -> list of activities that must be executed directly before this activity, separated by commas (e.g. Breakfast,Lunch)
-        -> list of resources that the activity needs, separated by commas (e.g. Cup)
+        -> list of resources that the activity needs, separated by commas, optionally with the amount (e.g. Cup,Plate:2)
+   Alternatively, import a whole project from a JSON or CSV file with "Import Project"
+   (see the module README for the format), and save the current one with "Export Project".
 3. Click on the "Start simulation" button
-4. Click on the "Next step" button to show the next activity to be executed"""
-
-color_palette = [
-    "skyblue",
-    "lightgreen",
-    "lightcoral",
-    "khaki",
-    "lightpink",
-    "plum",
-]
+4. Click on the "Next step" button to show the next activity to be executed,
+   or on the "Run all steps" button to schedule all remaining activities at once"""
 
 
 class LST_Scheduling(Module):
@@ -45,27 +45,28 @@ class LST_Scheduling(Module):
 
         self.planer = Planer()
         self.activity_color_mapping = {}
-        self.current_color_index = 0
         self.fig = None
         self.ax = None
         self.canvas = None
+        self.new_window: tk.Toplevel | None = None
         self.new_fig = None
         self.new_ax = None
         self.new_canvas = None
+        self.gantt: GanttChart | None = None
+        # stanje simulacije (koledar resursov, pripravljene aktivnosti, trenutni čas), ohranjeno med koraki
+        self.scheduler: LSTScheduler | None = None
 
         self.create_widgets()
 
     def destroy(self) -> None:
         """Clean up resources when the module is destroyed."""
-        if self.fig:
-            plt.close(self.fig)
-        if self.new_fig:
-            plt.close(self.new_fig)
+        self.zapri_simulacijo()
+        release_figure(self.fig)
         super().destroy()
 
     def create_widgets(self) -> None:
         # Create figure and canvas
-        self.fig, self.ax = plt.subplots()
+        self.fig, self.ax = create_figure()
         self.ax.axis("off")
         self.canvas = FigureCanvasTkAgg(self.fig, master=self)
         self.canvas_widget = self.canvas.get_tk_widget()
@@ -124,7 +125,7 @@ class LST_Scheduling(Module):
         # Resources
         self.resursi_label = tk.Label(
             master=self.frame_aktivnost,
-            text="Resources (format: Resource1,Resource2,...):",
+            text="Resources (format: Resource1,Resource2:amount,...):",
         )
         self.resursi_label.grid(row=3, column=0, sticky="w")
         self.resursi_entry = tk.Entry(
@@ -146,6 +147,8 @@ class LST_Scheduling(Module):
         self.frame_resurs = tk.Frame(self, relief=tk.RIDGE, borderwidth=5)
         self.frame_resurs.grid_rowconfigure(0, weight=1)
         self.frame_resurs.grid_rowconfigure(1, weight=1)
+        self.frame_resurs.grid_rowconfigure(2, weight=1)
+        self.frame_resurs.grid_rowconfigure(3, weight=1)
         self.frame_resurs.grid_columnconfigure(0, weight=1)
         self.frame_resurs.grid_columnconfigure(1, weight=1)
 
@@ -161,6 +164,28 @@ class LST_Scheduling(Module):
         self.all_resources_entry = tk.Entry(self.frame_resurs, width=20)
         self.all_resources_entry.grid(row=0, column=1, sticky="ew", padx=5)
 
+        # Resource quantity input
+        self.kolicina_label = tk.Label(
+            self.frame_resurs,
+            text="Quantity (natural number):",
+            anchor="w",
+            padx=5,
+        )
+        self.kolicina_label.grid(row=1, column=0, sticky="w")
+
+        self.kolicina_entry = tk.Entry(self.frame_resurs, width=20)
+        self.kolicina_entry.insert(0, "1")
+        self.kolicina_entry.grid(row=1, column=1, sticky="ew", padx=5)
+
+        # Consumable checkbox
+        self.consumable_var = tk.BooleanVar(value=False)
+        self.consumable_checkbox = tk.Checkbutton(
+            self.frame_resurs,
+            text="Consumable",
+            variable=self.consumable_var,
+        )
+        self.consumable_checkbox.grid(row=2, column=0, columnspan=2, sticky="w")
+
         # Add resource button
         self.dodaj_resurs_button = tk.Button(
             self.frame_resurs,
@@ -168,18 +193,32 @@ class LST_Scheduling(Module):
             command=self.dodaj_resurs,
             width=15,
         )
-        self.dodaj_resurs_button.grid(row=1, column=0, columnspan=2, pady=5)
+        self.dodaj_resurs_button.grid(row=3, column=0, columnspan=2, pady=5)
 
         # Position resource frame
         self.frame_resurs.grid(row=1, column=1, sticky="nsew", padx=5)
 
-        # Start simulation button
+        # Import, export and start simulation buttons
+        self.frame_gumbi = tk.Frame(self)
+        self.uvozi_button = tk.Button(
+            self.frame_gumbi,
+            text="Import Project",
+            command=self.uvozi_projekt,
+        )
+        self.uvozi_button.pack(side=tk.LEFT, padx=5)
+        self.izvozi_button = tk.Button(
+            self.frame_gumbi,
+            text="Export Project",
+            command=self.izvozi_projekt,
+        )
+        self.izvozi_button.pack(side=tk.LEFT, padx=5)
         self.zacni_simulacijo_button = tk.Button(
-            self,
+            self.frame_gumbi,
             text="Start Simulation",
             command=self.simuliraj,
         )
-        self.zacni_simulacijo_button.grid(row=2, column=0, columnspan=2)
+        self.zacni_simulacijo_button.pack(side=tk.LEFT, padx=5)
+        self.frame_gumbi.grid(row=2, column=0, columnspan=2)
 
         # Create activities and resources window
         self.help_window = tk.Toplevel(self)
@@ -213,15 +252,30 @@ class LST_Scheduling(Module):
             resursi = {}
             if resursi_vnos:
                 for resurs in resursi_vnos.split(","):
-                    ime_resursa = resurs.strip()
-                    if ime_resursa in self.planer.all_resources:
-                        resursi[ime_resursa.strip()] = int(1)
-                    else:
+                    ime_resursa, _, kolicina_vnos = resurs.partition(":")
+                    ime_resursa = ime_resursa.strip()
+                    if ime_resursa not in self.planer.all_resources:
                         msgbox.showerror("Error", f"Resource {ime_resursa} does not exist")
                         return
+
+                    kolicina = int(kolicina_vnos) if kolicina_vnos.strip().isdigit() else None
+                    if kolicina_vnos and not kolicina:
+                        msgbox.showerror("Error", f"Invalid amount of resource {ime_resursa}.")
+                        return
+                    if kolicina and kolicina > self.planer.all_resources[ime_resursa]["kolicina"]:
+                        msgbox.showerror("Error", f"Resource {ime_resursa} has fewer than {kolicina} units")
+                        return
+                    resursi[ime_resursa] = kolicina or 1
             nova_aktivnost = Aktivnost(id_aktivnosti, trajanje, odvisnosti, resursi)
-            self.planer.dodaj_aktivnost(nova_aktivnost)
-            self.planer.prikazi_urnik(self.ax, self.canvas)
+            try:
+                self.planer.dodaj_aktivnost(nova_aktivnost)
+            except CycleError as e:
+                msgbox.showerror("Error", str(e))
+                return
+            self.request_redraw(self.narisi_urnik)
+            if self.scheduler is not None:  # nova aktivnost med simulacijo, obdržimo že rezervirane resurse
+                self.scheduler = LSTScheduler(self.planer, self.scheduler.profiles, eager_updates=True)
+                self.posodobi_barve()
 
             # počisti vnose
             self.id_entry.delete(0, tk.END)
@@ -246,91 +300,136 @@ class LST_Scheduling(Module):
     def dodaj_resurs(self) -> None:
         try:
             resurs_name = self.all_resources_entry.get()
+            resurs_quantity = int(self.kolicina_entry.get())
+            consumable = self.consumable_var.get()
 
             if resurs_name in self.planer.all_resources:
                 msgbox.showerror("Error", f"Resurs with name {resurs_name} already exists")
                 return
 
-            if resurs_name:  # and resurs_quantity > 0:
-                self.planer.dodaj_resource(resurs_name, 1, False)
+            if resurs_name and resurs_quantity > 0:
+                self.planer.dodaj_resource(resurs_name, resurs_quantity, consumable)
             else:
                 msgbox.showerror("Error", "Invalid input for resource.")
+                return
         except ValueError:
             msgbox.showerror("Error", "Invalid input for resource quantity.")
+            return
 
         self.all_resources_entry.delete(0, tk.END)
+        self.kolicina_entry.delete(0, tk.END)
+        self.kolicina_entry.insert(0, "1")
+        self.consumable_var.set(False)
 
         # posodobi listbox
-        self.listbox_resources.insert(tk.END, resurs_name)
+        self.listbox_resources.insert(
+            tk.END, f"{resurs_name} ({resurs_quantity}{', consumable' if consumable else ''})"
+        )
 
-    def draw_activity_on_canvas(self, ax, activity, start_time, end_time, y_pos):
-        def find_connected_activities(activity, connected_set):
-            if activity.id in connected_set:
-                return
-            connected_set.add(activity.id)
-            for dep_activity in self.planer.aktivnosti:
-                if activity.id in dep_activity.odvisnosti:
-                    find_connected_activities(dep_activity, connected_set)
-
-        # Check if the activity is already in the color mapping
-        if activity.id not in self.activity_color_mapping:
-            connected_activities = set()
-            find_connected_activities(activity, connected_activities)
-            # Assign a color to all connected activities
-            face_color = color_palette[self.current_color_index % len(color_palette)]
-            self.current_color_index += 1
-            for act_id in connected_activities:
-                self.activity_color_mapping[act_id] = face_color
-        else:
-            face_color = self.activity_color_mapping[activity.id]
-
-        rect_height = 8
-        border_color = "black"
-        border_width = 2
-
-        rect = Rectangle(
-            (start_time, y_pos - rect_height / 2),
-            activity.trajanje,
-            rect_height,
-            facecolor=face_color,
-            edgecolor=border_color,
-            linewidth=border_width,
+    def posodobi_barve(self) -> None:
+        # povezane aktivnosti imajo isto barvo, zato komponente izračunamo enkrat ob začetku simulacije
+        self.activity_color_mapping = component_colors(self.planer)
+
+    def uvozi_projekt(self) -> None:
+        path = filedialog.askopenfilename(
+            parent=self, filetypes=[("Project files", "*.json *.csv"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+
+        try:
+            planer = load_project(path)
+        except ProjectFormatError as e:
+            # pri velikih datotekah prikažemo le prvih nekaj napak
+            napake = e.errors[:10] + ([f"... and {len(e.errors) - 10} more"] if len(e.errors) > 10 else [])
+            msgbox.showerror("Error", "Invalid project file:\n" + "\n".join(napake))
+            return
+        except (OSError, UnicodeDecodeError) as e:
+            msgbox.showerror("Error", f"Could not read {path}: {e}")
+            return
+
+        # uvožen projekt nadomesti trenutnega, tudi morebitno simulacijo
+        self.planer = planer
+        self.scheduler = None
+        self.request_redraw(self.narisi_urnik)
+
+        self.listbox_activities.delete(0, tk.END)
+        self.listbox_activities.insert(
+            tk.END,
+            *(
+                f"{a.id}, {a.trajanje}, {a.odvisnosti}, {list(a.resursi.keys())}"
+                for a in self.planer.aktivnosti
+                if a.id not in ("start", "finish")
+            ),
+        )
+        self.listbox_resources.delete(0, tk.END)
+        self.listbox_resources.insert(
+            tk.END,
+            *(
+                f"{ime} ({r['kolicina']}{', consumable' if r['consumable'] else ''})"
+                for ime, r in self.planer.all_resources.items()
+                if ime != "Brez"
+            ),
         )
-        ax.add_patch(rect)
-
-        # Add text inside the rectangle
-        text = f"{activity.id}\n[{start_time}, {end_time}]"
-        ax.text(
-            start_time + activity.trajanje / 2,
-            y_pos,
-            text,
-            ha="center",
-            va="center",
-            color="black",
+
+    def izvozi_projekt(self) -> None:
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json"), ("CSV", "*.csv")],
         )
+        if not path:
+            return
 
-        # Adjust the axes limits if necessary
-        ax.set_xlim(0, max(end_time + 10, ax.get_xlim()[1]))  # Adjust the x-axis limit
-        ax.set_ylim(
-            min(y_pos - rect_height, ax.get_ylim()[0]),
-            max(y_pos + rect_height, ax.get_ylim()[1]),
-        )  # Adjust the y-axis limit
+        try:
+            save_project(self.planer, path)
+        except OSError as e:
+            msgbox.showerror("Error", f"Could not write {path}: {e}")
+
+    def zapri_simulacijo(self):
+        """Zapre okno simulacije in vrne njegovo figuro v skupni bazen."""
+        if self.new_window is not None:
+            self.new_window.destroy()
+        release_figure(self.new_fig)
+        self.new_window = None
+        self.new_fig = self.new_ax = self.new_canvas = None
+
+    def narisi_urnik(self) -> None:
+        """Izriše mrežni diagram z ES in LS; kliče se prek request_redraw, največ enkrat na sličico."""
+        self.planer.prikazi_urnik(self.ax, self.canvas)
+
+    def narisi_simulacijo(self) -> None:
+        """Izriše aktivnosti, dodane v Ganttov diagram od zadnjega izrisa, če je okno simulacije še odprto."""
+        if self.new_canvas is None:
+            return
+        self.gantt.flush()
+        self.new_canvas.draw()
 
     def simuliraj(self):
+        # prejšnje okno simulacije zapremo, sicer bi vsaka simulacija pustila svojo figuro
+        self.zapri_simulacijo()
+
         # Kreiraj novo okno
-        new_window = tk.Toplevel(self)
+        new_window = self.new_window = tk.Toplevel(self)
+        new_window.protocol("WM_DELETE_WINDOW", self.zapri_simulacijo)
         new_window.title("LST Scheduling")
         new_window.geometry("800x650")
         new_window.grid_columnconfigure(0, weight=1)
         new_window.grid_rowconfigure(0, weight=3)
         new_window.grid_rowconfigure(1, weight=1)
 
-        self.new_fig, self.new_ax = plt.subplots()
+        previous_profiles = self.scheduler.profiles if self.scheduler is not None else None
+        # po korakih prikazujemo ES in LS, zato morajo biti po vsakem koraku posodobljeni
+        self.scheduler = LSTScheduler(self.planer, previous_profiles, eager_updates=True)
+        self.posodobi_barve()
+
+        self.new_fig, self.new_ax = create_figure()
         self.new_ax.set_xlim(0, 100)
         self.new_ax.set_ylim(0, 100)
         self.new_canvas = FigureCanvasTkAgg(self.new_fig, master=new_window)
         self.new_canvas_widget = self.new_canvas.get_tk_widget()
         self.new_canvas_widget.grid(row=0, column=0, columnspan=2, sticky="nsew")
+        self.gantt = GanttChart(self.new_ax)
 
         # Dodaj gumb next step
         next_step_button = tk.Button(
@@ -341,79 +440,82 @@ class LST_Scheduling(Module):
         )
         next_step_button.grid(row=1, column=0, columnspan=1)
 
+        run_all_button = tk.Button(
+            new_window,
+            text="Run all steps",
+            command=self.run_all_steps,
+            font=("Helvetica", 16),
+        )
+        run_all_button.grid(row=1, column=1, columnspan=1)
+
         # Dodaj resource ki imajo consumable = False
-        resource_names = list([r for r in self.planer.all_resources if not self.planer.all_resources[r]["consumable"]])
-        y_positions = [i * 20 for i in range(len(resource_names))]
-        self.resource_y_positions = {name: y_pos for name, y_pos in zip(resource_names, y_positions)}
+        self.gantt.set_rows(renewable_resources(self.planer))
 
-        self.new_ax.set_yticks(y_positions)
-        self.new_ax.set_yticklabels(resource_names)
-        self.new_ax.set_ylim(min(y_positions) - 20, max(y_positions) + 20)
+    def schedule_step(self):
+        # razporedimo aktivnost z najmanjšim slackom, ki ima vse predhodnike končane
+        try:
+            scheduled = self.scheduler.step()
+        except ValueError as e:  # resursa ni dovolj niti, ko je prost
+            msgbox.showerror("Error", str(e))
+            return None
+
+        # aktivnost narišemo k vsakemu resursu, ki ga potrebuje; izriše se ob naslednjem self.gantt.flush()
+        self.gantt.add_activity(
+            scheduled.aktivnost.id,
+            scheduled.start_time,
+            scheduled.end_time,
+            scheduled.resources,
+            self.activity_color_mapping[scheduled.aktivnost.id],
+        )
 
-    def next_step(self) -> None:
-        if (
-            "resource_availability" not in globals()
-        ):  # dict kjer za vsak resurs hranimo tuple (start_time, end_time) ki predstavljajo kdaj je ta resurs zaseden
-            resource_availability = {res: [] for res in self.planer.all_resources}
+        return scheduled
 
-        unfinished_activities = [
-            a for a in self.planer.aktivnosti if not a.finished and a.id not in ["start", "finish"]
-        ]
+    def next_step(self) -> None:
+        if self.scheduler is None:
+            return
 
-        if not unfinished_activities:
+        if self.scheduler.done:
             msgbox.showinfo("Info", "All activities are finished.")
             return
 
-        ready_activities = [
-            a
-            for a in unfinished_activities
-            if all(dep.finished for dep in self.planer.aktivnosti if dep.id in a.odvisnosti)
-        ]  # aktivnosti ki imajo vse potrebne predhodnike končane
-
-        if not ready_activities:
+        scheduled = self.schedule_step()
+        if scheduled is None:
             return
 
-        available_activities_slack = {
-            a: a.ls - a.es for a in ready_activities
-        }  # za vse izračunamo slack in vzamemo aktivnost z najmanjšim slackom
-        activity_with_smallest_slack = min(available_activities_slack, key=available_activities_slack.get)
-
-        # start time za aktivnost z najmanjšim slackom
-        if activity_with_smallest_slack.resursi:
-            required_resources = list(
-                activity_with_smallest_slack.resursi.keys()
-            )  # pogledamo katere vse resurse potrebuje aktivnost
-            start_time = find_next_available_time(
-                resource_availability,
-                required_resources,
-                activity_with_smallest_slack.trajanje,
-                activity_with_smallest_slack.es,
-            )  # poiščemo čas ko so vsi resursi prosti za celotno trajanje aktivnosti
-            y_positions = [
-                self.resource_y_positions.get(res, 0) for res in required_resources
-            ]  # aktivnost bomo narisal k vsakmu resursu ki ga potrebuje
-            end_time = start_time + activity_with_smallest_slack.trajanje
-            for res in required_resources:  # dict resource_availability posodobimo z novim časom ko so resursi zasedeni
-                resource_availability[res].append((start_time, end_time))
-
-        else:  # če ne uporabla resursov jo narišemo k "Brez" in je njen start time enak njenemu ES
-            start_time = activity_with_smallest_slack.es
-            y_positions = [self.resource_y_positions.get("Brez", 0)]
-            self.resource_y_positions["Brez"] -= 10
-            end_time = start_time + activity_with_smallest_slack.trajanje
-
-        activity_with_smallest_slack.finished = True
-
         if (
-            start_time > activity_with_smallest_slack.ls
-        ):  # posodobimo ES in LS za vse aktivnosti če ES presega pričakovan LS (LS kjer nismo upoštevali resursov)
+            scheduled.delayed
+        ):  # ES in LS sta bila posodobljena, ker je ES presegel pričakovan LS (LS kjer nismo upoštevali resursov)
             msgbox.showinfo("Info", "ES exceeds expected value. Updating ES and LS on the graph.")
-            activity_with_smallest_slack.es = activity_with_smallest_slack.ls = start_time
-            self.planer.izracunaj_es_naknadno()
-            self.planer.izracunaj_ls_naknadno()
-            self.planer.prikazi_urnik(self.ax, self.canvas)
+            self.request_redraw(self.narisi_urnik)
 
-        for y_pos in y_positions:  # narišemo na canvas aktivnost k vsem njenim resursom
-            self.draw_activity_on_canvas(self.new_ax, activity_with_smallest_slack, start_time, end_time, y_pos)
+        self.request_redraw(self.narisi_simulacijo)
 
-        self.new_canvas.draw()
+    def run_all_steps(self) -> None:
+        if self.scheduler is None:
+            return
+
+        if self.scheduler.done:
+            msgbox.showinfo("Info", "All activities are finished.")
+            return
+
+        # vse korake razporedimo brez sprotnih posodobitev ES in LS, ki bi pri velikem projektu vsak zamik
+        # prenesle skozi ves projekt, in jih izrišemo naenkrat; graf ES in LS pa le enkrat na koncu
+        self.scheduler = LSTScheduler(self.planer, self.scheduler.profiles)
+        delayed = False
+        while not self.scheduler.done:
+            scheduled = self.schedule_step()
+            if scheduled is None:
+                break
+            delayed = delayed or scheduled.delayed
+
+        # en prehod CPM posodobi ES in LS aktivnosti, ki ostanejo nerazporejene, če je korak spodletel,
+        # nadaljnji koraki pa spet sproti posodabljajo ES in LS
+        self.planer.izracunaj_es_naknadno()
+        self.planer.izracunaj_ls_naknadno()
+        self.scheduler = LSTScheduler(self.planer, self.scheduler.profiles, eager_updates=True)
+
+        self.request_redraw(self.narisi_simulacijo)
+
+        if delayed:
+            msgbox.showinfo("Info", "ES exceeded the expected value. Updating ES and LS on the graph.")
+            self.request_redraw(self.narisi_urnik)
@@ -0,0 +1,279 @@
+"""
+Import and export of LST projects.
+
+JSON files hold the resources and the activities:
+
+    {
+        "resources": [{"name": "Cup", "quantity": 2, "consumable": false}],
+        "activities": [{"id": "Tea", "duration": 3, "dependencies": ["Water"], "resources": {"Cup": 1}}]
+    }
+
+CSV files hold one activity per row, with the columns id, duration, dependencies and resources.
+Dependencies are separated by ";" and resources are written as Name:amount separated by ";".
+The activities may be preceded by a resource section with the columns resource, quantity and
+consumable, ended by an empty line:
+
+    resource,quantity,consumable
+    Cup,2,false
+
+    id,duration,dependencies,resources
+    Tea,3,Water,Cup:1
+
+Without it, each resource gets the largest amount any activity requires as its quantity and is
+not consumable.
+
+The whole file is validated before the planer is built and all problems are reported together.
+Activities can be listed in any order; indexes are built and ES/LS computed only once.
+"""
+
+import csv
+import json
+import os
+from typing import Any, Dict, List, Tuple, Union
+
+from .cpm import CycleError
+from .lst import Aktivnost, Planer
+
+PathLike = Union[str, os.PathLike]
+
+CSV_FIELDS = ("id", "duration", "dependencies", "resources")
+CSV_RESOURCE_FIELDS = ("resource", "quantity", "consumable")
+
+
+class ProjectFormatError(ValueError):
+    """Raised when a project file is malformed; errors lists every problem found."""
+
+    def __init__(self, errors: List[str]) -> None:
+        self.errors = errors
+        super().__init__("\n".join(errors))
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _read_json(path: PathLike) -> Tuple[List[Dict], List[Dict]]:
+    with open(path, encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ProjectFormatError([f"Invalid JSON: {e}"])
+
+    if not isinstance(data, dict) or not isinstance(data.get("activities"), list):
+        raise ProjectFormatError(['Expected an object with an "activities" list'])
+    if not isinstance(data.get("resources", []), list):
+        raise ProjectFormatError(['"resources" must be a list'])
+    return data.get("resources", []), data["activities"]
+
+
+def _split(value: str) -> List[str]:
+    return [part.strip() for part in value.split(";") if part.strip()]
+
+
+def _read_csv_resources(reader: Any, header: List[str]) -> List[Dict]:
+    """Read the rows of the resource section up to the empty line that ends it."""
+    resources = []
+    for row in reader:
+        if not any(cell.strip() for cell in row):
+            break
+
+        row = dict(zip(header, row))
+        resource: Dict[str, Any] = {"name": (row.get("resource") or "").strip()}
+        quantity = (row.get("quantity") or "").strip()
+        if quantity:
+            resource["quantity"] = int(quantity) if quantity.isdigit() else quantity
+        consumable = (row.get("consumable") or "").strip()
+        if consumable:
+            resource["consumable"] = {"true": True, "false": False}.get(consumable.lower(), consumable)
+        resources.append(resource)
+    return resources
+
+
+def _read_csv(path: PathLike) -> Tuple[List[Dict], List[Dict]]:
+    resources = None
+    activities = []
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header and header[0] == "resource":
+            resources = _read_csv_resources(reader, header)
+            header = next(reader, None)
+        if header is None or not {"id", "duration"} <= set(header):
+            raise ProjectFormatError(["CSV header must contain at least the columns id and duration"])
+
+        for values in reader:
+            if not values:
+                continue
+            row = dict(zip(header, values))
+            line = reader.line_num
+            duration = (row.get("duration") or "").strip()
+            requirements: Dict[str, Any] = {}
+            for resource in _split(row.get("resources") or ""):
+                name, _, amount = resource.partition(":")
+                requirements[name.strip()] = int(amount) if amount.strip().isdigit() else amount.strip() or 1
+
+            activities.append(
+                {
+                    "id": (row.get("id") or "").strip(),
+                    "duration": int(duration) if duration.isdigit() else duration,
+                    "dependencies": _split(row.get("dependencies") or ""),
+                    "resources": requirements,
+                    "line": line,
+                }
+            )
+
+    if resources is not None:
+        return resources, activities
+
+    # brez razdelka z resursi je količina resursa največja zahtevana količina
+    quantities: Dict[str, int] = {}
+    for activity in activities:
+        for name, amount in activity["resources"].items():
+            if _is_int(amount):
+                quantities[name] = max(quantities.get(name, 1), amount)
+            else:
+                quantities.setdefault(name, 1)
+    return [{"name": name, "quantity": quantity} for name, quantity in quantities.items()], activities
+
+
+def build_planer(resources: List[Dict], activities: List[Dict]) -> Planer:
+    """
+    Validate resource and activity records and build a Planer with ES/LS computed.
+
+    Raises:
+        ProjectFormatError: With all problems found in the records, including dependency cycles
+    """
+    errors = []
+    planer = Planer()
+
+    names = set()
+    for i, resource in enumerate(resources):
+        where = f"Resource {i + 1}"
+        if not isinstance(resource, dict) or not isinstance(resource.get("name"), str) or not resource["name"]:
+            errors.append(f"{where}: missing name")
+            continue
+        if resource["name"] in names:
+            errors.append(f"{where}: duplicate name {resource['name']}")
+            continue
+        names.add(resource["name"])
+        quantity = resource.get("quantity", 1)
+        consumable = resource.get("consumable", False)
+        if not _is_int(quantity) or quantity <= 0:
+            errors.append(f"{where} ({resource['name']}): quantity must be a natural number")
+        elif not isinstance(consumable, bool):
+            errors.append(f"{where} ({resource['name']}): consumable must be true or false")
+        else:
+            planer.dodaj_resource(resource["name"], quantity, consumable)
+
+    # najprej vse ID-je, da so odvisnosti lahko navedene tudi pred aktivnostjo
+    ids = set()
+    for i, activity in enumerate(activities):
+        if isinstance(activity, dict) and isinstance(activity.get("id"), str) and activity["id"]:
+            if activity["id"] in ids or activity["id"] in ("start", "finish"):
+                errors.append(f"Activity {activity.get('line', i + 1)}: duplicate or reserved ID {activity['id']}")
+            ids.add(activity["id"])
+
+    aktivnosti = []
+    for i, activity in enumerate(activities):
+        if not isinstance(activity, dict) or not isinstance(activity.get("id"), str) or not activity["id"]:
+            errors.append(f"Activity {i + 1}: missing ID")
+            continue
+
+        where = f"Activity {activity.get('line', i + 1)} ({activity['id']})"
+        duration = activity.get("duration")
+        dependencies = activity.get("dependencies", [])
+        requirements = activity.get("resources", {})
+
+        if not _is_int(duration) or duration < 0:
+            errors.append(f"{where}: duration must be a natural number")
+        if (
+            not isinstance(dependencies, list)
+            or not all(isinstance(dep, str) for dep in dependencies)
+            or not isinstance(requirements, dict)
+        ):
+            errors.append(f"{where}: dependencies must be a list of IDs and resources an object")
+            continue
+
+        missing = [dep for dep in dependencies if dep not in ids and dep != "start"]
+        if missing:
+            errors.append(f"{where}: depends on non-existent activities {', '.join(map(str, missing))}")
+        for name, amount in requirements.items():
+            if name not in planer.all_resources:
+                errors.append(f"{where}: resource {name} does not exist")
+            elif not _is_int(amount) or amount <= 0:
+                errors.append(f"{where}: invalid amount of resource {name}")
+            elif amount > planer.all_resources[name]["kolicina"]:
+                errors.append(f"{where}: resource {name} has fewer than {amount} units")
+
+        aktivnosti.append(Aktivnost(activity["id"], duration, list(dependencies), dict(requirements)))
+
+    if errors:
+        raise ProjectFormatError(errors)
+
+    try:
+        planer.dodaj_aktivnosti(aktivnosti)
+    except CycleError as e:
+        raise ProjectFormatError([str(e)])
+    return planer
+
+
+def load_project(path: PathLike) -> Planer:
+    """
+    Load a project from a .json or .csv file.
+
+    Raises:
+        ProjectFormatError: If the file is malformed
+        OSError: If the file cannot be read
+    """
+    if str(path).lower().endswith(".csv"):
+        resources, activities = _read_csv(path)
+    else:
+        resources, activities = _read_json(path)
+    return build_planer(resources, activities)
+
+
+def save_project(planer: Planer, path: PathLike) -> None:
+    """Save the activities and resources of a planer to a .json or .csv file."""
+    activities = [
+        {
+            "id": a.id,
+            "duration": a.trajanje,
+            "dependencies": [str(dep) for dep in a.odvisnosti if dep != "start"],
+            "resources": dict(a.resursi),
+        }
+        for a in planer.aktivnosti
+        if a.id not in ("start", "finish")
+    ]
+
+    resources = [
+        {"name": name, "quantity": r["kolicina"], "consumable": r["consumable"]}
+        for name, r in planer.all_resources.items()
+        if name != "Brez"
+    ]
+
+    if str(path).lower().endswith(".csv"):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            if resources:
+                resource_writer = csv.writer(f)
+                resource_writer.writerow(CSV_RESOURCE_FIELDS)
+                for resource in resources:
+                    resource_writer.writerow(
+                        [resource["name"], resource["quantity"], str(resource["consumable"]).lower()]
+                    )
+                resource_writer.writerow([])
+
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            for activity in activities:
+                writer.writerow(
+                    {
+                        "id": activity["id"],
+                        "duration": activity["duration"],
+                        "dependencies": ";".join(activity["dependencies"]),
+                        "resources": ";".join(f"{name}:{amount}" for name, amount in activity["resources"].items()),
+                    }
+                )
+        return
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"resources": resources, "activities": activities}, f, indent=2)
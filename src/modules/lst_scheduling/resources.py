@@ -0,0 +1,196 @@
+"""
+Resource bookkeeping for the LST scheduler.
+
+ResourceCalendar keeps busy periods as sorted, non-overlapping half-open intervals [start, end),
+stored in two parallel lists so that lookups can use bisect.
+
+ResourceProfiles tracks resources with a capacity (kolicina) as step functions of the amount
+in use over time, and also handles consumable resources. Every profile keeps, for each amount
+limit it was queried with, the periods in which the usage exceeds the limit in a ResourceCalendar,
+so a search for a free window skips a busy run with one bisect instead of walking its segments.
+"""
+
+from bisect import bisect_left, bisect_right
+import math
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+
+class ResourceCalendar:
+    """
+    Busy intervals of a set of resources.
+
+    Adjacent and overlapping reservations are merged, so each resource's intervals are
+    always sorted and separated by free gaps. Intervals may extend to infinity.
+    """
+
+    def __init__(self, resources: Iterable[Hashable] = ()) -> None:
+        self._starts: Dict[Hashable, List[float]] = {}
+        self._ends: Dict[Hashable, List[float]] = {}
+        for resource in resources:
+            self.add_resource(resource)
+
+    def add_resource(self, resource: Hashable) -> None:
+        """Register a resource that is free at all times."""
+        self._starts.setdefault(resource, [])
+        self._ends.setdefault(resource, [])
+
+    def busy_intervals(self, resource: Hashable) -> List[Tuple[float, float]]:
+        """Return the merged busy intervals of a resource."""
+        return list(zip(self._starts[resource], self._ends[resource]))
+
+    def reserve(self, resource: Hashable, start: float, end: float) -> None:
+        """Mark a resource busy in [start, end), merging with touching intervals."""
+        if end <= start:
+            return
+
+        self.add_resource(resource)
+        starts, ends = self._starts[resource], self._ends[resource]
+
+        # intervali [lo, hi) se prekrivajo z novim ali se ga dotikajo
+        lo = bisect_left(ends, start)
+        hi = bisect_right(starts, end)
+        if lo < hi:
+            start = min(start, starts[lo])
+            end = max(end, ends[hi - 1])
+
+        starts[lo:hi] = [start]
+        ends[lo:hi] = [end]
+
+    def earliest_gap(self, resource: Hashable, time: float, duration: float) -> float:
+        """
+        Return the earliest t >= time such that the resource is free in [t, t + duration),
+        or infinity if there is no such t.
+        """
+        starts, ends = self._starts.get(resource, []), self._ends.get(resource, [])
+
+        # prvi interval, ki se konča po time; vsak nadaljnji interval je ločen od prejšnjega s prostim
+        # presledkom, zato se zanka ponovi le za presledke, krajše od duration
+        i = bisect_right(ends, time)
+        while i < len(starts) and (starts[i] <= time or starts[i] < time + duration):
+            time = ends[i]
+            i += 1
+
+        return time
+
+    def earliest_start(self, resources: Iterable[Hashable], time: float, duration: float) -> float:
+        """Return the earliest t >= time such that all resources are free in [t, t + duration)."""
+        resources = list(resources)
+        while True:
+            candidate = time
+            for resource in resources:
+                candidate = self.earliest_gap(resource, candidate, duration)
+
+            if candidate == time:
+                return time
+            time = candidate
+
+
+class ResourceProfile:
+    """
+    Usage of one resource over time, as a step function.
+
+    usage[i] is the amount in use on [times[i], times[i + 1]); the last segment extends to infinity.
+    The periods in which the usage exceeds a limit are kept in a ResourceCalendar under that limit,
+    for every limit passed to earliest_fit so far.
+    """
+
+    def __init__(self) -> None:
+        self.times: List[float] = [-math.inf]
+        self.usage: List[float] = [0]
+        self._limits: Set[float] = set()
+        self._over = ResourceCalendar()
+
+    def _split(self, time: float) -> int:
+        """Make sure a segment starts at time and return its index."""
+        i = bisect_right(self.times, time) - 1
+        if self.times[i] != time:
+            i += 1
+            self.times.insert(i, time)
+            self.usage.insert(i, self.usage[i - 1])
+        return i
+
+    def _segment_end(self, k: int) -> float:
+        return self.times[k + 1] if k + 1 < len(self.times) else math.inf
+
+    def add(self, start: float, end: float, amount: float) -> None:
+        """Use amount of the resource in [start, end); end may be infinite."""
+        if end <= start:
+            return
+
+        i = self._split(start)
+        j = self._split(end) if end != math.inf else len(self.times)
+        for k in range(i, j):
+            for limit in self._limits:
+                if self.usage[k] <= limit < self.usage[k] + amount:
+                    self._over.reserve(limit, self.times[k], self._segment_end(k))
+            self.usage[k] += amount
+
+    def earliest_fit(self, time: float, duration: float, limit: float) -> Optional[float]:
+        """
+        Return the earliest t >= time such that usage stays <= limit on [t, t + duration),
+        or None if there is no such t. duration may be infinite.
+        """
+        if limit < 0:
+            return None
+
+        if limit not in self._limits:
+            # koledar za novo mejo zgradimo enkrat, nato ga sproti posodablja add
+            self._limits.add(limit)
+            for k, usage in enumerate(self.usage):
+                if usage > limit:
+                    self._over.reserve(limit, self.times[k], self._segment_end(k))
+
+        time = self._over.earliest_gap(limit, time, duration)
+        return None if time == math.inf else time
+
+
+class ResourceProfiles:
+    """
+    Cumulative resource usage for resources with a capacity.
+
+    Renewable resources are used only while an activity runs. Consumable resources are
+    used up when an activity starts and are never returned, so their usage is recorded
+    from the start of the activity to infinity.
+    """
+
+    def __init__(self, all_resources: Dict[str, Dict]) -> None:
+        # all_resources je slovar planerja (ime -> {"kolicina", "consumable"}), zato so upoštevani tudi kasneje dodani
+        self.all_resources = all_resources
+        self._profiles: Dict[str, ResourceProfile] = {}
+
+    def profile(self, resource: str) -> ResourceProfile:
+        """Return the usage profile of a resource."""
+        if resource not in self._profiles:
+            self._profiles[resource] = ResourceProfile()
+        return self._profiles[resource]
+
+    def _is_consumable(self, resource: str) -> bool:
+        return self.all_resources.get(resource, {}).get("consumable", False)
+
+    def _capacity(self, resource: str) -> float:
+        return self.all_resources.get(resource, {}).get("kolicina", 1)
+
+    def earliest_start(self, requirements: Dict[str, float], time: float, duration: float) -> float:
+        """
+        Return the earliest t >= time at which every required amount fits for the whole duration.
+
+        Raises:
+            ValueError: If some resource can never provide the required amount
+        """
+        while True:
+            candidate = time
+            for resource, amount in requirements.items():
+                window = math.inf if self._is_consumable(resource) else duration
+                fit = self.profile(resource).earliest_fit(candidate, window, self._capacity(resource) - amount)
+                if fit is None:
+                    raise ValueError(f"Resource {resource} does not have {amount} units available")
+                candidate = fit
+
+            if candidate == time:
+                return time
+            time = candidate
+
+    def reserve(self, requirements: Dict[str, float], start: float, end: float) -> None:
+        """Record the usage of an activity running in [start, end)."""
+        for resource, amount in requirements.items():
+            self.profile(resource).add(start, math.inf if self._is_consumable(resource) else end, amount)
@@ -0,0 +1,185 @@
+"""
+Least slack time (LST) list scheduler.
+
+The scheduler keeps the ready activities (all dependencies finished) in a heap keyed on
+slack, so every step is O(log V) plus the work of placing the activity in the resource
+profiles. It can be stepped one activity at a time, iterated, or run to completion
+without a GUI.
+"""
+
+import heapq
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+from .cpm import forward_pass
+from .resources import ResourceProfiles
+
+if TYPE_CHECKING:
+    from .lst import Aktivnost, Planer
+
+
+class ScheduledActivity:
+    """
+    One step of the LST schedule.
+
+    Attributes:
+        aktivnost: The scheduled activity
+        start_time, end_time: Time interval in which the activity runs
+        resources: Resources the activity occupies
+        delayed: True if the activity had to start after its LS, which updated ES/LS of the project
+    """
+
+    def __init__(
+        self, aktivnost: "Aktivnost", start_time: float, end_time: float, resources: List[str], delayed: bool
+    ) -> None:
+        self.aktivnost = aktivnost
+        self.start_time = start_time
+        self.end_time = end_time
+        self.resources = resources
+        self.delayed = delayed
+
+    def __repr__(self) -> str:
+        return f"ScheduledActivity({self.aktivnost.id!r}, {self.start_time}, {self.end_time})"
+
+
+class LSTScheduler:
+    """
+    Schedules the unfinished activities of a Planer by least slack time.
+
+    The planer must have ES and LS computed. Scheduled activities are marked as finished and
+    their ES is set to the time they actually start, so that no successor starts before they
+    end.
+
+    By default a delay is not propagated through the whole project. ES of an activity is
+    computed when it becomes ready and LS when it is scheduled, so a run costs O((V + E) log V)
+    plus the resource lookups, and the planer is up to date again once all activities are
+    scheduled. With eager_updates=True, for single-stepping in the GUI that shows ES/LS after
+    every step, ES/LS of all activities are kept up to date instead, and an activity that cannot
+    start before its LS moves the rest of the project with Planer.prestavi_aktivnost; that can
+    cost a pass over most of the project per delay.
+
+    Attributes:
+        planer: The planer whose activities are scheduled
+        profiles: Usage of the resources over time, kept across steps
+        current_time: End time of the latest activity scheduled so far
+        eager_updates: Whether ES/LS of all activities are updated after every delay
+    """
+
+    def __init__(
+        self, planer: "Planer", profiles: Optional[ResourceProfiles] = None, eager_updates: bool = False
+    ) -> None:
+        self.planer = planer
+        self.profiles = profiles if profiles is not None else ResourceProfiles(planer.all_resources)
+        self.current_time: float = 0
+        self.eager_updates = eager_updates
+
+        # trajanje projekta ob začetku in po dosedanjih zamikih; brez sprotnih posodobitev je
+        # LS nedokončane aktivnosti še vedno izračunan za začetno trajanje
+        self._initial_duration = planer.aktivnosti_po_id["finish"].es
+        self._duration = self._initial_duration
+
+        # vrstni red v seznamu aktivnosti razreši izenačene rezerve
+        self._position = {a.id: i for i, a in enumerate(planer.aktivnosti)}
+
+        # število nedokončanih odvisnosti za vsako nedokončano aktivnost
+        po_id = planer.aktivnosti_po_id
+        self._remaining: Dict[str, int] = {
+            a.id: sum(1 for dep in a.odvisnosti if not po_id[dep].finished) for a in planer.aktivnosti if not a.finished
+        }
+
+        self._ready: List[Tuple[float, int, str]] = []
+        for aktivnost_id, remaining in self._remaining.items():
+            if remaining == 0:
+                self._push(aktivnost_id)
+
+    def _push(self, aktivnost_id: str) -> None:
+        if aktivnost_id in ("start", "finish"):
+            return
+
+        aktivnost = self.planer.aktivnosti_po_id[aktivnost_id]
+        if not self.eager_updates:
+            forward_pass(self.planer, [aktivnost])
+
+        # LS nedokončanih aktivnosti je trajanje projekta minus konstanta, zato ključ
+        # LS - ES - trajanje projekta ohrani vrstni red tudi, ko se trajanje projekta kasneje spremeni
+        key = aktivnost.ls - aktivnost.es - self._ls_duration()
+        heapq.heappush(self._ready, (key, self._position[aktivnost_id], aktivnost_id))
+
+    def _ls_duration(self) -> float:
+        """Project duration for which the LS of unfinished activities are computed."""
+        return self.planer.aktivnosti_po_id["finish"].es if self.eager_updates else self._initial_duration
+
+    @property
+    def done(self) -> bool:
+        """True when no activity is left to schedule."""
+        return not self._ready
+
+    def ready_activities(self) -> List["Aktivnost"]:
+        """Return the activities that can be scheduled next, by increasing slack."""
+        return [self.planer.aktivnosti_po_id[a_id] for _, _, a_id in sorted(self._ready)]
+
+    def step(self) -> Optional[ScheduledActivity]:
+        """
+        Schedule the ready activity with the least slack, or return None if there is none.
+
+        Raises:
+            ValueError: If a resource can never provide the amount the activity requires
+        """
+        if not self._ready:
+            return None
+
+        _, _, aktivnost_id = self._ready[0]
+        aktivnost = self.planer.aktivnosti_po_id[aktivnost_id]
+
+        # poiščemo čas, ko je vseh zahtevanih resursov dovolj za celotno trajanje aktivnosti
+        resources = list(aktivnost.resursi.keys())
+        start_time = self.profiles.earliest_start(aktivnost.resursi, aktivnost.es, aktivnost.trajanje)
+        end_time = start_time + aktivnost.trajanje
+
+        heapq.heappop(self._ready)
+        self.profiles.reserve(aktivnost.resursi, start_time, end_time)
+
+        aktivnost.finished = True
+        del self._remaining[aktivnost_id]
+        self.current_time = max(self.current_time, end_time)
+
+        # nasledniki se lahko začnejo šele, ko se aktivnost dejansko konča, zato se ES zamaknjene
+        # aktivnosti vedno prenese naprej, tudi če se začne še pred svojim LS
+        if self.eager_updates:
+            delayed = start_time > aktivnost.ls
+            if delayed:
+                self.planer.prestavi_aktivnost(aktivnost_id, start_time)
+            elif start_time > aktivnost.es:
+                aktivnost.es = start_time
+                self.planer.posodobi_cpm([aktivnost_id], [], ohrani_koncane=True)
+        else:
+            # LS za trenutno trajanje projekta; zamik aktivnosti podaljša projekt na njen začetek
+            # plus najdaljšo pot od nje do konca, ki je enaka kot ob začetku.
+            # ES naslednikov se izračuna iz ES te aktivnosti, ko postanejo pripravljeni
+            ls = aktivnost.ls + self._duration - self._initial_duration
+            delayed = start_time > ls
+            if delayed:
+                self._duration = max(self._duration, start_time + self._initial_duration - aktivnost.ls)
+            aktivnost.es = start_time
+            aktivnost.ls = max(ls, start_time)
+
+        for naslednik in self.planer.nasledniki[aktivnost_id]:
+            self._remaining[naslednik] -= 1
+            if self._remaining[naslednik] == 0:
+                self._push(naslednik)
+
+        if not self.eager_updates and not self._ready:
+            finish = self.planer.aktivnosti_po_id["finish"]
+            finish.es = finish.ls = self._duration
+
+        return ScheduledActivity(aktivnost, start_time, end_time, resources, delayed)
+
+    def __iter__(self) -> Iterator[ScheduledActivity]:
+        while True:
+            scheduled = self.step()
+            if scheduled is None:
+                return
+            yield scheduled
+
+    def run(self) -> List[ScheduledActivity]:
+        """Schedule all remaining activities and return the steps in order."""
+        return list(self)
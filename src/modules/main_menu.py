@@ -1,18 +1,46 @@
 from common.module import Module
+from common.module_registry import ModuleSpec
 import tkinter.ttk as ttk
-from typing import TYPE_CHECKING, List, Type
-
-from modules.ab_pruning.module import AB_Pruning
-from modules.d_separation.module import D_Separation
-from modules.knn.module import KNN
-from modules.nomogram.module import Nomogram
-from modules.lst_scheduling.module import LST_Scheduling
+from typing import TYPE_CHECKING, Dict, List
 
 if TYPE_CHECKING:
     from common.app import App
 
 
-MODULES: List[Type[Module]] = [AB_Pruning, D_Separation, KNN, Nomogram, LST_Scheduling]
+# Modules are not imported up front, since they pull in matplotlib, networkx and sklearn.
+# Labels and descriptions must match the attributes of the module classes.
+MODULES: List[ModuleSpec] = [
+    ModuleSpec(
+        "Alpha-beta pruning",
+        "search",
+        "Visualize the alpha-beta pruning algorithm on a game tree.",
+        "modules.ab_pruning.module:AB_Pruning",
+    ),
+    ModuleSpec(
+        "D-Separation",
+        "reasoning",
+        "Interactive visualization of d-separation: Graph visualization where you can select two nodes. The program then displays (colors, highlights) all sets of nodes that d-separate these two nodes.",
+        "modules.d_separation.module:D_Separation",
+    ),
+    ModuleSpec(
+        "KNN",
+        "machine_learning",
+        "KNN visualization that plots data in 2D (point cloud) and for a selected test case and k parameter value shows the nearest neighbors and predicted class.",
+        "modules.knn.module:KNN",
+    ),
+    ModuleSpec(
+        "Nomogram",
+        "machine_learning",
+        "Interactive visualization of a nomogram for Naive Bayes classification. Shows how each feature contributes to the probability of playing golf based on weather conditions.",
+        "modules.nomogram.module:Nomogram",
+    ),
+    ModuleSpec(
+        "LST Scheduling",
+        "planning",
+        "Visualization of the Least Slack Time scheduling algorithm.",
+        "modules.lst_scheduling.module:LST_Scheduling",
+    ),
+]
 
 category_names = {
     "machine_learning": "Machine Learning",
@@ -21,11 +49,11 @@ category_names = {
     "reasoning": "Reasoning",
 }
 
-MODULES_BY_CATEGORY = {}
+MODULES_BY_CATEGORY: Dict[str, List[ModuleSpec]] = {}
 for module in MODULES:
-    if module.__category_key__ not in MODULES_BY_CATEGORY:
-        MODULES_BY_CATEGORY[module.__category_key__] = []
-    MODULES_BY_CATEGORY[module.__category_key__].append(module)
+    if module.category_key not in MODULES_BY_CATEGORY:
+        MODULES_BY_CATEGORY[module.category_key] = []
+    MODULES_BY_CATEGORY[module.category_key].append(module)
 
 
 class MainMenu(Module):
@@ -35,7 +63,7 @@ class MainMenu(Module):
     def __init__(self, app: "App") -> None:
         super().__init__(app)
 
-        self.categories = {m.__category_key__ for m in MODULES}
+        self.categories = {m.category_key for m in MODULES}
         for c in self.categories:
             if c not in category_names:
                 raise ValueError(f"Category {c} not found in category_names")
@@ -67,11 +95,11 @@ class MainMenu(Module):
         )  # Add internal padding (left/right, top/bottom)
 
         for i, module in enumerate(MODULES):
-            frame = category_tabs[module.__category_key__]
+            frame = category_tabs[module.category_key]
 
             btn = ttk.Button(
                 frame,
-                text=module.__label__,
+                text=module.label,
                 command=lambda m=module: self.app.show_module(m),  # type: ignore
                 width=20,
                 style="Bold.TButton",
@@ -86,7 +114,7 @@ class MainMenu(Module):
             )
 
             # Create and configure the description label
-            description = module.__short_description__
+            description = module.short_description
             desc_label = ttk.Label(frame, text=description, wraplength=600, justify="left")
             desc_label.grid(
                 row=i * 2,
@@ -0,0 +1,25 @@
+"""Nomogram of a Naive Bayes classifier trained on random golf playing data."""
+
+import argparse
+import random
+
+from matplotlib.axes import Axes  # type: ignore
+from matplotlib.figure import Figure  # type: ignore
+
+from .nomogram import calculate_df, calculate_points, draw_nomogram, generate_random
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--size", type=int, default=100, help="size of the training dataset (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the random training data")
+
+
+def render(args: argparse.Namespace, fig: Figure, ax: Axes) -> None:
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    data = generate_random(args.size)
+    dfs, _ = calculate_df(data)
+
+    fig.set_size_inches(8, 6)
+    draw_nomogram(ax, [calculate_points(df) for df in dfs])
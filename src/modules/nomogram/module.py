@@ -1,11 +1,10 @@
 from typing import TYPE_CHECKING
-import numpy as np
 import tkinter as tk
 import tkinter.ttk as ttk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
+from common.figures import create_figure, release_figure
 from common.module import Module
-from .nomogram import calculate_df, calculate_points, generate_random
+from .nomogram import calculate_df, calculate_points, draw_nomogram, generate_random, play_probability
 
 if TYPE_CHECKING:
     from common.app import App
@@ -58,7 +57,7 @@ class Nomogram(Module):
 
     def destroy(self) -> None:
         """Clean up resources when the module is destroyed."""
-        plt.close(self.fig)
+        release_figure(self.fig)
         super().destroy()
 
     def create_widgets(self) -> None:
@@ -109,7 +108,7 @@ class Nomogram(Module):
         result_label.grid(row=0, column=1, padx=5)
 
         # Initialize matplotlib figure
-        self.fig, self.ax = plt.subplots(figsize=(8, 6))
+        self.fig, self.ax = create_figure(figsize=(8, 6))
         self.canvas = FigureCanvasTkAgg(self.fig, master=plot_frame)
         self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
 
@@ -177,32 +176,8 @@ class Nomogram(Module):
 
     def plot_nomogram(self) -> None:
         """Plot the nomogram visualization."""
-        self.ax.clear()
-        classes = ["Outlook", "Temperature", "Humidity", "Windy"]
-
-        for i, current in enumerate(self.points):
-            categories, values = zip(*current)
-            # Sort values and categories
-            sorted_indices = sorted(range(len(values)), key=lambda k: values[k])
-            sorted_values = [values[ix] for ix in sorted_indices]
-            sorted_categories = [categories[ix] for ix in sorted_indices]
-
-            self.ax.plot(sorted_values, [i] * len(current), marker="o", label=classes[i])
-
-            for value, category in zip(sorted_values, sorted_categories):
-                if i == 0:
-                    self.ax.text(value, i + 0.1, category, ha="center", va="bottom", fontsize=8)
-                else:
-                    self.ax.text(value, i - 0.1, category, ha="center", va="top", fontsize=8)
-
-        self.ax.set_yticks(range(len(self.points)))
-        self.ax.set_yticklabels(classes)
-        self.ax.set_xlabel("Points")
-        self.ax.legend()
-        self.ax.axvline(x=0, linestyle="--", color="gray")
-        self.ax.set_title("Nomogram")
-
-        self.canvas.draw()
+        draw_nomogram(self.ax, self.points)
+        self.request_redraw(self.canvas.draw)
 
     def calculate_probability(self) -> None:
         """Calculate probability of playing golf based on current conditions."""
@@ -211,14 +186,6 @@ class Nomogram(Module):
 
         values = [self.outlook_var.get(), self.temp_var.get(), self.humidity_var.get(), self.windy_var.get()]
 
-        sum_val = 0
-        for value, point_set in zip(values, self.points):
-            for category, points in point_set:
-                if category == value:
-                    sum_val += points
-                    break
-
-        odds = np.exp(sum_val)
-        probability = odds / (1 + odds)
+        probability = play_probability(self.points, values)
 
         self.result_var.set(f"Probability of playing golf: {probability:.2%}")
@@ -143,3 +143,57 @@ def generate_random(num_rows=20):
         rows.append(row_data)
 
     return pd.DataFrame(rows, columns=header)
+
+
+def play_probability(points, values):
+    """Calculate the probability of playing golf for the given feature values.
+
+    Args:
+        points (list): Points of every feature, as returned by calculate_points
+        values (list): Selected value of every feature, in the same order
+
+    Returns:
+        float: Probability of playing golf
+    """
+    sum_val = 0
+    for value, point_set in zip(values, points):
+        for category, feature_points in point_set:
+            if category == value:
+                sum_val += feature_points
+                break
+
+    odds = math.exp(sum_val)
+    return odds / (1 + odds)
+
+
+def draw_nomogram(ax, points):
+    """Draw the nomogram of the feature points on a matplotlib axes.
+
+    Args:
+        ax (matplotlib.axes.Axes): Axes to draw on; it is cleared first
+        points (list): Points of every feature, as returned by calculate_points
+    """
+    ax.clear()
+    classes = ["Outlook", "Temperature", "Humidity", "Windy"]
+
+    for i, current in enumerate(points):
+        categories, values = zip(*current)
+        # Sort values and categories
+        sorted_indices = sorted(range(len(values)), key=lambda k: values[k])
+        sorted_values = [values[ix] for ix in sorted_indices]
+        sorted_categories = [categories[ix] for ix in sorted_indices]
+
+        ax.plot(sorted_values, [i] * len(current), marker="o", label=classes[i])
+
+        for value, category in zip(sorted_values, sorted_categories):
+            if i == 0:
+                ax.text(value, i + 0.1, category, ha="center", va="bottom", fontsize=8)
+            else:
+                ax.text(value, i - 0.1, category, ha="center", va="top", fontsize=8)
+
+    ax.set_yticks(range(len(points)))
+    ax.set_yticklabels(classes)
+    ax.set_xlabel("Points")
+    ax.legend()
+    ax.axvline(x=0, linestyle="--", color="gray")
+    ax.set_title("Nomogram")
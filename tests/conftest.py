@@ -0,0 +1,5 @@
+import os
+import sys
+
+# moduli se uvažajo kot v aplikaciji, ki se zažene iz src
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
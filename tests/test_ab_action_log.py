@@ -0,0 +1,108 @@
+import io
+
+import numpy as np
+import pytest
+
+from modules.ab_pruning.ab_pruning import AlphaBetaSimulator, TreeNode
+from modules.ab_pruning.action_log import END, INIT, MOVE_DOWN, MOVE_UP, ActionLog
+
+
+class FakeApp:
+    """Stands in for the module; the simulator only redraws through it."""
+
+    node_radius = 10
+
+    def __init__(self):
+        self.draws = 0
+
+    def draw_tree(self, *args, **kwargs):
+        self.draws += 1
+
+
+def simulator(structure=((2,), (2, 2), (2, 2, 2, 2)), leaves=(3.0, 5.0, 6.0, 9.0, 1.0, 2.0, 0.0, -1.0)):
+    root = TreeNode.generate_tree([list(layer) for layer in structure], list(leaves))
+    return AlphaBetaSimulator(FakeApp(), root)
+
+
+def tree_state(sim):
+    nodes = [(node.value, node.alpha, node.beta) for node in sim.nodes]
+    return (
+        nodes,
+        sim.nodes.index(sim.curr_node) if sim.curr_node is not None else None,
+        [sim.nodes.index(node) for node in sim.curr_path],
+        sim.over,
+        [(sim.nodes.index(node), i) for node, i in sim.cutoffs],
+        {sim.nodes.index(node): i for node, i in sim.next_child.items() if i},
+    )
+
+
+def test_save_load_round_trip():
+    log = ActionLog(capacity=1)
+    log.append(INIT)
+    log.append(MOVE_DOWN, 0, alpha=None, beta=float("inf"))
+    log.append(MOVE_UP, 3, 2.5, float("-inf"), None, cutoff=True)
+    log.append(END, cutoff=False)
+
+    file = io.BytesIO()
+    log.save(file)
+    file.seek(0)
+    loaded = ActionLog.load(file)
+
+    assert len(loaded) == 4
+    assert loaded.records.tobytes() == log.records.tobytes()
+    assert loaded.last_op == END
+    assert np.isnan(loaded.records[1]["alpha"])
+
+
+def test_load_rejects_foreign_arrays():
+    file = io.BytesIO()
+    np.save(file, np.zeros(3))
+    file.seek(0)
+    with pytest.raises(ValueError):
+        ActionLog.load(file)
+
+
+def test_backward_restores_every_state():
+    sim = simulator()
+    states = [tree_state(sim)]
+    while not sim.over:
+        sim.forward(draw=False)
+        states.append(tree_state(sim))
+    assert sim.cutoffs, "the tree should prune something"
+
+    for state in reversed(states[:-1]):
+        sim.backward(draw=False)
+        assert tree_state(sim) == state
+    assert len(sim.actions) == 0
+
+
+def test_replay_and_save_trace(tmp_path):
+    sim = simulator()
+    sim.forward_steps(7, draw=False)
+    partial = tree_state(sim)
+    sim.all_forward()
+    final = tree_state(sim)
+
+    path = tmp_path / "trace.npy"
+    sim.save_trace(path)
+
+    other = simulator()
+    other.replay(path)
+    assert tree_state(other) == final
+
+    # replay from a log object rewinds first
+    log = ActionLog()
+    for record in sim.actions.records[:7]:
+        log.append(record["op"], record["node"], record["value"], record["alpha"], record["beta"], record["cutoff"])
+    other.replay(log)
+    assert tree_state(other) == partial
+
+
+def test_replay_rejects_a_trace_of_another_tree(tmp_path):
+    sim = simulator()
+    sim.all_forward()
+    path = tmp_path / "trace.npy"
+    sim.save_trace(path)
+
+    with pytest.raises(ValueError):
+        simulator(((3,), (1, 1, 1)), (1.0, 2.0, 3.0)).replay(path)
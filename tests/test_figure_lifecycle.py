@@ -0,0 +1,100 @@
+import gc
+import tkinter as tk
+import tracemalloc
+
+import pytest
+from matplotlib.backend_bases import FigureCanvasBase
+from matplotlib.figure import Figure
+
+from common.figures import POOL_SIZE, create_figure, release_figure
+
+WARMUP = 20
+# nekaj MiB rasti pride od notranjih tabel interpreterja, puščajoča figura s platnom pa stane
+# nekaj sto KiB na preklop
+MEMORY_LIMIT = 4 * 1024 * 1024
+
+
+def clear_caches():
+    """Empty matplotlib's bounded text metrics cache and collect garbage."""
+    import matplotlib.text
+
+    cache = getattr(matplotlib.text, "_get_text_metrics_with_cache_impl", None)
+    if cache is not None:
+        cache.cache_clear()
+    gc.collect()
+
+
+def memory_growth(switch, switches):
+    """Run the switches and return the growth of traced memory after the warm-up in bytes."""
+    for i in range(WARMUP):
+        switch(i)
+    clear_caches()
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for i in range(WARMUP, WARMUP + switches):
+            switch(i)
+        clear_caches()
+        return tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def count_alive(cls):
+    gc.collect()
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, cls))
+
+
+def open_pyplot_figures():
+    import matplotlib.pyplot as plt
+
+    return len(plt.get_fignums())
+
+
+def test_released_figures_are_reused():
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    def switch(i):
+        fig, ax = create_figure(figsize=(8, 6) if i % 2 else None)
+        canvas = FigureCanvasAgg(fig)
+        ax.plot(range(100), [x * (i % 7) for x in range(100)])
+        ax.set_title(f"Switch {i}")
+        fig.tight_layout()
+        canvas.draw()
+        release_figure(fig)
+
+    assert memory_growth(switch, 100) < MEMORY_LIMIT
+    assert open_pyplot_figures() == 0
+    assert count_alive(Figure) <= POOL_SIZE
+    assert count_alive(FigureCanvasBase) <= POOL_SIZE
+
+
+@pytest.fixture
+def app():
+    from common.app import App
+
+    try:
+        app = App(prefetch_modules=False, module_cache_size=2)
+    except tk.TclError:
+        pytest.skip("needs a display")
+    app.withdraw()
+    yield app
+    app.destroy()
+
+
+def test_module_switches_do_not_leak(app):
+    from modules.main_menu import MODULES
+
+    # vsak tretji preklop znova izbere prikazan modul, ki se ob tem uniči; ostali moduli se
+    # skrijejo in se uničijo, ko izpadejo iz predpomnilnika
+    def switch(i):
+        app.show_module(MODULES[(i - i // 3) % len(MODULES)])
+        app.update()
+
+    growth = memory_growth(switch, 10 * len(MODULES))
+
+    assert open_pyplot_figures() == 0
+    # moduli v predpomnilniku aplikacije še držijo svoje figure (LST največ dve)
+    assert count_alive(Figure) <= POOL_SIZE + 2 * 2
+    assert growth < MEMORY_LIMIT
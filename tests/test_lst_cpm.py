@@ -0,0 +1,125 @@
+import random
+
+import pytest
+
+from modules.lst_scheduling.cpm import CycleError, backward_pass, forward_pass, topological_order
+from modules.lst_scheduling.lst import Aktivnost, Planer
+from modules.lst_scheduling.scheduler import LSTScheduler
+
+
+def chain_planer(n: int = 3) -> Planer:
+    """A project of n activities a0 -> a1 -> ... with durations 1, 2, ..."""
+    planer = Planer()
+    for i in range(n):
+        planer.dodaj_aktivnost(Aktivnost(f"a{i}", i + 1, [f"a{i - 1}"] if i else []))
+    return planer
+
+
+def test_dependency_on_finish_is_rejected_as_cycle():
+    planer = chain_planer()
+    es = {a.id: a.es for a in planer.aktivnosti}
+
+    with pytest.raises(CycleError) as e:
+        planer.dodaj_aktivnost(Aktivnost("b", 2, ["a1", "finish"]))
+
+    assert e.value.aktivnosti_v_ciklu == ["b", "finish"]
+    assert "b" not in planer.aktivnosti_po_id
+    assert planer.nasledniki["finish"] == []
+    assert {a.id: a.es for a in planer.aktivnosti} == es
+
+
+def random_specs(rng: random.Random, n: int = 15):
+    """Activities in an order in which they can be added, each depending on up to three earlier ones."""
+    return [
+        (f"a{i}", rng.randint(0, 5), sorted({f"a{rng.randrange(i)}" for _ in range(rng.randint(0, 3))}) if i else [])
+        for i in range(n)
+    ]
+
+
+def es_ls(planer: Planer):
+    return {a.id: (a.es, a.ls) for a in planer.aktivnosti}
+
+
+def test_incremental_updates_match_full_computation():
+    rng = random.Random(0)
+    for _ in range(200):
+        specs = random_specs(rng)
+        incremental = Planer()
+        for id, trajanje, odvisnosti in specs:
+            incremental.dodaj_aktivnost(Aktivnost(id, trajanje, list(odvisnosti)))
+
+        bulk = Planer()
+        bulk.dodaj_aktivnosti([Aktivnost(id, trajanje, list(odvisnosti)) for id, trajanje, odvisnosti in specs])
+
+        assert es_ls(incremental) == es_ls(bulk)
+
+
+def test_deferred_updates_match_incremental_build():
+    rng = random.Random(2)
+    for _ in range(100):
+        specs = random_specs(rng)
+        incremental, deferred = Planer(), Planer()
+        for id, trajanje, odvisnosti in specs:
+            incremental.dodaj_aktivnost(Aktivnost(id, trajanje, list(odvisnosti)))
+            deferred.dodaj_aktivnost(Aktivnost(id, trajanje, list(odvisnosti)), izracunaj=False)
+        deferred.posodobi_odvisnosti_finish()
+        deferred.izracunaj_es()
+        deferred.izracunaj_ls()
+
+        assert es_ls(deferred) == es_ls(incremental)
+        assert sorted(deferred.aktivnosti_po_id["finish"].odvisnosti) == sorted(
+            incremental.aktivnosti_po_id["finish"].odvisnosti
+        )
+
+
+def test_prestavi_aktivnost_updates_only_unfinished_activities():
+    planer = chain_planer(4)
+    planer.dodaj_aktivnost(Aktivnost("b", 1, ["a0"]))
+    for a_id in ("a0", "a1"):
+        planer.aktivnosti_po_id[a_id].finished = True
+
+    planer.prestavi_aktivnost("a1", 5)
+
+    # a2 se začne po koncu a1 (5 + 2), projekt se podaljša za 4, LS končane a0 ostane
+    assert es_ls(planer) == {
+        "start": (0, 0),
+        "a0": (0, 0),
+        "a1": (5, 5),
+        "a2": (7, 7),
+        "a3": (10, 10),
+        "b": (1, 13),
+        "finish": (14, 14),
+    }
+
+
+def test_propagation_reports_cycles():
+    planer = chain_planer()
+    planer.nastavi_odvisnosti(planer.aktivnosti_po_id["a0"], ["a2"])
+
+    with pytest.raises(CycleError) as e:
+        planer.posodobi_cpm(["a0"], [])
+    assert sorted(e.value.aktivnosti_v_ciklu) == ["a0", "a1", "a2"]
+
+    with pytest.raises(CycleError):
+        planer.posodobi_cpm([], ["a2"])
+
+
+def test_delays_during_scheduling_match_full_computation():
+    rng = random.Random(1)
+    for _ in range(200):
+        planer = Planer()
+        planer.dodaj_resource("Zerjav", 1)
+        planer.dodaj_aktivnosti(
+            [
+                Aktivnost(id, trajanje, list(odvisnosti), {"Zerjav": 1} if rng.random() < 0.5 else {})
+                for id, trajanje, odvisnosti in random_specs(rng)
+            ]
+        )
+
+        # po vsakem koraku so ES in LS nedokončanih aktivnosti enaki kot po izračunu celotnega projekta
+        for _ in LSTScheduler(planer, eager_updates=True):
+            pricakovani = es_ls(planer)
+            order = topological_order(planer)
+            forward_pass(planer, order, skip_finished=True)
+            backward_pass(planer, order, skip_finished=True)
+            assert es_ls(planer) == pricakovani
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from modules.lst_scheduling.lst import Aktivnost, Planer
+from modules.lst_scheduling.project_io import ProjectFormatError, load_project, save_project
+
+
+def sample_planer() -> Planer:
+    planer = Planer()
+    planer.dodaj_resource("Cup", 2)
+    planer.dodaj_resource("Tea bag", 3, consumable=True)
+    planer.dodaj_aktivnosti(
+        [
+            Aktivnost("Water", 2, [], {}),
+            Aktivnost("Tea", 3, ["Water"], {"Cup": 1, "Tea bag": 1}),
+            Aktivnost("Milk", 1, ["Water"], {"Cup": 1}),
+        ]
+    )
+    return planer
+
+
+def project(planer: Planer):
+    return (
+        planer.all_resources,
+        [(a.id, a.trajanje, list(a.odvisnosti), a.resursi) for a in planer.aktivnosti],
+    )
+
+
+def test_project_round_trip(tmp_path):
+    planer = sample_planer()
+    for name in ("project.json", "project.csv"):
+        save_project(planer, tmp_path / name)
+        assert project(load_project(tmp_path / name)) == project(planer), name
+
+
+def test_csv_without_resource_section_uses_largest_requirement(tmp_path):
+    path = tmp_path / "project.csv"
+    path.write_text("id,duration,dependencies,resources\nWater,2,,Cup:1\nTea,3,Water,Cup:2\n", encoding="utf-8")
+
+    resources = load_project(path).all_resources
+    assert resources["Cup"] == {"kolicina": 2, "consumable": False}
+
+
+@pytest.mark.parametrize("resources", [None, {"name": "Cup"}, "Cup"])
+def test_json_resources_must_be_a_list(tmp_path, resources):
+    path = tmp_path / "project.json"
+    path.write_text(json.dumps({"resources": resources, "activities": []}), encoding="utf-8")
+
+    with pytest.raises(ProjectFormatError):
+        load_project(path)
+
+
+def test_duplicate_resource_names_are_rejected(tmp_path):
+    path = tmp_path / "project.csv"
+    path.write_text(
+        "resource,quantity,consumable\nCup,2,false\nCup,1,true\n\nid,duration,dependencies,resources\nTea,3,,Cup:1\n",
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ProjectFormatError) as e:
+        load_project(path)
+    assert e.value.errors == ["Resource 2: duplicate name Cup"]
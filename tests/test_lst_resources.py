@@ -0,0 +1,109 @@
+import math
+import random
+import time
+
+import pytest
+
+from modules.lst_scheduling.lst import Aktivnost, Planer
+from modules.lst_scheduling.resources import ResourceCalendar, ResourceProfile, ResourceProfiles
+from modules.lst_scheduling.scheduler import LSTScheduler
+
+
+def linear_fit(profile: ResourceProfile, start: float, duration: float, limit: float):
+    """Reference earliest_fit that walks every segment of the profile."""
+    if limit < 0:
+        return None
+    k = 0
+    while k < len(profile.times):
+        segment_end = profile.times[k + 1] if k + 1 < len(profile.times) else math.inf
+        if segment_end > start:
+            if profile.usage[k] > limit:
+                start = max(start, segment_end)
+            elif start + duration <= segment_end:
+                return start
+        k += 1
+    return None
+
+
+def test_calendar_merges_reservations():
+    calendar = ResourceCalendar(["R"])
+    for start, end in ((5, 7), (0, 2), (2, 3), (6, 9), (20, math.inf)):
+        calendar.reserve("R", start, end)
+
+    assert calendar.busy_intervals("R") == [(0, 3), (5, 9), (20, math.inf)]
+    assert calendar.earliest_gap("R", 0, 2) == 3
+    assert calendar.earliest_gap("R", 1, 3) == 9
+    assert calendar.earliest_gap("R", 10, 11) == math.inf
+
+
+def test_earliest_fit_matches_segment_walk():
+    rng = random.Random(0)
+    for _ in range(200):
+        profile = ResourceProfile()
+        for _ in range(30):
+            start = rng.randint(0, 50)
+            duration, limit = rng.randint(0, 8), rng.randint(-1, 3)
+            assert profile.earliest_fit(start, duration, limit) == linear_fit(profile, start, duration, limit)
+            end = math.inf if rng.random() < 0.05 else start + rng.randint(1, 10)
+            profile.add(start, end, rng.randint(1, 3))
+
+
+def test_multi_unit_capacity():
+    profiles = ResourceProfiles({"Delavec": {"kolicina": 3, "consumable": False}})
+    profiles.reserve({"Delavec": 2}, 0, 5)
+
+    # en delavec je še prost, za dva je treba počakati na konec prve aktivnosti
+    assert profiles.earliest_start({"Delavec": 1}, 0, 4) == 0
+    assert profiles.earliest_start({"Delavec": 2}, 0, 4) == 5
+    profiles.reserve({"Delavec": 1}, 0, 4)
+    assert profiles.earliest_start({"Delavec": 1}, 0, 2) == 4
+    assert profiles.earliest_start({"Delavec": 3}, 1, 2) == 5
+
+
+def test_consumable_resources_are_used_up():
+    profiles = ResourceProfiles({"Cement": {"kolicina": 5, "consumable": True}, "Stroj": {"kolicina": 1}})
+    profiles.reserve({"Cement": 2}, 0, 1)
+    profiles.reserve({"Cement": 2}, 3, 4)
+
+    # poraba se po koncu aktivnosti ne vrne, zato je od časa 3 naprej na voljo le še ena enota
+    assert profiles.earliest_start({"Cement": 1}, 10, 1) == 10
+    with pytest.raises(ValueError, match="Cement"):
+        profiles.earliest_start({"Cement": 2}, 10, 1)
+
+    # dokler ni porabljen, ga lahko aktivnost porabi prej, če ostane dovolj za kasnejše
+    profiles = ResourceProfiles({"Cement": {"kolicina": 5, "consumable": True}})
+    profiles.reserve({"Cement": 3}, 5, 6)
+    assert profiles.earliest_start({"Cement": 2}, 0, 1) == 0
+    with pytest.raises(ValueError):
+        profiles.earliest_start({"Cement": 3}, 0, 1)
+
+
+def test_requirement_above_capacity_never_fits():
+    profiles = ResourceProfiles({"Zerjav": {"kolicina": 1, "consumable": False}})
+    with pytest.raises(ValueError, match="Zerjav does not have 2 units"):
+        profiles.earliest_start({"Zerjav": 2}, 0, 1)
+
+    # modul napako pokaže, ko jo sproži korak razvrščanja
+    planer = Planer()
+    planer.dodaj_resource("Zerjav", 1)
+    planer.dodaj_aktivnost(Aktivnost("a", 2, [], {"Zerjav": 2}))
+    with pytest.raises(ValueError):
+        LSTScheduler(planer, eager_updates=True).step()
+
+
+def schedule_on_one_resource(n: int, capacity: int, amount: int) -> float:
+    """Time scheduling n activities that all want to start at 0 on one resource."""
+    profiles = ResourceProfiles({"R": {"kolicina": capacity, "consumable": False}})
+    begin = time.perf_counter()
+    for _ in range(n):
+        start = profiles.earliest_start({"R": amount}, 0, 3)
+        profiles.reserve({"R": amount}, start, start + 3)
+    return time.perf_counter() - begin
+
+
+def test_shared_resource_scales_subquadratically():
+    # 8-krat več aktivnosti bi pri kvadratni zahtevnosti trajalo 64-krat dlje
+    for capacity, amount in ((1, 1), (4, 3)):
+        small = min(schedule_on_one_resource(1000, capacity, amount) for _ in range(3))
+        large = schedule_on_one_resource(8000, capacity, amount)
+        assert large < 25 * small, (capacity, amount, small, large)
@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from modules.lst_scheduling.lst import Aktivnost, Planer
+from modules.lst_scheduling.scheduler import LSTScheduler
+
+
+def random_project(rng: random.Random, n: int = 12) -> Planer:
+    """A random project in which half of the activities compete for one single-unit resource."""
+    planer = Planer()
+    planer.dodaj_resource("Zerjav", 1)
+    for i in range(n):
+        odvisnosti = sorted({f"a{rng.randrange(i)}" for _ in range(rng.randint(0, 2))}) if i else []
+        resursi = {"Zerjav": 1} if rng.random() < 0.5 else {}
+        planer.dodaj_aktivnost(Aktivnost(f"a{i}", rng.randint(1, 10), odvisnosti, resursi))
+    return planer
+
+
+@pytest.mark.parametrize("eager_updates", [True, False])
+def test_schedule_respects_precedence_under_resource_contention(eager_updates):
+    rng = random.Random(0)
+    for _ in range(300):
+        planer = random_project(rng)
+        schedule = LSTScheduler(planer, eager_updates=eager_updates).run()
+
+        start = {s.aktivnost.id: s.start_time for s in schedule}
+        end = {s.aktivnost.id: s.end_time for s in schedule}
+        assert len(schedule) == len(planer.aktivnosti) - 2
+        for aktivnost_id in start:
+            for dep in planer.aktivnosti_po_id[aktivnost_id].odvisnosti:
+                assert start[aktivnost_id] >= end.get(dep, 0), (aktivnost_id, dep)
+
+        # aktivnosti z istim resursom se ne prekrivajo
+        zerjav = sorted((s.start_time, s.end_time) for s in schedule if "Zerjav" in s.aktivnost.resursi)
+        assert all(prev_end <= start for (_, prev_end), (start, _) in zip(zerjav, zerjav[1:]))
+
+        # ES končanih aktivnosti je dejanski začetek, finish pa je konec urnika
+        assert all(planer.aktivnosti_po_id[a_id].es == t for a_id, t in start.items())
+        assert planer.aktivnosti_po_id["finish"].es == max(end.values())
+
+
+def test_eager_and_lazy_updates_give_the_same_schedule():
+    rng = random.Random(1)
+    for _ in range(300):
+        seed = rng.random()
+        eager_planer, lazy_planer = random_project(random.Random(seed)), random_project(random.Random(seed))
+        eager = LSTScheduler(eager_planer, eager_updates=True).run()
+        lazy = LSTScheduler(lazy_planer).run()
+
+        assert [(s.aktivnost.id, s.start_time, s.delayed) for s in eager] == [
+            (s.aktivnost.id, s.start_time, s.delayed) for s in lazy
+        ]
+        assert {a.id: (a.es, a.ls) for a in eager_planer.aktivnosti} == {
+            a.id: (a.es, a.ls) for a in lazy_planer.aktivnosti
+        }
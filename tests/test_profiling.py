@@ -0,0 +1,17 @@
+import pytest
+
+from common import profiling
+
+
+@pytest.mark.parametrize("value", [None, "", " ", "0", "false", "False"])
+def test_env_values_that_keep_profiling_off(value):
+    assert profiling.trace_path_from_env(value) is None
+
+
+@pytest.mark.parametrize("value", ["1", "true", "TRUE"])
+def test_env_values_that_only_turn_profiling_on(value):
+    assert profiling.trace_path_from_env(value) == profiling.DEFAULT_TRACE_PATH
+
+
+def test_other_env_values_are_the_trace_path():
+    assert profiling.trace_path_from_env("traces/startup.json") == "traces/startup.json"